@@ -1,2 +1,8 @@
 from .corrAnalyzer import CorrelationAnalyzer
-from .dwellTimeAnalyzer import dwellTimeAnalyzer
\ No newline at end of file
+from .dwellTimeAnalyzer import dwellTimeAnalyzer
+from .dwellTime import add_duration_columns, company_stats, stay_duration
+from .dwellStore import DwellStatsStore, shared_store
+from .sketch import HistogramSketch
+from .boxSummary import box_stats, summary_box, summary_box_figure, sketch_box, sketch_box_figure
+from .figureCache import FigureCache, figure_cache, frame_hash
+from .figureJSON import FigureJSON, plotly_chart
\ No newline at end of file
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from .sketch import HistogramSketch
+
+# Above this many values a group is summarized through a HistogramSketch (이 개수 이상은 스케치로 요약)
+SKETCH_THRESHOLD = 50_000
+
+
+def box_stats(values, sketch_width: float = 1.0, sketch_threshold: int = SKETCH_THRESHOLD) -> dict:
+    """
+    Parameters:
+    values : array-like or HistogramSketch - raw values, or an already merged sketch (원본 값 또는 스케치)
+    sketch_width : float - bin width used when a sketch is built from large inputs (스케치 구간 폭)
+    sketch_threshold : int - inputs with more values than this go through a sketch (스케치 사용 기준)
+
+    Returns:
+    dict - q1/median/q3, lowerfence/upperfence (Tukey 1.5 IQR, snapped to data like plotly),
+           mean, sd and the distinct outlier values (박스플롯 통계)
+    """
+    if not isinstance(values, HistogramSketch):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size > sketch_threshold:
+            values = HistogramSketch(sketch_width).update(values)
+
+    if isinstance(values, HistogramSketch):
+        sketch = values
+        q1, median, q3 = (sketch.quantile(q) for q in (0.25, 0.5, 0.75))
+        mean, sd = sketch.mean(), sketch.std()
+        distinct = np.array(sorted(sketch.bins), dtype=float) * sketch.width
+    else:
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        mean = values.mean()
+        sd = values.std(ddof=1) if values.size > 1 else np.nan
+        distinct = np.unique(values)
+
+    iqr = q3 - q1
+    inside = distinct[(distinct >= q1 - 1.5 * iqr) & (distinct <= q3 + 1.5 * iqr)]
+    return {
+        "q1": float(q1), "median": float(median), "q3": float(q3),
+        "lowerfence": float(inside.min()) if inside.size else float(q1),
+        "upperfence": float(inside.max()) if inside.size else float(q3),
+        "mean": float(mean), "sd": float(sd),
+        # one marker per distinct outlier value keeps the payload bounded (중복 없는 이상치 값)
+        "outliers": distinct[(distinct < q1 - 1.5 * iqr) | (distinct > q3 + 1.5 * iqr)].tolist(),
+    }
+
+
+def summary_box(frame: pd.DataFrame, y: str, x: str = None, name: str = "",
+                sketch_width: float = 1.0, sketch_threshold: int = SKETCH_THRESHOLD) -> go.Box:
+    """
+    Parameters:
+    frame : pd.DataFrame - source data (원본 데이터)
+    y : str - value column (값 컬럼)
+    x : str - optional grouping column, one box per group in order of appearance (그룹 컬럼)
+
+    Returns:
+    go.Box - box trace built from precomputed quartile fields; only the statistics and the outliers
+             are serialized, so the figure size does not grow with the number of rows
+             (사전 계산된 사분위 값으로 만든 박스 트레이스)
+    """
+    if x is None:
+        groups = [(" ", frame[y])]
+    else:
+        groups = list(frame[y].groupby(frame[x].astype(str), sort=False))
+    return _box_trace([key for key, _ in groups],
+                      [box_stats(values, sketch_width, sketch_threshold) for _, values in groups], name)
+
+
+def sketch_box(sketches: dict, name: str = "") -> go.Box:
+    """
+    Parameters:
+    sketches : dict - box label -> HistogramSketch, e.g. merged buckets of analyzer.dwellStore (라벨별 스케치)
+
+    Returns:
+    go.Box - same trace as summary_box, built without the raw rows (원본 행 없이 만든 박스 트레이스)
+    """
+    return _box_trace([str(key) for key in sketches], [box_stats(sketch) for sketch in sketches.values()], name)
+
+
+def _box_trace(labels: list, stats: list, name: str) -> go.Box:
+    def field(key):
+        return [s[key] for s in stats]
+
+    return go.Box(
+        x=labels,
+        q1=field("q1"), median=field("median"), q3=field("q3"),
+        lowerfence=field("lowerfence"), upperfence=field("upperfence"),
+        mean=field("mean"), sd=field("sd"),
+        # with precomputed quartiles the sample points per box are only the outliers
+        y=field("outliers"),
+        boxpoints="outliers",
+        name=name,
+        showlegend=False,
+    )
+
+
+def summary_box_figure(frame: pd.DataFrame, y: str, x: str = None, title: str = None, **kwargs) -> go.Figure:
+    """px.box-like figure from summary_box; layout and traces can be updated as usual (요약 박스플롯 그림)"""
+    return _box_figure(summary_box(frame, y, x, **kwargs), y, x, title)
+
+
+def sketch_box_figure(sketches: dict, y: str, x: str = None, title: str = None) -> go.Figure:
+    """summary_box_figure from precomputed sketches (스케치로 만든 요약 박스플롯 그림)"""
+    return _box_figure(sketch_box(sketches), y, x, title)
+
+
+def _box_figure(trace: go.Box, y: str, x: str, title: str) -> go.Figure:
+    fig = go.Figure(trace)
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title=dict(text=x)),
+        yaxis=dict(title=dict(text=y)),
+    )
+    return fig
@@ -1,7 +1,6 @@
-import os
-import pickle
 import plotly.graph_objects as go
 from scipy.stats import pearsonr
+from .figureCache import figure_cache
 
 # 상관분석 및 plotly시각화 객체 생성 및 저장 클래스 생성
 class CorrelationAnalyzer:
@@ -14,22 +13,23 @@ class CorrelationAnalyzer:
         self.x_color: str = x_color # 첫 번째 시계열 그래프 라인 색상
         self.y_color: str = y_color # 첫 번째 시계열 그래프 라인 색상
         self.scatter_color: str = scatter_color # 상관분석용 산점도 색상
-        self.line_file = f'graph/{self.x_col}_{self.y_col}_Line.pkl'
 
         # 상관계수, p-value 계산 및 클래스 매개변수에 저장
         self.corr, self.p = pearsonr(self.df[self.x_col], self.df[self.y_col])
 
     # 상관분석 및 plotly 산점도 객체 생성 및 저장
     def analyze_and_plot(self, language:str=['en','kr']):
-        # 파일 이름 설정
-        # plotly객체에서 상호작용까지 온전히 저장하기 위해 pickle파일로 저장
-        self.scatter_file = f'graph/{self.x_col}_{self.y_col}_Scatter_{language}.pkl'
-        # 피클 파일이 존재하면 불러오기
-        if os.path.exists(self.scatter_file):
-            with open(self.scatter_file, 'rb') as f:
-                return pickle.load(f), self.corr, self.p
+        # 데이터 해시 + 옵션(컬럼, 색상, 언어)이 같으면 캐시된 그래프 사용
+        fig = figure_cache.get_or_create(
+            'CorrelationAnalyzer.scatter', self.df, lambda: self._scatter(language),
+            columns=[self.x_col, self.y_col],
+            x_col=self.x_col, y_col=self.y_col, scatter_color=self.scatter_color, language=language
+        )
+        # plotly 객체, 상관계수, p-value return
+        return fig, self.corr, self.p
 
-        # 피클 파일이 없다면 산점도 새로 생성하기
+    def _scatter(self, language):
+        # 산점도 새로 생성하기
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=self.df[self.x_col],
@@ -56,13 +56,7 @@ class CorrelationAnalyzer:
             width=700,
             height=700
         )
-
-        # 피클로 저장
-        with open(self.scatter_file, 'wb') as f:
-            pickle.dump(fig, f)
-
-        # plotly 객체, 상관계수, p-value return
-        return fig, self.corr, self.p
+        return fig
 
     # plotly 시계열 라인 그래프 생성 및 저장
     # 그래프 제목 타입 지정
@@ -70,12 +64,16 @@ class CorrelationAnalyzer:
         if not self.time_col:
             raise ValueError("time_col must be set to use time series plot.")
 
-        # 피클 파일이 존재하면 불러오기
-        if os.path.exists(self.line_file):
-            with open(self.line_file, 'rb') as f:
-                return pickle.load(f)
+        # 데이터 해시 + 옵션(컬럼, 색상, 제목)이 같으면 캐시된 그래프 사용
+        return figure_cache.get_or_create(
+            'CorrelationAnalyzer.time_series', self.df, lambda: self._time_series(title),
+            columns=[self.time_col, self.x_col, self.y_col],
+            time_col=self.time_col, x_col=self.x_col, y_col=self.y_col,
+            x_color=self.x_color, y_color=self.y_color, title=title
+        )
 
-        # 피클 파일이 없다면 시계열 라인 그래프 새로 생성하기
+    def _time_series(self, title):
+        # 시계열 라인 그래프 새로 생성하기
         fig = go.Figure()
         # 첫 번째 라인 생성
         fig.add_trace(go.Scatter(
@@ -106,9 +104,5 @@ class CorrelationAnalyzer:
             template='plotly_white'
         )
 
-        # 피클로 저장
-        with open(self.line_file, 'wb') as f:
-            pickle.dump(fig, f)
-
         # plotly 객체 return
         return fig
\ No newline at end of file
@@ -0,0 +1,230 @@
+import os
+import json
+import math
+import threading
+import pandas as pd
+from .dwellTime import ENTER_COL, COMPANY_COL, STAY_COL
+from .sketch import HistogramSketch
+
+# Default location of the persisted aggregates (집계 저장 위치)
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          ".cache", "dwell_stats.json")
+STORE_VERSION = 2
+SKETCH_WIDTH = 1 / 60   # stays are whole minutes, so one-minute bins keep the quantiles exact (1분 단위 구간)
+
+
+def _row_fingerprint(frame: pd.DataFrame, position: int) -> str:
+    # hash of a single row, used to check that an ingested prefix was not rewritten (행 지문)
+    row = frame.iloc[[position]].astype(str)
+    return str(int(pd.util.hash_pandas_object(row, index=False).iloc[0]))
+
+
+class DwellStatsStore:
+    """
+    Persistent dwell-time aggregates keyed by (ship company, year-month) (선사/연월별 체류시간 집계 저장소)
+    Each bucket keeps count, sum, sum of squares, min, max and a HistogramSketch, so statistics for any
+    set of companies and months come from the buckets alone, independent of the number of port calls.
+    New schedule rows are ingested append-only: only the buckets they touch are updated.
+    """
+
+    def __init__(self, path: str = STORE_PATH, value: str = STAY_COL, sketch_width: float = SKETCH_WIDTH):
+        self.path = path
+        self.value = value
+        self.sketch_width = sketch_width
+        self.buckets = {}
+        self.sources = {}
+        self._lock = threading.RLock()
+
+    # ---------- ingest (적재) ----------
+    def ingest(self, frame: pd.DataFrame):
+        """Add rows with company, Enter Time and duration columns to their buckets (행 추가 적재)"""
+        if len(frame) == 0:
+            return self
+        keys = [frame[COMPANY_COL].astype(str), pd.to_datetime(frame[ENTER_COL]).dt.strftime("%Y-%m")]
+        values = frame[self.value].astype(float)
+        grouped = values.groupby(keys, sort=False)
+        aggregates = grouped.agg(["count", "sum", "min", "max"])
+        aggregates["sumsq"] = (values * values).groupby(keys, sort=False).sum()
+        with self._lock:
+            for (company, month), row in aggregates.iterrows():
+                bucket = self.buckets.get((company, month))
+                if bucket is None:
+                    bucket = self.buckets[(company, month)] = {
+                        "count": 0, "sum": 0.0, "sumsq": 0.0, "min": math.inf, "max": -math.inf,
+                        "sketch": HistogramSketch(self.sketch_width),
+                    }
+                bucket["count"] += int(row["count"])
+                bucket["sum"] += float(row["sum"])
+                bucket["sumsq"] += float(row["sumsq"])
+                bucket["min"] = min(bucket["min"], float(row["min"]))
+                bucket["max"] = max(bucket["max"], float(row["max"]))
+            for (company, month), group in grouped:
+                self.buckets[(company, month)]["sketch"].update(group.to_numpy())
+        return self
+
+    def sync(self, source: str, frame: pd.DataFrame) -> int:
+        """
+        Bring the store up to date with `frame`, an append-only table identified by `source`.
+        Only rows after the last ingested position are read; if the previously ingested rows
+        changed (fewer rows or a different last row) the store is rebuilt from scratch.
+
+        Returns:
+        int - number of newly ingested rows (새로 적재된 행 수)
+        """
+        with self._lock:
+            state = self.sources.get(source)
+            start = 0
+            if state is not None:
+                seen = state["rows"]
+                if seen <= len(frame) and (seen == 0 or _row_fingerprint(frame, seen - 1) == state["last"]):
+                    start = seen
+                else:
+                    self.reset()
+            if start == len(frame):
+                return 0
+            self.ingest(frame.iloc[start:])
+            self.sources[source] = {"rows": len(frame), "last": _row_fingerprint(frame, len(frame) - 1)}
+            return len(frame) - start
+
+    def reset(self):
+        with self._lock:
+            self.buckets = {}
+            self.sources = {}
+
+    # ---------- query (조회) ----------
+    def _select(self, companies=None, start: str = None, end: str = None):
+        companies = None if companies is None else set(companies)
+        for (company, month), bucket in self.buckets.items():
+            if companies is not None and company not in companies:
+                continue
+            if (start is not None and month < start) or (end is not None and month > end):
+                continue
+            yield company, month, bucket
+
+    def sketch(self, companies=None, start: str = None, end: str = None) -> HistogramSketch:
+        """Merged sketch of the selected buckets; months are "YYYY-MM" strings (선택 구간 스케치)"""
+        merged = HistogramSketch(self.sketch_width)
+        with self._lock:
+            for _, _, bucket in self._select(companies, start, end):
+                merged.merge(bucket["sketch"])
+        return merged
+
+    def company_sketches(self, companies, start: str = None, end: str = None) -> dict:
+        """Merged sketch per company, in the order of `companies` (선사별 스케치)"""
+        sketches = {company: HistogramSketch(self.sketch_width) for company in companies}
+        with self._lock:
+            for company, _, bucket in self._select(companies, start, end):
+                sketches[company].merge(bucket["sketch"])
+        return sketches
+
+    def company_stats(self, companies=None, start: str = None, end: str = None) -> pd.DataFrame:
+        """
+        Returns:
+        pd.DataFrame - count/mean/std/min/median/max per company, longest average stay first;
+                       same layout as analyzer.dwellTime.company_stats (선사별 통계)
+        """
+        totals = {}
+        with self._lock:
+            for company, _, bucket in self._select(companies, start, end):
+                total = totals.setdefault(company, {"count": 0, "sum": 0.0, "sumsq": 0.0,
+                                                    "min": math.inf, "max": -math.inf,
+                                                    "sketch": HistogramSketch(self.sketch_width)})
+                total["count"] += bucket["count"]
+                total["sum"] += bucket["sum"]
+                total["sumsq"] += bucket["sumsq"]
+                total["min"] = min(total["min"], bucket["min"])
+                total["max"] = max(total["max"], bucket["max"])
+                total["sketch"].merge(bucket["sketch"])
+
+        rows = []
+        for company, total in totals.items():
+            n = total["count"]
+            mean = total["sum"] / n
+            variance = (total["sumsq"] - n * mean * mean) / (n - 1) if n > 1 else math.nan
+            rows.append({"Ship Company": company, "count": n, "mean": mean,
+                         "std": math.sqrt(max(variance, 0.0)) if n > 1 else math.nan,
+                         "min": total["min"], "median": total["sketch"].quantile(0.5), "max": total["max"]})
+        stats = pd.DataFrame(rows, columns=["Ship Company", "count", "mean", "std", "min", "median", "max"])
+        stats = stats.set_index("Ship Company").sort_index()
+        return stats.sort_values("mean", ascending=False, kind="stable")
+
+    # ---------- persistence (저장/불러오기) ----------
+    def save(self):
+        with self._lock:
+            payload = {
+                "version": STORE_VERSION,
+                "value": self.value,
+                "sketch_width": self.sketch_width,
+                "sources": self.sources,
+                "buckets": [
+                    {"company": company, "month": month,
+                     **{k: v for k, v in bucket.items() if k != "sketch"},
+                     "sketch": bucket["sketch"].to_dict()}
+                    for (company, month), bucket in self.buckets.items()
+                ],
+            }
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(payload, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                # the store still works in memory when the folder is read-only (읽기 전용 환경 대비)
+                pass
+        return self
+
+    @classmethod
+    def load(cls, path: str = STORE_PATH, value: str = STAY_COL, sketch_width: float = SKETCH_WIDTH):
+        """Open the persisted store, or an empty one if it is missing or was built differently"""
+        store = cls(path, value, sketch_width)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return store
+        if (payload.get("version") != STORE_VERSION or payload.get("value") != value
+                or payload.get("sketch_width") != sketch_width):
+            return store
+        store.sources = payload["sources"]
+        for item in payload["buckets"]:
+            store.buckets[(item["company"], item["month"])] = {
+                "count": item["count"], "sum": item["sum"], "sumsq": item["sumsq"],
+                "min": item["min"], "max": item["max"],
+                "sketch": HistogramSketch.from_dict(item["sketch"]),
+            }
+        return store
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared_store(source: str, frame, path: str = STORE_PATH, version: str = None) -> DwellStatsStore:
+    """
+    Parameters:
+    source : str - name of the append-only schedule table (스케줄 데이터 이름)
+    frame : pd.DataFrame or callable - the table with duration columns (see analyzer.dwellTime.add_duration_columns),
+            or a function building it, called only when the store has to be synced (데이터 또는 생성 함수)
+    path : str - persisted store location (저장 경로)
+    version : str - content hash of the source, e.g. data.dataset_hash(source); when it matches the version
+              of the last sync the table is not read at all (원본 해시, 같으면 동기화 생략)
+
+    Returns:
+    DwellStatsStore - process-wide store synced with `frame`; saved to disk only when new rows arrived
+                      (세션 간 공유 저장소)
+    """
+    with _shared_lock:
+        store = _shared.get(path)
+        if store is None:
+            store = _shared[path] = DwellStatsStore.load(path)
+    with store._lock:
+        if version is not None and store.sources.get(source, {}).get("version") == version:
+            return store
+        synced = store.sync(source, frame() if callable(frame) else frame)
+        if version is not None and store.sources.get(source, {}).get("version") != version:
+            store.sources.setdefault(source, {"rows": 0, "last": None})["version"] = version
+            synced = True
+        if synced:
+            store.save()
+    return store
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+# Column names of the New Port schedule (신항 입출항 스케줄 컬럼명)
+ENTER_COL = "Enter Time"
+OUT_COL = "Out Time"
+COMPANY_COL = "Ship Company"
+DURATION_COL = "Total duration(Hours)"
+STAY_COL = "Stay duration(Hours)"
+
+# Upper fence of the real stay, q3 + 1.5 * IQR = 19 + 1.5 * 11 = 35.5h rounded up to the hour; the 5.6% of
+# calls above it are treated as outliers on page 7 and in shipsDuration.csv (체류시간 이상치 기준, 시간)
+STAY_OUTLIER_HOURS = 36
+
+_HOUR_NS = 3600 * 10**9
+_DAY_NS = 24 * _HOUR_NS
+
+
+def stay_duration(enter: pd.Series, out: pd.Series) -> pd.Series:
+    """
+    Parameters:
+    enter : pd.Series - arrival timestamps (입항 시간)
+    out : pd.Series - departure timestamps (출항 시간)
+
+    Returns:
+    pd.Series - stay duration in hours as Out minus Enter, so a normal call is positive (체류 시간, 시간 단위)
+    """
+    return (pd.to_datetime(out) - pd.to_datetime(enter)) / pd.Timedelta(hours=1)
+
+
+def legacy_duration(enter: pd.Series, out: pd.Series) -> pd.DataFrame:
+    """
+    Parameters:
+    enter : pd.Series - arrival timestamps (입항 시간)
+    out : pd.Series - departure timestamps (출항 시간)
+
+    Returns:
+    pd.DataFrame - "Day difference", "Duration days", "Duration hours" and "Total duration(Hours)"
+                   exactly as published in the analysis (분석 결과에 사용된 체류기간 컬럼)
+
+    The published metric was read off str(Enter - Out) with the "-" removed, e.g. "-1 days +13:00:00"
+    -> 1 day + 13 hours = 37. Because Enter - Out is negative, that is |days| * 24 + the hour component
+    of the floored timedelta, not the real stay: an 11-hour call reads as 37. It is reproduced here only
+    so the published shipsDuration.csv files keep their columns; the aggregates (company_stats, the
+    dwell store) use stay_duration. (기존 문자열 처리 결과 재현, 집계는 실제 체류시간 사용)
+    """
+    difference = pd.to_datetime(enter) - pd.to_datetime(out)
+    ns = difference.to_numpy(dtype="timedelta64[ns]").astype(np.int64)
+    days = np.floor_divide(ns, _DAY_NS)
+    remainder = ns - days * _DAY_NS
+    hours = remainder // _HOUR_NS
+    minutes = remainder % _HOUR_NS // (60 * 10**9)
+    seconds = remainder % (60 * 10**9) // 10**9
+
+    clock = (pd.Series(hours, index=difference.index).astype(str).str.zfill(2)
+             + ":" + pd.Series(minutes, index=difference.index).astype(str).str.zfill(2)
+             + ":" + pd.Series(seconds, index=difference.index).astype(str).str.zfill(2))
+    return pd.DataFrame({
+        "Day difference": difference,
+        "Duration days": np.abs(days),
+        "Duration hours": clock,
+        DURATION_COL: np.abs(days) * 24 + hours,
+    }, index=difference.index)
+
+
+def add_duration_columns(schedule: pd.DataFrame, enter: str = ENTER_COL, out: str = OUT_COL) -> pd.DataFrame:
+    """
+    Parameters:
+    schedule : pd.DataFrame - schedule with arrival/departure columns (입출항 스케줄)
+    enter, out : str - timestamp column names (입항/출항 컬럼명)
+
+    Returns:
+    pd.DataFrame - copy of `schedule` with the published duration columns and the real stay in hours
+                   (체류기간 컬럼이 추가된 데이터프레임)
+    """
+    frame = schedule.copy(deep=False)
+    frame[enter] = pd.to_datetime(frame[enter])
+    frame[out] = pd.to_datetime(frame[out])
+    for column, values in legacy_duration(frame[enter], frame[out]).items():
+        frame[column] = values
+    frame[STAY_COL] = stay_duration(frame[enter], frame[out])
+    return frame
+
+
+def company_stats(frame: pd.DataFrame, value: str = STAY_COL, by: str = COMPANY_COL) -> pd.DataFrame:
+    """
+    Parameters:
+    frame : pd.DataFrame - schedule with a duration column (체류기간이 포함된 데이터)
+    value : str - duration column to summarize (요약할 컬럼)
+    by : str - grouping column (그룹 기준 컬럼)
+
+    Returns:
+    pd.DataFrame - count/mean/std/min/median/max per company, longest average stay first
+                   (선사별 체류시간 통계, 평균 내림차순)
+    """
+    stats = (frame.groupby(by, observed=True)[value]
+                  .agg(["count", "mean", "std", "min", "median", "max"]))
+    return stats.sort_values("mean", ascending=False, kind="stable")
+
+
+def top_companies(frame: pd.DataFrame, n: int, value: str = STAY_COL, by: str = COMPANY_COL,
+                  exclude=()) -> list:
+    """Names of the `n` companies with the longest average stay, skipping `exclude` (평균 체류시간 상위 선사)"""
+    names = company_stats(frame, value, by).index
+    return [name for name in names if name not in set(exclude)][:n]
@@ -1,26 +1,40 @@
 import pandas as pd
 import plotly.express as px
-import os
-import pickle
+import plotly.graph_objects as go
+from .dwellTime import ENTER_COL, OUT_COL, add_duration_columns, company_stats
+from .boxSummary import summary_box
+from .figureCache import figure_cache
 
 class dwellTimeAnalyzer:
-    def __init__(self, df, y, x, by: bool=False, marker_color=None):
+    def __init__(self, df, y, x, by: bool=False, marker_color=None, summary: bool=False):
+        # 체류시간 컬럼이 없는 원본 스케줄이면 입출항 시간으로부터 계산
+        if y not in df.columns and {ENTER_COL, OUT_COL} <= set(df.columns):
+            df = add_duration_columns(df)
         self.df = df
         self.x_col = x
         self.y_col = y
         self.marker_color = marker_color
         self.by = by
-        if by==False:
-            self.boxplot_file = f'graph/{y}_Boxplot.pkl'
-        else:
-            self.boxplot_file = f'graph/{y}_Boxplot_by_{x}'
+        # summary=True : 박스 통계를 서버에서 계산해 사분위 값과 이상치만 그림에 담음
+        self.summary = summary
+
+    def company_stats(self):
+        # 그룹(x)별 count/mean/std/min/median/max, 평균 내림차순
+        return company_stats(self.df, value=self.y_col, by=self.x_col)
 
     def draw_boxplot(self,title: str):
-        if os.path.exists(self.boxplot_file):
-            with open(self.boxplot_file, 'rb') as f:
-                return pickle.load(f)
-        
-        if self.by==False:
+        # 데이터 해시 + 옵션(제목, 색상, 그룹 여부)이 같으면 캐시된 그래프 사용
+        columns = [self.x_col, self.y_col] if self.by else [self.y_col]
+        return figure_cache.get_or_create(
+            'dwellTimeAnalyzer.boxplot', self.df, lambda: self._boxplot(title), columns=columns,
+            x_col=self.x_col, y_col=self.y_col, by=self.by, summary=self.summary,
+            marker_color=self.marker_color, title=title
+        )
+
+    def _boxplot(self, title):
+        if self.summary:
+            fig = go.Figure(summary_box(self.df, self.y_col, self.x_col if self.by else None))
+        elif self.by==False:
             fig = px.box(
                 self.df,
                 y = self.y_col
@@ -57,8 +71,5 @@ class dwellTimeAnalyzer:
             marker_color=self.marker_color,
             boxmean=True
             )
-        
-        with open(self.boxplot_file, 'wb') as f:
-            pickle.dump(fig, f)
 
         return fig
\ No newline at end of file
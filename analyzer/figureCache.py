@@ -0,0 +1,73 @@
+import os
+import json
+import hashlib
+import pandas as pd
+import plotly
+from data.tieredCache import TieredCache
+from .figureJSON import FigureJSON
+
+# Bump when the figure code changes so older cache entries are ignored (그래프 코드 변경 시 버전 증가)
+CACHE_VERSION = 1
+FIGURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "graph")
+
+
+def frame_hash(frame: pd.DataFrame, columns=None) -> str:
+    """Content hash of `frame` (or only `columns`): names, dtypes, index and values (데이터 내용 해시)"""
+    part = frame if columns is None else frame[list(columns)]
+    digest = hashlib.sha1()
+    digest.update(json.dumps([[str(c) for c in part.columns], [str(t) for t in part.dtypes]]).encode())
+    digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """
+    Content-addressed plotly figure cache (데이터 해시 + 그리기 옵션 기반 그래프 캐시)
+    The key covers the input data hash, the render parameters, CACHE_VERSION and the plotly version,
+    so a changed frame, title, color or language is a miss instead of a stale hit.
+    Stored in a TieredCache under graph/ (memory LRU + disk tier trimmed to `max_bytes`).
+    Figures are stored as FigureJSON (plotly JSON, no pickles): the payload of a disk file is the
+    figure spec, so a hit never parses or rebuilds the figure.
+    """
+
+    def __init__(self, directory: str = FIGURE_DIR, max_items: int = 64, max_bytes: int = 256 * 1024**2):
+        self._store = TieredCache(directory, ".json", stamp={"version": CACHE_VERSION, "plotly": plotly.__version__},
+                                  max_items=max_items, max_bytes=max_bytes)
+
+    def key(self, kind: str, frame: pd.DataFrame, columns=None, **params) -> str:
+        stamp = {"version": CACHE_VERSION, "plotly": plotly.__version__, "kind": kind,
+                 "data": frame_hash(frame, columns), "params": params}
+        return hashlib.sha1(json.dumps(stamp, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key: str):
+        return self._store.get(key, lambda meta, payload: FigureJSON(payload.decode("utf-8")))
+
+    def put(self, key: str, fig) -> FigureJSON:
+        figure = fig if isinstance(fig, FigureJSON) else FigureJSON.from_figure(fig)
+        return self._store.put(key, figure, figure.spec.encode("utf-8"))
+
+    def get_or_create(self, kind: str, frame: pd.DataFrame, build, columns=None, **params) -> FigureJSON:
+        """
+        Parameters:
+        kind : str - figure type, e.g. "CorrelationAnalyzer.scatter" (그래프 종류)
+        frame : pd.DataFrame - input data (입력 데이터)
+        build : callable - creates the figure on a miss (캐시에 없을 때 그래프 생성 함수)
+        columns : list - columns the figure depends on; all columns when None (사용 컬럼)
+        params : render parameters such as title, colors, language (그리기 옵션)
+
+        Returns:
+        FigureJSON - immutable serialized figure; show it with analyzer.plotly_chart,
+                     or call .to_figure() when it has to be modified (직렬화된 그래프)
+        """
+        key = self.key(kind, frame, columns, **params)
+        figure = self.get(key)
+        if figure is None:
+            figure = self.put(key, build())
+        return figure
+
+    def clear(self):
+        self._store.clear()
+
+
+# Shared by every analyzer in the process (프로세스 전체에서 공유)
+figure_cache = FigureCache()
@@ -0,0 +1,135 @@
+import json
+import inspect
+import logging
+import functools
+import orjson
+import plotly.io as pio
+import plotly.graph_objects as go
+
+logger = logging.getLogger(__name__)
+
+# Fields of the PlotlyChart element the FigureJSON fast path fills in (빠른 경로에서 채우는 요소 필드)
+_PROTO_FIELDS = ("use_container_width", "theme", "form_id", "spec", "config", "id")
+_disabled = None   # why the fast path was turned off for this process (빠른 경로 비활성화 사유)
+
+
+class FigureJSON:
+    """
+    Serialized plotly figure: compact orjson text with numeric arrays as base64 typed arrays
+    (plotly JSON 형식으로 직렬화된 그래프)
+    Pass it to plotly_chart() below to display it without rebuilding a go.Figure.
+    """
+    __slots__ = ("spec",)
+
+    def __init__(self, spec: str):
+        self.spec = spec
+
+    @classmethod
+    def from_figure(cls, fig: go.Figure) -> "FigureJSON":
+        # plotly encodes numpy arrays as {"dtype", "bdata"} typed arrays (숫자 배열은 base64로 인코딩)
+        return cls(pio.to_json(fig, validate=False, engine="orjson"))
+
+    def to_dict(self) -> dict:
+        return orjson.loads(self.spec)
+
+    def to_figure(self) -> go.Figure:
+        """Rebuild a go.Figure, e.g. to update the layout before showing it (수정이 필요할 때만 사용)"""
+        return pio.from_json(self.spec)
+
+    def __len__(self):
+        return len(self.spec)
+
+
+def plotly_chart(figure, use_container_width: bool = True, *, theme="streamlit", key=None, **kwargs):
+    """
+    Parameters:
+    figure : FigureJSON, go.Figure or dict - chart to display (표시할 그래프)
+    use_container_width, theme, key, kwargs : same as st.plotly_chart (st.plotly_chart와 동일)
+
+    A FigureJSON is sent as-is when the Streamlit internals it needs are there: st.plotly_chart would turn it
+    back into a validated go.Figure and serialize it again, which is most of the cost of showing a cached
+    chart. Otherwise, and for anything else, it goes through st.plotly_chart.
+    """
+    import streamlit as st
+
+    if not isinstance(figure, FigureJSON):
+        return st.plotly_chart(figure, use_container_width, theme=theme, key=key, **kwargs)
+
+    internals = None if _disabled else _internals()
+    if internals is not None:
+        try:
+            proto = _plotly_proto(internals, st._main, figure, use_container_width, theme, key, kwargs)
+        except (AttributeError, TypeError, ValueError) as e:
+            # internals changed in a way the checks did not catch: fall back to the public API (공개 API 사용)
+            _fall_back(f"{type(e).__name__}: {e}")
+            proto = None
+        if proto is not None:
+            return st._main._enqueue("plotly_chart", proto)
+    return st.plotly_chart(figure.to_dict(), use_container_width, theme=theme, key=key, **kwargs)
+
+
+def _fall_back(reason: str):
+    # the fast path stays off for the rest of the process, logged once (프로세스당 1회만 기록)
+    global _disabled
+    if _disabled is None:
+        _disabled = reason
+        logger.warning("plotly_chart: FigureJSON fast path disabled, using st.plotly_chart (%s)", reason)
+
+
+@functools.lru_cache(maxsize=1)
+def _internals():
+    """
+    Streamlit internals the fast path uses, checked once per process; None when one of them is missing
+    or has another shape (빠른 경로에 필요한 내부 API 확인, 없으면 None)
+    """
+    try:
+        from streamlit.delta_generator import DeltaGenerator
+        from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+        from streamlit.elements.lib.form_utils import current_form_id
+        from streamlit.elements.lib.utils import compute_and_register_element_id, to_key
+    except ImportError as e:
+        _fall_back(f"ImportError: {e}")
+        return None
+
+    missing = [name for name in _PROTO_FIELDS if name not in PlotlyChartProto.DESCRIPTOR.fields_by_name]
+    if missing:
+        _fall_back(f"PlotlyChart proto has no {', '.join(missing)}")
+        return None
+    if not callable(getattr(DeltaGenerator, "_enqueue", None)):
+        _fall_back("DeltaGenerator._enqueue is missing")
+        return None
+    params = inspect.signature(compute_and_register_element_id).parameters
+    if (not {"user_key", "form_id"} <= params.keys()
+            or not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())):
+        _fall_back("compute_and_register_element_id has another signature")
+        return None
+    return PlotlyChartProto, current_form_id, compute_and_register_element_id, to_key
+
+
+def _plotly_proto(internals, dg, figure: FigureJSON, use_container_width: bool, theme, key, kwargs: dict):
+    # same element as st.plotly_chart builds for a non-selectable chart (st.plotly_chart가 만드는 요소와 동일)
+    PlotlyChartProto, current_form_id, compute_and_register_element_id, to_key = internals
+
+    proto = PlotlyChartProto()
+    proto.use_container_width = use_container_width
+    proto.theme = theme or ""
+    proto.form_id = current_form_id(dg)
+
+    config = dict(kwargs.get("config", {}))
+    config.setdefault("showLink", kwargs.get("show_link", False))
+    config.setdefault("linkText", kwargs.get("link_text", False))
+
+    proto.spec = figure.spec
+    proto.config = json.dumps(config)
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=to_key(key),
+        form_id=proto.form_id,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme=theme,
+        use_container_width=use_container_width,
+    )
+    return proto
@@ -0,0 +1,90 @@
+import math
+import numpy as np
+
+
+class HistogramSketch:
+    """
+    Mergeable fixed-width histogram used as a streaming quantile sketch (스트리밍 분위수 스케치)
+    Values are bucketed by floor(value / width); memory grows with the value range, not the row count.
+    Quantiles are exact when every value is a multiple of `width` (e.g. stays in whole minutes with width=1/60).
+    """
+
+    def __init__(self, width: float = 1.0, bins: dict = None):
+        self.width = width
+        self.bins = {int(k): int(v) for k, v in (bins or {}).items()}
+
+    @property
+    def count(self) -> int:
+        return sum(self.bins.values())
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        # the small offset keeps multiples of a fractional width in their own bin despite float rounding
+        # (부동소수 오차로 경계값이 아래 구간에 들어가지 않도록 보정)
+        keys, counts = np.unique(np.floor(values / self.width + 1e-9).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.bins[key] = self.bins.get(key, 0) + count
+        return self
+
+    def merge(self, other: "HistogramSketch"):
+        if other.width != self.width:
+            raise ValueError("Cannot merge sketches with different bin widths")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        return self
+
+    def _sorted(self):
+        keys = sorted(self.bins)
+        values = np.array(keys, dtype=float) * self.width
+        cumulative = np.cumsum([self.bins[k] for k in keys])
+        return values, cumulative
+
+    def quantile(self, q: float) -> float:
+        """Linear-interpolated quantile, same definition as numpy/pandas' default (선형 보간 분위수)"""
+        total = self.count
+        if total == 0:
+            return math.nan
+        values, cumulative = self._sorted()
+        position = q * (total - 1)
+        lower = int(math.floor(position))
+        upper = min(lower + 1, total - 1)
+        # value at sorted rank r is the first bin whose cumulative count exceeds r
+        low_value = values[np.searchsorted(cumulative, lower, side="right")]
+        high_value = values[np.searchsorted(cumulative, upper, side="right")]
+        return float(low_value + (high_value - low_value) * (position - lower))
+
+    def mean(self) -> float:
+        total = self.count
+        if total == 0:
+            return math.nan
+        return sum(k * self.width * c for k, c in self.bins.items()) / total
+
+    def std(self) -> float:
+        # sample standard deviation, like pandas (표본 표준편차)
+        total = self.count
+        if total < 2:
+            return math.nan
+        mean = self.mean()
+        squares = sum((k * self.width - mean) ** 2 * c for k, c in self.bins.items())
+        return math.sqrt(squares / (total - 1))
+
+    def values_outside(self, low: float, high: float) -> dict:
+        """Bucket values (with counts) lying strictly outside [low, high] (범위 밖 값과 개수)"""
+        return {key * self.width: count for key, count in sorted(self.bins.items())
+                if key * self.width < low or key * self.width > high}
+
+    def within(self, low: float = None, high: float = None) -> "HistogramSketch":
+        """New sketch with only the bucket values inside [low, high], like frame[frame[col] <= high] (범위 내 값만)"""
+        return HistogramSketch(self.width, {key: count for key, count in self.bins.items()
+                                            if (low is None or key * self.width >= low)
+                                            and (high is None or key * self.width <= high)})
+
+    def to_dict(self) -> dict:
+        return {"width": self.width, "bins": {str(k): v for k, v in self.bins.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HistogramSketch":
+        return cls(data["width"], data["bins"])
@@ -0,0 +1,103 @@
+# Server memory across many chatbot chart requests (차트 요청 반복 시 메모리 사용량 측정)
+#   python benchmarks/chart_memory.py                 -> 1,000 managed renders (chatbot.figures)
+#   python benchmarks/chart_memory.py --unmanaged     -> the old exec + plt.savefig path, for comparison
+# RSS is sampled every --every requests; with the figure manager it stays flat after the first samples,
+# the unmanaged path grows with every request because no figure is ever closed.
+import os
+import io
+import sys
+import time
+import argparse
+import warnings
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+# missing-glyph warnings when the Korean font is not installed (한글 폰트가 없을 때의 경고)
+warnings.filterwarnings("ignore", message="Glyph .* missing")
+
+from chatbot.figures import figure_manager  # noqa: E402  (selects Agg before pyplot is used)
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from data import load_dataset  # noqa: E402
+
+# Chart code in the style the pandas agent generates (에이전트가 생성하는 형태의 코드)
+CHART_CODES = [
+    "plt.figure(figsize=(10, 5))\n"
+    "yearly = df.groupby('Year')['Weight'].sum()\n"
+    "plt.plot(yearly.index, yearly.values, marker='o')\n"
+    "plt.title('Weight by year')",
+    "top = df.groupby('Harbor name', observed=True)['Ship count'].sum().nlargest(10)\n"
+    "top.plot(kind='bar', figsize=(10, 5))\n"
+    "plt.ylabel('Ship count')",
+    "plt.hist(df['Ship count'], bins=50)\n"
+    "plt.xlabel('Ship count')",
+    "fig, axes = plt.subplots(1, 2, figsize=(12, 4))\n"
+    "axes[0].scatter(df['Ship count'], df['Weight'], s=4)\n"
+    "df.boxplot(column='Ship count', by='Month', ax=axes[1])",
+    "monthly = df.pivot_table(index='Year', columns='Month', values='Weight', aggfunc='sum')\n"
+    "plt.imshow(monthly.values, aspect='auto')\n"
+    "plt.colorbar()",
+]
+
+
+def rss_mb() -> float:
+    # resident set size of this process (현재 프로세스 상주 메모리)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def render_unmanaged(code: str, frame: pd.DataFrame) -> bytes:
+    # what importMyBot did before: exec on a copy, savefig on the implicit figure, never close it
+    df = frame.copy()  # noqa: F841
+    exec(code, {"df": df, "plt": plt, "np": np, "pd": pd})
+    buf = io.BytesIO()
+    plt.savefig(buf, format="png")
+    return buf.getvalue()
+
+
+def render_managed(code: str, frame: pd.DataFrame) -> bytes:
+    return figure_manager.render_code(code, {"df": frame.copy(), "plt": plt, "np": np, "pd": pd})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RSS across repeated chatbot chart renders")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--every", type=int, default=100, help="sample RSS every N requests")
+    parser.add_argument("--unmanaged", action="store_true", help="render without the figure manager")
+    parser.add_argument("--dataset", default="llm_koreaAllHarbors")
+    args = parser.parse_args(argv)
+
+    frame = load_dataset(args.dataset)
+    render = render_unmanaged if args.unmanaged else render_managed
+    mode = "unmanaged" if args.unmanaged else "managed"
+
+    print(f"{mode}: {args.requests} chart requests on {args.dataset} ({len(frame)} rows)")
+    print(f"{'requests':>9} {'rss MB':>9} {'open figs':>10} {'ms/chart':>9}")
+    start_rss = rss_mb()
+    print(f"{0:>9} {start_rss:>9.1f} {len(plt.get_fignums()):>10} {'-':>9}")
+    samples = []
+    started = time.perf_counter()
+    for i in range(1, args.requests + 1):
+        render(CHART_CODES[i % len(CHART_CODES)], frame)
+        if i % args.every == 0:
+            elapsed = (time.perf_counter() - started) * 1000 / args.every
+            samples.append(rss_mb())
+            print(f"{i:>9} {samples[-1]:>9.1f} {len(plt.get_fignums()):>10} {elapsed:>9.1f}", flush=True)
+            started = time.perf_counter()
+
+    # growth after warm-up: first sample to last (워밍업 이후 증가량)
+    if len(samples) >= 2:
+        growth = samples[-1] - samples[0]
+        print(f"RSS growth after the first {args.every} requests: {growth:+.1f} MB "
+              f"({growth / (args.requests - args.every) * 1024:+.1f} KB/request)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# Chatbot turn latency on the eight page-1 datasets with the offline scripted LLM (오프라인 모델로 챗봇 지연 시간 측정)
+#   python benchmarks/chatbot_latency.py                          -> local overhead only, the fake LLM answers instantly
+#   python benchmarks/chatbot_latency.py --latency 0.8 --token-delay 0.02
+#                                                                 -> with a simulated API round trip and token rate
+# Columns (median of --repeat runs, the answer cache is emptied before every turn):
+#   route     intent_router.route(question)                       plan      fast_answer() trying the pandas fast path
+#   setup     building the agent prompt (digest + preview)        lookup    pooled prompt + a new agent and tool
+#   tool      the scripted EDA code in the agent's python tool    render    the scripted chart code in the sandbox
+#   eda/viz/chat  end-to-end importMyBot() turn per intent        ttft      first streamed token of an EDA answer
+import os
+import io
+import sys
+import time
+import argparse
+import tempfile
+import warnings
+import statistics
+from contextlib import redirect_stdout
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+warnings.filterwarnings("ignore")
+
+import streamlit as st  # noqa: E402
+import setting_llm  # noqa: E402
+from chatbot import AnswerCache, ScriptedChatModel, intent_router, fast_answer, viz_sandbox  # noqa: E402
+from chatbot.fakeLLM import DEFAULT_SCRIPTS  # noqa: E402
+from chatbot.router import VISUALIZATION, EDA  # noqa: E402
+from analyzer.figureCache import frame_hash  # noqa: E402
+from data import load_dataset  # noqa: E402
+
+# the datasets page 1 offers, in page order (1페이지 데이터셋 순서)
+DATASETS = [
+    "llm_koreaAllHarbors",
+    "llm_busanAllPorts_GTCount",
+    "llm_busanThreeport_position",
+    "llm_prod_totalCountPrice_yearMonth",
+    "llm_meatCompany",
+    "llm_foodCompany",
+    "llm_vacancy_location",
+    "llm_sinhangSchedule",
+]
+QUESTIONS = {
+    "eda": "Explain the correlation between the columns in this data",
+    "viz": "Draw a chart of this data",
+    "chat": "Hello, who are you?",
+}
+
+
+def timed(func, *args, **kwargs) -> float:
+    # seconds for one call, agent console output suppressed (에이전트 출력 없이 1회 실행 시간)
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        func(*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def median(samples) -> float:
+    return statistics.median(samples) if samples else float("nan")
+
+
+def first_token(frame, question, dataset) -> float:
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        stream = setting_llm.importMyBot(frame, question, dataset=dataset, stream=True)
+        for _ in stream:
+            elapsed = time.perf_counter() - started
+            break
+        for _ in stream:   # let the agent finish before the next turn (다음 측정 전에 에이전트 종료 대기)
+            pass
+    return elapsed
+
+
+def measure(name: str, repeat: int) -> dict:
+    frame = load_dataset(name)
+    key = frame_hash(frame)
+    row = {"dataset": name, "rows": len(frame)}
+
+    # one untimed pass so the planner and the sandbox copy of the dataset exist (플래너/샌드박스 데이터 준비)
+    fast_answer(frame, QUESTIONS["eda"], key=key)
+    viz_sandbox.render(frame, DEFAULT_SCRIPTS[VISUALIZATION][0][1], key=key)
+
+    row["route"] = median([timed(intent_router.route, q) for q in QUESTIONS.values() for _ in range(repeat)]) * 1e6
+    row["plan"] = median([timed(fast_answer, frame, QUESTIONS["eda"], key=key) for _ in range(repeat)]) * 1e6
+
+    llm = setting_llm.llm_pool.llm()
+    row["setup"] = median([timed(setting_llm._agent_prompt, frame, dataset=name) for _ in range(repeat)]) * 1e3
+    setting_llm.llm_pool.prompt(frame, key=key, dataset=name)
+    # pooled prompt + a new agent and python tool, as every agent call does (풀 프롬프트 + 새 에이전트)
+    row["lookup"] = median([timed(setting_llm.llm_pool.agent, frame, key=key, dataset=name) for _ in range(repeat)]) * 1e6
+
+    agent = setting_llm.llm_pool.agent(frame, key=key, dataset=name)
+    python_tool = agent.tools[0]
+    eda_code = DEFAULT_SCRIPTS[EDA][0][1]
+    viz_code = DEFAULT_SCRIPTS[VISUALIZATION][0][1]
+    row["tool"] = median([timed(python_tool.invoke, {"query": eda_code}) for _ in range(repeat)]) * 1e3
+    row["render"] = median([timed(viz_sandbox.render, frame, viz_code, key=key) for _ in range(repeat)]) * 1e3
+
+    for intent, question in QUESTIONS.items():
+        samples = []
+        for _ in range(repeat):
+            setting_llm.answer_cache.clear()
+            samples.append(timed(setting_llm.importMyBot, frame, question, dataset=name))
+        row[intent] = median(samples) * 1e3
+
+    samples = []
+    for _ in range(repeat):
+        setting_llm.answer_cache.clear()
+        samples.append(first_token(frame, QUESTIONS["eda"], name))
+    row["ttft"] = median(samples) * 1e3
+    return row
+
+
+COLUMNS = [("dataset", 36, "s"), ("rows", 7, "d"), ("route µs", 9, ".0f"), ("plan µs", 9, ".0f"),
+           ("setup ms", 9, ".1f"), ("lookup µs", 10, ".1f"), ("tool ms", 8, ".1f"), ("render ms", 10, ".1f"),
+           ("eda ms", 8, ".1f"), ("viz ms", 8, ".1f"), ("chat ms", 8, ".1f"), ("ttft ms", 8, ".1f")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chatbot latency on the page-1 datasets with the scripted LLM")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds before each LLM response")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="simulated seconds between tokens")
+    parser.add_argument("--datasets", nargs="*", default=DATASETS, choices=DATASETS)
+    args = parser.parse_args(argv)
+
+    # offline model and a throwaway answer cache, so nothing is sent to OpenAI or left in .cache/
+    # (오프라인 모델과 임시 응답 캐시 사용, OpenAI 호출이나 .cache/ 기록 없음)
+    setting_llm.use_llm_backend(lambda: ScriptedChatModel(latency=args.latency, token_delay=args.token_delay))
+    setting_llm.answer_cache = AnswerCache(directory=tempfile.mkdtemp(prefix="chatbot-bench-"))
+    st.session_state.messages = []
+    viz_sandbox.warm_up()
+
+    print(f"scripted LLM: latency {args.latency}s, token delay {args.token_delay}s, median of {args.repeat} runs")
+    print(" ".join(f"{title:>{width}}" if i else f"{title:<{width}}" for i, (title, width, _) in enumerate(COLUMNS)))
+    keys = ["dataset", "rows", "route", "plan", "setup", "lookup", "tool", "render", "eda", "viz", "chat", "ttft"]
+    for name in args.datasets:
+        row = measure(name, args.repeat)
+        cells = [format(row[key], fmt) for key, (_, _, fmt) in zip(keys, COLUMNS)]
+        print(" ".join(f"{cell:>{width}}" if i else f"{cell:<{width}}"
+                       for i, (cell, (_, width, _)) in enumerate(zip(cells, COLUMNS))), flush=True)
+        del st.session_state.messages[:]   # generated chart messages (생성된 차트 메시지)
+    setting_llm.answer_cache.clear()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+from .pool import LLMResourcePool
+from .answerCache import AnswerCache, answer_cache, normalize_question
+from .router import IntentRouter, intent_router
+from .queryPlanner import QueryPlanner, QueryPlan, fast_answer
+from .sandbox import VizSandbox, SandboxError, viz_sandbox
+from .figures import FigureManager, figure_manager
+from .imageStore import ImageStore, session_image_store, chat_image
+from .streaming import AgentStream, text_stream
+from .fakeLLM import ScriptedChatModel, tool_call, answer
+from .framePolicy import FrameBudget, AgentPrompt, BoundedPythonTool, SandboxChartTool, chart_agent, explore_view, estimate_tokens
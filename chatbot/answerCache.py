@@ -0,0 +1,63 @@
+import os
+import re
+import json
+import hashlib
+import unicodedata
+from data.tieredCache import TieredCache
+
+# Bump when the prompt, model or answer format changes so older answers are ignored (프롬프트/모델 변경 시 버전 증가)
+CACHE_VERSION = 2
+ANSWER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "answers")
+
+_SPACES = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s?!.,~。？！]+$")
+
+
+def normalize_question(question: str) -> str:
+    """Case, width, whitespace and trailing punctuation insensitive form of a question (질문 정규화)"""
+    text = unicodedata.normalize("NFKC", question).lower()
+    return _TRAILING.sub("", _SPACES.sub(" ", text).strip())
+
+
+class AnswerCache:
+    """
+    Chatbot answer cache keyed by dataset content hash + normalized question (데이터 해시 + 정규화 질문 기반 응답 캐시)
+    Entries are {"type": "text" | "image", "content": str | PNG bytes} and expire after `ttl` seconds.
+    Stored in a TieredCache under .cache/answers/ (memory LRU + disk tier trimmed to `max_bytes`);
+    the payload of a disk file is the raw answer (UTF-8 text or PNG).
+    """
+
+    def __init__(self, directory: str = ANSWER_DIR, ttl: float = 24 * 3600,
+                 max_items: int = 256, max_bytes: int = 64 * 1024**2):
+        self._store = TieredCache(directory, ".answer", stamp={"version": CACHE_VERSION}, ttl=ttl,
+                                  max_items=max_items, max_bytes=max_bytes)
+
+    @staticmethod
+    def key(data_key: str, question: str) -> str:
+        stamp = {"version": CACHE_VERSION, "data": data_key, "question": normalize_question(question)}
+        return hashlib.sha1(json.dumps(stamp, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+    @staticmethod
+    def _decode(meta: dict, payload: bytes) -> dict:
+        return {"type": meta["type"], "content": payload.decode("utf-8") if meta["type"] == "text" else payload}
+
+    def get(self, key: str):
+        """Cached answer dict, or None on a miss / expired entry (캐시 조회)"""
+        return self._store.get(key, self._decode)
+
+    def put(self, key: str, content, kind: str = "text") -> dict:
+        """
+        Parameters:
+        key : str - AnswerCache.key(...) (캐시 키)
+        content : str or bytes - answer text, or PNG bytes when kind == "image" (응답 텍스트 또는 PNG)
+        kind : str - "text" or "image" (응답 종류)
+        """
+        payload = content.encode("utf-8") if kind == "text" else bytes(content)
+        return self._store.put(key, {"type": kind, "content": content}, payload, type=kind)
+
+    def clear(self):
+        self._store.clear()
+
+
+# Shared by every chatbot session in the process (프로세스 전체에서 공유)
+answer_cache = AnswerCache()
@@ -0,0 +1,128 @@
+import re
+import json
+import time
+from typing import Any
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from .answerCache import normalize_question
+from .router import intent_router, VISUALIZATION, EDA
+
+# Tool of the pandas agent that runs Python on `df` (pandas 에이전트의 파이썬 실행 도구)
+PYTHON_TOOL = "python_repl_ast"
+
+_TOKENS = re.compile(r"\S+\s*|\s+")
+
+
+def tool_call(code: str) -> tuple:
+    """Scripted turn: the model calls the pandas agent's python tool with `code` (도구 호출 단계)"""
+    return ("tool", code)
+
+
+def answer(text: str) -> tuple:
+    """Scripted turn: the model answers with `text` (최종 응답 단계)"""
+    return ("answer", text)
+
+
+# Turns played when no script matches: code that runs on any of the chatbot datasets
+# (스크립트가 없을 때 사용하는 기본 단계, 어떤 데이터셋에서도 실행되는 코드)
+DEFAULT_SCRIPTS = {
+    VISUALIZATION: [
+        tool_call("import matplotlib.pyplot as plt\n"
+                  "numeric = df.select_dtypes('number')\n"
+                  "(numeric.iloc[:, :3] if len(numeric.columns) else df.iloc[:, 0].value_counts().head(10)).plot(figsize=(10, 5))\n"
+                  "plt.title('Overview')"),
+        answer("The chart has been drawn."),
+    ],
+    EDA: [
+        tool_call("df.describe(include='all').T.head(20)"),
+        answer("The data has several numeric and categorical columns. The numeric columns vary widely in scale, "
+               "the categorical columns repeat a small number of values, and there are no obvious missing values "
+               "in the first rows. Ask about a specific column for its mean, range or most frequent values."),
+    ],
+    None: [
+        answer("Hello, I am Javis. I can summarize the selected data, compute aggregates and draw charts for you. "
+               "For questions unrelated to the data, please use Google Search."),
+    ],
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Deterministic offline stand-in for the OpenAI chat model (OpenAI 모델 대신 사용하는 결정적 오프라인 모델)
+    Replays scripted turns: each call looks at the latest user question and the number of tool results
+    since it, and returns the matching turn, either a python tool call or a final answer. Works with the
+    pandas agent (tool calling) and the character chain, with invoke and token streaming.
+
+    Parameters:
+    script : dict or callable - {question: [turns]} (normalized questions) or callable(question) -> [turns];
+             unmatched questions use DEFAULT_SCRIPTS by intent (질문별 단계 목록)
+    latency : float - seconds before the first token of every call (첫 토큰까지의 지연 시간)
+    token_delay : float - seconds between streamed tokens (토큰 간 지연 시간)
+    """
+
+    script: Any = None
+    latency: float = 0.0
+    token_delay: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        # the tools are not needed to replay a script, only accepted (스크립트 재생에는 도구 정보가 필요 없음)
+        return self.bind(tools=[getattr(tool, "name", str(tool)) for tool in tools], **kwargs)
+
+    def _turns(self, question: str) -> list:
+        if callable(self.script):
+            turns = self.script(question)
+        elif self.script:
+            turns = {normalize_question(q): t for q, t in self.script.items()}.get(normalize_question(question))
+        else:
+            turns = None
+        if not turns:
+            intent = intent_router.route(question)
+            turns = DEFAULT_SCRIPTS.get(intent if intent in (VISUALIZATION, EDA) else None)
+        return turns
+
+    def _next_turn(self, messages) -> tuple:
+        # turn index = tool results received since the latest user message (마지막 질문 이후 도구 결과 수)
+        question, done = "", 0
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                question, done = message.content, 0
+            elif isinstance(message, ToolMessage):
+                done += 1
+        turns = self._turns(question)
+        self.calls += 1
+        return turns[min(done, len(turns) - 1)]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        kind, content = self._next_turn(messages)
+        time.sleep(self.latency)
+        if kind == "tool":
+            message = AIMessage(content="", tool_calls=[
+                {"name": PYTHON_TOOL, "args": {"query": content}, "id": f"call_{self.calls}"}])
+        else:
+            time.sleep(self.token_delay * len(_TOKENS.findall(content)))
+            message = AIMessage(content=content)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        kind, content = self._next_turn(messages)
+        time.sleep(self.latency)
+        if kind == "tool":
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[{
+                "name": PYTHON_TOOL, "args": json.dumps({"query": content}), "id": f"call_{self.calls}", "index": 0}]))
+            if run_manager:
+                run_manager.on_llm_new_token("", chunk=chunk)
+            yield chunk
+            return
+        for i, token in enumerate(_TOKENS.findall(content)):
+            if i and self.token_delay:
+                time.sleep(self.token_delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
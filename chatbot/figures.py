@@ -0,0 +1,155 @@
+import io
+import itertools
+import threading
+import functools
+from contextlib import contextmanager
+import matplotlib
+matplotlib.use("Agg")  # headless rendering, also off the main thread (서버용 비대화형 백엔드)
+import matplotlib.pyplot as plt
+
+_OWNER = "_chatbot_block"   # Figure attribute: id of the managed block that created it (그래프를 만든 블록 ID)
+_blocks = itertools.count(1)
+_active = threading.local()   # stack of block ids open in this thread (이 스레드에서 열린 블록)
+
+
+def _current_block():
+    stack = getattr(_active, "stack", None)
+    return stack[-1] if stack else None
+
+
+def _track_figures():
+    # pyplot creates every figure through pyplot.figure (gcf, subplots, plt.plot ...), so wrapping it once
+    # tags each new figure with the block running in the creating thread
+    # (pyplot의 모든 그래프 생성은 pyplot.figure를 거치므로, 생성한 스레드의 블록 ID를 그래프에 기록)
+    original = plt.figure
+    if getattr(original, "_chatbot_tracked", False):
+        return
+
+    @functools.wraps(original)
+    def figure(*args, **kwargs):
+        fig = original(*args, **kwargs)
+        block = _current_block()
+        if block is not None and not hasattr(fig, _OWNER):
+            setattr(fig, _OWNER, block)
+        return fig
+
+    figure._chatbot_tracked = True
+    plt.figure = figure
+
+
+_track_figures()
+
+
+def _owned(block) -> list:
+    # open figures created inside `block`, oldest first (블록에서 생성된 열린 그래프)
+    return [manager.canvas.figure for manager in plt._pylab_helpers.Gcf.get_all_fig_managers()
+            if getattr(manager.canvas.figure, _OWNER, None) == block]
+
+
+@contextmanager
+def _block():
+    block = next(_blocks)
+    stack = getattr(_active, "stack", None)
+    if stack is None:
+        stack = _active.stack = []
+    stack.append(block)
+    try:
+        yield block
+    finally:
+        stack.remove(block)
+
+
+class FigureSession:
+    """Figures opened between the start and the end of one managed render (렌더링 1회 동안 생성된 그래프)"""
+
+    def __init__(self, figure, block):
+        self.figure = figure
+        self._block = block
+
+    def figures(self) -> list:
+        return _owned(self._block)
+
+    def drawn(self):
+        """The figure the code drew on: the current one if it has axes, else the newest with axes (그린 그래프)"""
+        current = plt.gcf()
+        if getattr(current, _OWNER, None) == self._block and current.get_axes():
+            return current
+        drawn = [fig for fig in self.figures() if fig.get_axes()]
+        return drawn[-1] if drawn else None
+
+
+class FigureManager:
+    """
+    Lifecycle of matplotlib figures made for chatbot charts (챗봇 차트용 matplotlib 그래프 수명 관리)
+    - session(): opens an explicit Figure per request and makes it current, so pyplot-style generated
+      code draws on it; every figure opened during the request is closed when it ends
+    - collect(): closes the figures a block of code opened in its own thread, without claiming pyplot
+      for the duration (used around the agent call, whose python tool draws charts in the server process)
+    - figures are attributed to the block that created them, so one session never closes another's;
+      at most `max_live` figures of a block stay open, the oldest ones are closed beyond that
+
+    Parameters:
+    max_live : int - cap on open figures per managed block (블록당 열린 그래프 최대 개수)
+    """
+
+    def __init__(self, max_live: int = 4):
+        self.max_live = max_live
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self, **figure_kwargs):
+        # pyplot's "current figure" is process-wide, so one managed render at a time (현재 그래프는 전역 상태)
+        with self._lock, _block() as block:
+            figure = plt.figure(num=f"chatbot-{next(self._ids)}", **figure_kwargs)
+            try:
+                yield FigureSession(figure, block)
+            finally:
+                self._close(block)
+
+    @contextmanager
+    def collect(self):
+        with _block() as block:
+            try:
+                yield
+            finally:
+                self._close(block)
+
+    def enforce_cap(self, block):
+        """Close the oldest figures of `block` beyond max_live (블록의 오래된 그래프 정리)"""
+        figures = _owned(block)
+        for fig in figures[:max(len(figures) - self.max_live, 0)]:
+            plt.close(fig)
+
+    @staticmethod
+    def _close(block):
+        for fig in _owned(block):
+            plt.close(fig)
+
+    @staticmethod
+    def live() -> int:
+        return len(plt.get_fignums())
+
+    def render_code(self, code: str, namespace: dict, dpi: int = 100) -> bytes:
+        """
+        Parameters:
+        code : str - pyplot code, e.g. generated by the pandas agent (pyplot 코드)
+        namespace : dict - globals for the code, usually {"df": ..., "plt": plt, ...} (실행 네임스페이스)
+        dpi : int - output resolution (해상도)
+
+        Returns:
+        bytes - PNG of the figure the code drew; the figure is closed afterwards (그래프 PNG)
+        """
+        with self.session() as session:
+            exec(code, namespace)
+            figure = session.drawn()
+            if figure is None:
+                raise ValueError("the code did not draw a chart")
+            self.enforce_cap(session._block)
+            buf = io.BytesIO()
+            figure.savefig(buf, format="png", dpi=dpi)
+            return buf.getvalue()
+
+
+# Shared by the process: server threads and sandbox workers each have their own (프로세스당 1개)
+figure_manager = FigureManager()
@@ -0,0 +1,166 @@
+import math
+from typing import Any, Optional
+from dataclasses import dataclass
+import pandas as pd
+from pydantic import Field
+from langchain_experimental.tools.python.tool import PythonAstREPLTool, sanitize_input
+
+SAMPLE_NAME = "df_sample"
+
+
+def estimate_tokens(text: str) -> int:
+    # about 4 bytes of UTF-8 per token: 4 ASCII characters or 1-2 Hangul syllables (토큰 수 추정)
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def _clip(text: str, tokens: int) -> str:
+    data = text.encode("utf-8")
+    return data[:tokens * 4].decode("utf-8", errors="ignore") if len(data) > tokens * 4 else text
+
+
+@dataclass
+class FrameBudget:
+    """
+    Size limits for what the pandas agent sees of a dataset (pandas 에이전트에 보이는 데이터 크기 제한)
+
+    Parameters:
+    max_rows : int - rows of the exploration sample `df_sample` (탐색용 표본 행 수)
+    max_columns : int - columns in the prompt preview and in `df_sample` (미리보기/표본 열 수)
+    head_rows : int - preview rows in the prompt (프롬프트 미리보기 행 수)
+    prompt_tokens : int - digest + preview in the system prompt (프롬프트 데이터 설명 토큰 예산)
+    output_tokens : int - one python tool result handed back to the LLM (도구 실행 결과 1건의 토큰 예산)
+    """
+    max_rows: int = 1000
+    max_columns: int = 20
+    head_rows: int = 3
+    prompt_tokens: int = 1200
+    output_tokens: int = 800
+
+
+@dataclass
+class AgentPrompt:
+    """
+    The per-dataset part of a pandas agent, pooled while the agent itself is built per call
+    (데이터셋별로 재사용하는 에이전트 구성 요소)
+
+    Parameters:
+    suffix : str - prompt suffix with the digest and the preview (요약/미리보기가 포함된 프롬프트)
+    view : pd.DataFrame - exploration sample exposed as `df_sample` (탐색용 표본)
+    budget : FrameBudget - size limits the prompt was built with (프롬프트 생성에 사용한 예산)
+    """
+    suffix: str
+    view: pd.DataFrame
+    budget: FrameBudget
+
+
+def prune_columns(frame: pd.DataFrame, max_columns: int) -> list:
+    """Columns worth exploring: all-null and single-valued ones are dropped, the digest reports them (탐색할 열 선택)"""
+    keep = [name for name in frame.columns if frame[name].nunique(dropna=True) > 1]
+    return keep[:max_columns]
+
+
+def explore_view(frame: pd.DataFrame, budget: FrameBudget) -> pd.DataFrame:
+    """
+    Pruned and sampled view of `frame` for exploration (탐색용 축소 데이터)
+    At most budget.max_rows rows, drawn with a fixed seed and kept in the original order,
+    so time series still read top to bottom.
+    """
+    view = frame[prune_columns(frame, budget.max_columns)]
+    if len(view) > budget.max_rows:
+        view = view.sample(n=budget.max_rows, random_state=0).sort_index()
+    return view
+
+
+def fit_lines(text: str, tokens: int) -> str:
+    """First lines of `text` that fit in `tokens`, with a note of how many were left out (예산에 맞게 줄 단위로 자르기)"""
+    lines = text.splitlines()
+    kept, used = [], 0
+    for i, line in enumerate(lines):
+        cost = estimate_tokens(line + "\n")
+        if used + cost > tokens:
+            kept.append(f"... ({len(lines) - i} more lines)")
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+def preview(view: pd.DataFrame, frame: pd.DataFrame, budget: FrameBudget) -> str:
+    """First rows of the pruned view as markdown, naming the columns it leaves out (프롬프트용 미리보기)"""
+    text = view.head(budget.head_rows).to_markdown()
+    hidden = [str(name) for name in frame.columns if name not in view.columns]
+    if hidden:
+        text += f"\n(not shown: {', '.join(hidden)})"
+    return text
+
+
+def sample_note(view: pd.DataFrame, frame: pd.DataFrame) -> str:
+    """Prompt lines telling the agent when to use df_sample and when df (표본/전체 데이터 사용 안내)"""
+    if len(view) == len(frame) and len(view.columns) == len(frame.columns):
+        return ""
+    return (f"`{SAMPLE_NAME}` holds {len(view)} sampled rows and {len(view.columns)} columns of `df` "
+            f"({len(frame)} rows, {len(frame.columns)} columns). Use it to look at values or try out code, "
+            "then compute the final numbers and charts on the full `df`.\n")
+
+
+class BoundedPythonTool(PythonAstREPLTool):
+    """
+    The pandas agent's python tool with a size limit on what goes back to the LLM (출력 크기가 제한된 파이썬 도구)
+    Code still runs on the full data; only the printed result is clipped to `output_tokens`.
+    """
+
+    output_tokens: int = 800
+
+    def _run(self, query: str, run_manager=None):
+        result = super()._run(query, run_manager)
+        text = result if isinstance(result, str) else str(result)
+        if estimate_tokens(text) <= self.output_tokens:
+            return result
+        return (_clip(text, self.output_tokens) +
+                f"\n... [output clipped to about {self.output_tokens} tokens; "
+                "aggregate, filter or use .head() instead of printing whole columns]")
+
+
+def bound_agent(agent, view: pd.DataFrame, budget: FrameBudget):
+    """
+    Swap the agent's python tool for a BoundedPythonTool that also sees `df_sample`
+    (에이전트 파이썬 도구를 출력 제한 도구로 교체하고 df_sample 추가)
+    """
+    for i, tool in enumerate(agent.tools):
+        if isinstance(tool, PythonAstREPLTool) and not isinstance(tool, BoundedPythonTool):
+            agent.tools[i] = BoundedPythonTool(locals={**tool.locals, SAMPLE_NAME: view}, globals=tool.globals,
+                                               output_tokens=budget.output_tokens)
+    return agent
+
+
+class SandboxChartTool(PythonAstREPLTool):
+    """
+    The pandas agent's python tool for chart requests: the code is sent to the sandbox workers and never
+    runs in the server process (시각화 요청용 파이썬 도구, 코드는 샌드박스에서만 실행)
+    Each chart drawn is kept in `charts` as PNG bytes; errors go back to the LLM so it can fix the code.
+    """
+
+    sandbox: Any = None
+    key: Optional[str] = None
+    charts: list = Field(default_factory=list)
+
+    def _run(self, query: str, run_manager=None):
+        if self.sanitize_input:
+            query = sanitize_input(query)
+        try:
+            self.charts.append(self.sandbox.render(self.locals["df"], query, key=self.key))
+        except Exception as e:   # SandboxError, or the sandbox could not take the dataset (샌드박스 실행 실패)
+            return f"{type(e).__name__}: {e}"
+        return "The chart was drawn and shown to the user."
+
+
+def chart_agent(agent, sandbox, key: str = None) -> SandboxChartTool:
+    """
+    Swap the agent's python tool for a SandboxChartTool running on `sandbox` and return it, so the
+    caller can read the charts once the agent finished (파이썬 도구를 샌드박스 시각화 도구로 교체)
+    """
+    for i, tool in enumerate(agent.tools):
+        if isinstance(tool, PythonAstREPLTool):
+            agent.tools[i] = SandboxChartTool(locals=tool.locals, sandbox=sandbox, key=key)
+            return agent.tools[i]
+    raise ValueError("the agent has no python tool")
@@ -0,0 +1,118 @@
+import io
+import uuid
+import threading
+from collections import OrderedDict
+from PIL import Image, features
+
+SESSION_KEY = "chat_images"
+IMAGE_PREFIX = "img:"
+MIN_SIDE = 240
+
+
+def _encode(image: Image.Image) -> bytes:
+    # lossless WebP keeps chart text sharp and is several times smaller than PNG;
+    # optimized PNG where Pillow was built without WebP (WebP 무손실, 없으면 최적화 PNG)
+    buf = io.BytesIO()
+    if features.check("webp"):
+        image.save(buf, format="WEBP", lossless=True, method=4)
+    else:
+        image.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+class ImageStore:
+    """
+    Per-session store for generated chat images (세션별 챗봇 이미지 저장소)
+    Images are downsampled to `max_side` pixels, compressed, and kept in an LRU bounded by
+    `max_bytes` and `max_images`; chat messages only hold the returned ID.
+    An image larger than `max_bytes` on its own is downscaled further until it fits, and the newest
+    image is never evicted. An evicted image is shown as a small placeholder instead.
+
+    Parameters:
+    max_bytes : int - total compressed size kept per session (세션당 최대 용량)
+    max_images : int - number of images kept per session (세션당 최대 개수)
+    max_side : int - longest side in pixels after downsampling (최대 변 길이)
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024**2, max_images: int = 40, max_side: int = 960):
+        self.max_bytes = max_bytes
+        self.max_images = max_images
+        self.max_side = max_side
+        self._images = OrderedDict()   # id -> encoded bytes
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, image) -> str:
+        """
+        Parameters:
+        image : bytes, BytesIO or PIL.Image - e.g. the PNG from the visualization sandbox (이미지)
+
+        Returns:
+        str - ID to keep in the chat message (메시지에 저장할 이미지 ID)
+        """
+        if isinstance(image, (bytes, bytearray)):
+            image = io.BytesIO(image)
+        if not isinstance(image, Image.Image):
+            image = Image.open(image)
+        image = image.convert("RGBA") if image.mode in ("P", "LA") else image
+        image.thumbnail((self.max_side, self.max_side), Image.LANCZOS)
+        data = _encode(image)
+        # halve the image until it fits the store on its own (단독으로 용량을 넘으면 절반씩 축소)
+        while len(data) > self.max_bytes and max(image.size) > MIN_SIDE:
+            image.thumbnail((max(image.size) // 2, max(image.size) // 2), Image.LANCZOS)
+            data = _encode(image)
+
+        image_id = IMAGE_PREFIX + uuid.uuid4().hex
+        with self._lock:
+            self._images[image_id] = data
+            self._size += len(data)
+            # older images make room; the one just stored is always kept (새 이미지는 항상 유지)
+            while len(self._images) > 1 and (self._size > self.max_bytes or len(self._images) > self.max_images):
+                _, old = self._images.popitem(last=False)
+                self._size -= len(old)
+        return image_id
+
+    def get(self, image_id: str):
+        with self._lock:
+            data = self._images.get(image_id)
+            if data is not None:
+                self._images.move_to_end(image_id)
+            return data
+
+    def __len__(self):
+        return len(self._images)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+_placeholder = None
+
+
+def _expired_placeholder() -> bytes:
+    global _placeholder
+    if _placeholder is None:
+        buf = io.BytesIO()
+        Image.new("RGB", (320, 40), (235, 235, 235)).save(buf, format="PNG")
+        _placeholder = buf.getvalue()
+    return _placeholder
+
+
+def session_image_store() -> ImageStore:
+    """ImageStore of the current Streamlit session, created on first use (현재 세션의 이미지 저장소)"""
+    import streamlit as st
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = ImageStore()
+    return st.session_state[SESSION_KEY]
+
+
+def chat_image(content):
+    """
+    Image content for st.image from a chat message: stored ID -> compressed bytes,
+    anything else (older BytesIO messages, paths) is returned unchanged (메시지의 이미지 내용 변환)
+    """
+    if isinstance(content, str) and content.startswith(IMAGE_PREFIX):
+        data = session_image_store().get(content)
+        return data if data is not None else _expired_placeholder()
+    return content
@@ -0,0 +1,91 @@
+import time
+import threading
+from collections import OrderedDict
+import pandas as pd
+from analyzer.figureCache import frame_hash
+
+
+class LLMResourcePool:
+    """
+    Process-wide pool of chatbot resources reused across messages and sessions (LLM 자원 풀)
+    - the LLM client and the character chain are created once
+    - one agent prompt (dataset digest, preview, exploration sample) per dataset, evicted after `idle_ttl`
+      seconds without use or when more than `max_prompts` datasets are held (least recently used first)
+    - the agent and its python tool are built per call on top of the pooled LLM and prompt: the tool's
+      namespace holds the code's variables, so sharing it would leak one session's `df` changes to the next
+      (파이썬 도구의 네임스페이스는 호출마다 새로 생성, 세션 간 df 변경 공유 방지)
+
+    Parameters:
+    create_llm : callable() -> LLM client (LLM 생성 함수)
+    create_chain : callable(llm) -> runnable chain (체인 생성 함수)
+    create_prompt : callable(df, **options) -> agent prompt for the dataset (에이전트 프롬프트 생성 함수)
+    create_agent : callable(llm, df, prompt) -> dataframe agent (에이전트 생성 함수)
+    """
+
+    def __init__(self, create_llm, create_chain, create_prompt, create_agent,
+                 idle_ttl: float = 600, max_prompts: int = 8):
+        self._create_llm = create_llm
+        self._create_chain = create_chain
+        self._create_prompt = create_prompt
+        self._create_agent = create_agent
+        self.idle_ttl = idle_ttl
+        self.max_prompts = max_prompts
+        self._llm = None
+        self._chain = None
+        self._prompts = OrderedDict()   # key -> [prompt, last_used]
+        self._lock = threading.RLock()
+
+    def llm(self):
+        with self._lock:
+            if self._llm is None:
+                self._llm = self._create_llm()
+            return self._llm
+
+    def chain(self):
+        with self._lock:
+            if self._chain is None:
+                self._chain = self._create_chain(self.llm())
+            return self._chain
+
+    def prompt(self, frame: pd.DataFrame, key: str = None, **options):
+        """
+        Pooled agent prompt of `frame`; `key` defaults to the frame's content hash (데이터셋별 프롬프트)
+        `options` are passed to create_prompt when the prompt has to be created (생성 시 전달 옵션)
+        """
+        key = key or frame_hash(frame)
+        now = time.monotonic()
+        with self._lock:
+            self.evict_idle(now)
+            entry = self._prompts.get(key)
+            if entry is None:
+                entry = self._prompts[key] = [self._create_prompt(frame, **options), now]
+                while len(self._prompts) > self.max_prompts:
+                    self._prompts.popitem(last=False)
+            entry[1] = now
+            self._prompts.move_to_end(key)
+            return entry[0]
+
+    def agent(self, frame: pd.DataFrame, key: str = None, **options):
+        """New agent for one call on `frame`, built from the pooled LLM and prompt (호출 1회용 에이전트)"""
+        return self._create_agent(self.llm(), frame, self.prompt(frame, key, **options))
+
+    def evict_idle(self, now: float = None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for key in [k for k, (_, used) in self._prompts.items() if now - used > self.idle_ttl]:
+                del self._prompts[key]
+
+    def use_llm(self, create_llm):
+        """Replace the LLM factory; the client and chain built on the old one are dropped (LLM 생성 함수 교체)"""
+        with self._lock:
+            self._create_llm = create_llm
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._llm = None
+            self._chain = None
+            self._prompts.clear()
+
+    def __len__(self):
+        return len(self._prompts)
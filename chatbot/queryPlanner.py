@@ -0,0 +1,338 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import pandas as pd
+
+# Korean words mapped to the English column tokens they refer to (한글 용어 → 컬럼 토큰)
+KOREAN_ALIASES = {
+    "선사": ["ship", "company"], "회사": ["company"], "업체": ["company"], "기업": ["company"],
+    "항구": ["harbor", "port"], "항만": ["harbor", "port"], "포트": ["port"],
+    "선박": ["ship"], "선박수": ["ship", "count"], "선박 수": ["ship", "count"], "척": ["ship", "count"],
+    "물동량": ["weight"], "중량": ["weight"], "무게": ["weight"],
+    "톤수": ["gt", "gross", "tonnage"], "연도": ["year"], "년도": ["year"], "월별": ["month"],
+    "업종": ["category"], "가격": ["price"], "금액": ["price"], "수량": ["count"], "건수": ["count"],
+    "월세": ["month", "price"], "보증금": ["depossit", "price"], "면적": ["size"], "크기": ["size"],
+    "층": ["floor"], "위도": ["latitude"], "경도": ["longitude"], "대표": ["ceo"], "주소": ["address"],
+}
+
+# Aggregate words, checked in this order (집계 키워드)
+OPERATIONS = [
+    ("mean", r"\baverage\b|\bmean\b|\bavg\b|평균"),
+    ("sum", r"\btotal\b|\bsum\b|합계|총합|합산|총\s"),
+    ("max", r"\bmax(?:imum)?\b|\bhighest\b|\blargest\b|\bbiggest\b|\bmost\b|최대|최고|가장\s*(?:많|높|큰)"),
+    ("min", r"\bmin(?:imum)?\b|\blowest\b|\bsmallest\b|\bleast\b|\bfewest\b|최소|최저|가장\s*(?:적|낮|작)"),
+    ("count", r"\bhow many\b|\bnumber of\b|\bcount of\b|몇|개수"),
+]
+_OPERATIONS = [(name, re.compile(pattern)) for name, pattern in OPERATIONS]
+# words that make "count" part of the target, e.g. "how many ships" -> Ship count (개수를 묻는 표현)
+_COUNTING = re.compile(r"\bhow many\b|\bnumber of\b|\bmost\b|\bfewest\b|몇|많은|적은")
+_WHICH = re.compile(r"\bwhich\b|\bwhat\s+[a-z]+\s+(?:has|had|is|was|have)\b|\btop\b|어느|어떤|어디|상위|가장")
+_TOP = re.compile(r"\btop\s*(\d+)|상위\s*(\d+)|(\d+)\s*(?:개|곳|위)(?!월)")
+_YEAR = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+_GROUP_EN = re.compile(r"\b(?:by|per|each|every|for each)\s+([a-z]+(?:\s+[a-z]+)?)")
+_GROUP_KR = re.compile(r"([가-힣]+)별")
+_YEARLY = re.compile(r"\byearly\b|\bannual(?:ly)?\b|매년|연간")
+_MONTHLY = re.compile(r"\bmonth(?:ly|s)?\b|매월|월별")
+_GENERIC = {"name", "the", "of", "a"}
+# label values used for subtotal rows in the source tables, e.g. "항만명" in koreaAllHarbors is the
+# national total of each month; such rows are left out so sums and rankings are not doubled
+# (원본 표의 합계 행 라벨: 합계/순위 계산에서 제외)
+TOTAL_LABELS = {"항만명", "합계", "총계", "소계", "전체", "total", "sum"}
+MAX_GROUP_ROWS = 30
+MAX_PLANNERS = 16
+
+
+def _tokens(text: str) -> set:
+    # lowercase English words with a plural "s" removed (영단어 토큰, 복수형 제거)
+    return {_singular(w) for w in re.findall(r"[a-z]+", text)}
+
+
+def _singular(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _alias_sets(column: str) -> list:
+    """Token sets that name `column`: the full name, the part outside and inside parentheses (컬럼 별칭)"""
+    name = unicodedata.normalize("NFKC", str(column)).lower()
+    outside = re.sub(r"\([^)]*\)", " ", name)
+    inside = " ".join(re.findall(r"\(([^)]*)\)", name))
+    sets = []
+    for part in (name, outside, inside):
+        tokens = (_tokens(part) | set(re.findall(r"[가-힣]+", part))) - _GENERIC
+        if tokens and tokens not in sets:
+            sets.append(tokens)
+    return sets
+
+
+@dataclass
+class QueryPlan:
+    """Aggregate question resolved against a DataFrame schema (데이터프레임 스키마로 해석된 집계 질문)"""
+    op: str
+    target: str = None
+    group: str = None
+    rank: str = None            # "max", "min" or "top" over the groups (그룹 순위)
+    n: int = 5
+    filters: dict = field(default_factory=dict)
+    year_filter: list = None
+
+
+class QueryPlanner:
+    """
+    Answers simple aggregate questions with vectorized pandas, no LLM involved (LLM 없이 pandas로 집계 질문 응답)
+    Supported: mean / sum / max / min / count of a column, optional year and category filters,
+    "by X" / "X별" groupings and "which X has the most Y" / "top N" rankings.
+    plan() returns None whenever anything is ambiguous, so the caller can fall back to the agent.
+
+    Parameters:
+    frame : pd.DataFrame - dataset the questions are about (질문 대상 데이터)
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        totals = pd.Series(False, index=frame.index)
+        for col in frame.columns:
+            if isinstance(frame[col].dtype, pd.CategoricalDtype) or frame[col].dtype == object:
+                totals |= frame[col].astype(str).str.strip().str.lower().isin(TOTAL_LABELS)
+        self.frame = frame[~totals] if totals.any() else frame
+        frame = self.frame
+        self.aliases = {col: _alias_sets(col) for col in frame.columns}
+        self.numeric = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+        self.labels = [c for c in frame.columns
+                       if isinstance(frame[c].dtype, pd.CategoricalDtype) or frame[c].dtype == object]
+        self.year_col = self._named(("year", "years", "연도"))
+        self.month_col = self._named(("month", "months", "월"))
+        self.dates = [c for c in frame.columns if pd.api.types.is_datetime64_any_dtype(frame[c])]
+        self._values = None
+
+    def _named(self, names):
+        for col in self.frame.columns:
+            if str(col).strip().lower() in names and pd.api.types.is_integer_dtype(self.frame[col]):
+                return col
+        return None
+
+    def _label_values(self) -> dict:
+        # category values that can appear in a question, longest first (질문에 등장할 수 있는 범주 값)
+        if self._values is None:
+            values = {}
+            for col in self.labels:
+                series = self.frame[col]
+                uniques = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) else series.dropna().unique()
+                if len(uniques) <= 200:
+                    for value in uniques:
+                        text = unicodedata.normalize("NFKC", str(value)).lower().strip()
+                        if len(text) >= 2:
+                            values.setdefault(text, []).append((col, value))
+            self._values = sorted(values.items(), key=lambda item: -len(item[0]))
+        return self._values
+
+    # ---------- parsing (질문 해석) ----------
+    def _columns_for(self, text: str, tokens: set, candidates) -> list:
+        """Columns whose alias is fully mentioned, most specific first (언급된 컬럼)"""
+        found = []
+        for col in candidates:
+            best = 0
+            for alias in self.aliases[col]:
+                if all(t in tokens or (re.match(r"[가-힣]", t) and t in text) for t in alias):
+                    best = max(best, len(alias))
+            if best:
+                found.append((best, col))
+        found.sort(key=lambda item: -item[0])
+        if len(found) > 1 and found[0][0] == found[1][0]:
+            return []   # two equally good columns: ambiguous (동점이면 모호함)
+        return [col for _, col in found]
+
+    def _group_column(self, phrase: str, korean: bool = False):
+        if korean:
+            if phrase in ("연도", "년도", "연", "년"):
+                return self.year_col or (self.dates[0] if self.dates else None)
+            if phrase == "월":
+                return self.month_col
+            tokens = set(KOREAN_ALIASES.get(phrase, []))
+            text = phrase
+        else:
+            tokens = _tokens(phrase)
+            text = phrase
+            if tokens & {"year"}:
+                return self.year_col or (self.dates[0] if self.dates else None)
+            if tokens & {"month"}:
+                return self.month_col
+        columns = self._columns_for(text, tokens, self.labels)
+        if columns:
+            return columns[0]
+        # a partial name is enough when it fits one column only: "per category" (부분 이름도 유일하면 허용)
+        partial = [c for c in self.labels if tokens and any(tokens <= alias for alias in self.aliases[c])]
+        return partial[0] if len(partial) == 1 else None
+
+    def plan(self, question: str):
+        text = unicodedata.normalize("NFKC", question).lower()
+        ops = [name for name, pattern in _OPERATIONS if pattern.search(text)]
+        if not ops and not _TOP.search(text):
+            return None
+        ops = ops or ["sum"]
+
+        # explicit grouping: "by year", "per company", "선사별" (명시적 그룹)
+        group = None
+        for pattern, korean in ((_GROUP_EN, False), (_GROUP_KR, True)):
+            for m in pattern.finditer(text):
+                group = group or self._group_column(m.group(1), korean)
+            text_wo = pattern.sub(" ", text)
+            if group is not None:
+                text = text_wo
+                break
+        if group is None and _YEARLY.search(text):
+            group = self.year_col or (self.dates[0] if self.dates else None)
+        elif group is None and _MONTHLY.search(text):
+            group = self.month_col
+
+        # filters: years and category values named in the question (연도/범주 값 필터)
+        plan = QueryPlan(op=ops[0], group=group)
+        years = sorted({int(y) for y in _YEAR.findall(text)})
+        if years:
+            if self.year_col is None and not self.dates:
+                return None
+            available = self._years()
+            if not set(years) <= set(available):
+                return None
+            plan.year_filter = years
+            text = _YEAR.sub(" ", text)
+        for value_text, owners in self._label_values():
+            if value_text in text:
+                if len({col for col, _ in owners}) > 1:
+                    return None
+                col, value = owners[0]
+                plan.filters.setdefault(col, []).append(value)
+                text = text.replace(value_text, " ")
+
+        tokens = _tokens(text)
+        for word, extra in KOREAN_ALIASES.items():
+            if word in text:
+                tokens.update(extra)
+        if _COUNTING.search(text):
+            tokens.add("count")
+
+        excluded = {group, *plan.filters}
+        numeric = self._columns_for(text, tokens, [c for c in self.numeric if c not in excluded
+                                                   and c not in (self.year_col, self.month_col)])
+        labels = self._columns_for(text, tokens, [c for c in self.labels if c not in excluded])
+
+        # ranking over the groups: "which harbor has the most ...", "which month had ...", "상위 5개 선사"
+        # (the category may be named implicitly; 범주 이름이 암시적이어도 순위 계산)
+        top = _TOP.search(text)
+        which = _WHICH.search(text) or top
+        if which and numeric and (group is not None or labels):
+            rank = [op for op in ops if op in ("max", "min")]
+            plan.group = group if group is not None else labels[0]
+            plan.rank = "top" if top or not rank else rank[0]
+            plan.n = int(next(g for g in top.groups() if g)) if top and any(top.groups()) else 5
+            base = [op for op in ops if op in ("mean", "sum")]
+            plan.op = base[0] if base else "sum"
+            plan.target = numeric[0]
+            return plan
+        if which:
+            return None   # asks for a category but none could be ranked: a scalar would be wrong (순위를 만들 수 없음)
+
+        if "count" in ops:
+            counted = [c for c in numeric if "count" in _tokens(str(c).lower())]
+            if counted:
+                plan.op, plan.target = "sum", counted[0]
+            elif labels and not numeric:
+                plan.op, plan.target = "nunique", labels[0]
+            else:
+                return None
+            return plan
+
+        if len(set(ops)) > 1 or not numeric:
+            return None
+        plan.target = numeric[0]
+        return plan
+
+    # ---------- execution (실행) ----------
+    def _years(self):
+        if self.year_col is not None:
+            return self.frame[self.year_col].dropna().unique().tolist()
+        return self.frame[self.dates[0]].dt.year.dropna().unique().tolist()
+
+    def execute(self, plan: QueryPlan):
+        frame = self.frame
+        mask = pd.Series(True, index=frame.index)
+        if plan.year_filter:
+            years = frame[self.year_col] if self.year_col is not None else frame[self.dates[0]].dt.year
+            mask &= years.isin(plan.year_filter)
+        for col, values in plan.filters.items():
+            mask &= frame[col].isin(values)
+        frame = frame[mask]
+        if frame.empty:
+            return None
+        group = plan.group
+        if group is None and plan.year_filter and len(plan.year_filter) > 1:
+            group = self.year_col or self.dates[0]
+
+        if group is None:
+            return _format_number(frame[plan.target].agg(plan.op))
+
+        keys = frame[group]
+        if pd.api.types.is_datetime64_any_dtype(keys):
+            keys = keys.dt.year.rename(group)
+        grouped = frame[plan.target].groupby(keys, observed=True).agg(plan.op)
+        if plan.rank == "max":
+            return f"{grouped.idxmax()} ({_format_number(grouped.max())})"
+        if plan.rank == "min":
+            return f"{grouped.idxmin()} ({_format_number(grouped.min())})"
+        if plan.rank == "top":
+            grouped = grouped.nlargest(plan.n)
+            return "\n".join(f"{i}. {key}: {_format_number(v)}" for i, (key, v) in enumerate(grouped.items(), 1))
+        if len(grouped) > MAX_GROUP_ROWS:
+            return None
+        return "\n".join(f"- {key}: {_format_number(v)}" for key, v in grouped.items())
+
+
+def _format_number(value) -> str:
+    if pd.isna(value):
+        return "-"
+    if float(value).is_integer():
+        return f"{int(value):,}"
+    return f"{value:,.2f}"
+
+
+_planners = OrderedDict()
+_planners_lock = threading.Lock()
+
+
+def _planner(frame: pd.DataFrame, key: str = None) -> QueryPlanner:
+    # planners keep the schema and category values of a dataset, so reuse them per dataset key (데이터셋별 재사용)
+    if key is None:
+        return QueryPlanner(frame)
+    with _planners_lock:
+        planner = _planners.get(key)
+        if planner is not None:
+            _planners.move_to_end(key)
+            return planner
+    planner = QueryPlanner(frame)
+    with _planners_lock:
+        _planners[key] = planner
+        while len(_planners) > MAX_PLANNERS:
+            _planners.popitem(last=False)
+    return planner
+
+
+def fast_answer(frame: pd.DataFrame, question: str, key: str = None):
+    """
+    Parameters:
+    frame : pd.DataFrame - selected dataset (선택된 데이터셋)
+    question : str - user message (사용자 질문)
+    key : str - dataset content hash; reuses the parsed schema when given (데이터 해시)
+
+    Returns:
+    str or None - answer computed with pandas, None when the question needs the agent (에이전트가 필요하면 None)
+    """
+    planner = _planner(frame, key)
+    try:
+        plan = planner.plan(question)
+        return None if plan is None else planner.execute(plan)
+    except (KeyError, ValueError, TypeError, IndexError):
+        return None
@@ -0,0 +1,162 @@
+import re
+import threading
+
+VISUALIZATION = "visualization"
+EDA = "eda"
+CHAT = "chat"
+
+# Keywords that signal a visualization request (시각화 요청 판단용 키워드 리스트)
+VISUALIZATION_KEYWORDS = [
+    # English keywords (50)
+    "plot", "graph", "chart", "visualize", "visualization", "display", "show", "draw", "render",
+    "hist", "histogram", "bar", "bar chart", "line", "line chart", "scatter", "scatter plot",
+    "pie", "pie chart", "map", "heatmap", "boxplot", "box plot", "area", "area chart",
+    "bubble chart", "density", "distribution", "trend", "time series", "stacked chart",
+    "stacked bar", "grouped bar", "plotly", "matplotlib", "seaborn", "bokeh", "dash", "altair",
+    "ggplot", "candlestick", "gantt", "choropleth", "treemap", "sunburst", "violin plot",
+    "pairplot", "facet", "grid plot", "interactive chart",
+
+    # Korean keywords (50)
+    "시각화", "시각화해줘", "그래프", "그래프 그려줘", "히스토그램", "히스토그램 그려줘", "막대그래프",
+    "막대그래프 그려줘", "산점도", "산점도 그려줘", "파이차트", "파이차트 그려줘", "꺾은선그래프",
+    "꺾은선그래프 그려줘", "선형그래프", "선형그래프 그려줘", "분포도", "분포도 그려줘", "상자그림",
+    "상자그림 그려줘", "지도", "지도 그려줘", "열지도", "밀도그래프", "밀도차트", "트렌드", "시계열",
+    "누적그래프", "누적차트", "군집도", "집단그래프", "산점그래프", "선그래프", "점그래프", "시계열그래프",
+    "인사이트 시각화", "수치 시각화", "분석 시각화", "데이터 시각화", "컬러맵", "컬러히트맵", "계층그래프",
+    "트리맵", "선버스트", "비올린플롯", "조합그래프", "여러 그래프", "복합 그래프", "분산 그래프"
+]
+
+# Keywords that signal a general EDA question (일반 데이터 분석 질문 키워드)
+EDA_KEYWORDS = [
+    "data", "column", "row", "mean", "sum", "describe",
+    "데이터", "컬럼", "행", "열", "요약", "평균", "eda"
+]
+
+# Fallback examples for questions without any keyword (키워드가 없는 질문용 분류 예시)
+FALLBACK_EXAMPLES = {
+    VISUALIZATION: [
+        "draw it for me", "plot this by year", "make a chart of the ports", "can you chart the trend",
+        "그려줘", "차트로 보여줘", "그림으로 보여줘", "연도별로 그려줘", "비교 차트 만들어줘",
+    ],
+    EDA: [
+        "how many ships arrived", "which port has the most cargo", "what is the maximum value",
+        "what is the minimum", "average dwell time per company", "total count by year", "top 5 companies",
+        "compare 2022 and 2023", "what is the highest price", "how much did it increase", "list the unique values",
+        "몇 척이야", "가장 많은 항구는", "최대값은", "최솟값 알려줘", "연도별 합계", "상위 5개 선사",
+        "개수 알려줘", "얼마나 증가했어", "가장 높은 가격은", "2023년과 비교해줘", "몇 개야",
+    ],
+    CHAT: [
+        "hello", "hi there", "who are you", "what is your name", "thank you", "thanks a lot",
+        "good morning", "how are you", "tell me a joke", "what is the weather today",
+        "안녕", "안녕하세요", "너는 누구야", "이름이 뭐야", "고마워", "감사합니다", "날씨 어때", "농담해줘",
+    ],
+}
+
+_HANGUL = re.compile(r"[ㄱ-ㆎ가-힣]")
+
+
+def _trie_pattern(words) -> str:
+    """
+    Regex for a keyword set built from a character trie, so shared prefixes are tested once
+    and matching stays linear in the question length (공통 접두사를 묶은 트라이 정규식)
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        end = node.get("", False)
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def _keyword_pattern(words) -> str:
+    # English keywords must start a word ("bar" is not in "harbor"); Korean ones match anywhere,
+    # because particles attach directly to the noun (영어는 단어 시작에서만, 한글은 어디서나 일치)
+    words = {w.lower() for w in words}
+    korean = sorted(w for w in words if _HANGUL.search(w))
+    english = sorted(words - set(korean))
+    parts = []
+    if english:
+        parts.append(r"\b" + _trie_pattern(english))
+    if korean:
+        parts.append(_trie_pattern(korean))
+    return "|".join(parts)
+
+
+class IntentRouter:
+    """
+    Routes a chatbot question to the visualization, EDA or character-chat path (질문 의도 분류기)
+    1) one compiled regex holding every keyword, visualization keywords taking priority over EDA ones
+    2) questions without a keyword go to a TF-IDF (character n-gram) nearest-example classifier,
+       and to the character chat when nothing is similar enough
+
+    Parameters:
+    threshold : float - minimum cosine similarity for the fallback classifier (최소 유사도)
+    """
+
+    def __init__(self, visualization_keywords=VISUALIZATION_KEYWORDS, eda_keywords=EDA_KEYWORDS,
+                 examples=FALLBACK_EXAMPLES, threshold: float = 0.35):
+        self.pattern = re.compile(
+            f"(?P<{VISUALIZATION}>{_keyword_pattern(visualization_keywords)})|(?P<{EDA}>{_keyword_pattern(eda_keywords)})"
+        )
+        self.examples = examples
+        self.threshold = threshold
+        self._vectorizer = None
+        self._matrix = None
+        self._labels = None
+        self._lock = threading.Lock()
+
+    def match(self, question: str):
+        """Intent from the keywords only, None when no keyword appears (키워드 기반 의도)"""
+        found = {m.lastgroup for m in self.pattern.finditer(question.lower())}
+        if VISUALIZATION in found:
+            return VISUALIZATION
+        return EDA if EDA in found else None
+
+    def _fit(self):
+        # fitted on first use; a few dozen short examples (첫 사용 시 학습)
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        with self._lock:
+            if self._vectorizer is None:
+                labels = [label for label, texts in self.examples.items() for _ in texts]
+                texts = [text for texts in self.examples.values() for text in texts]
+                vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True)
+                self._matrix = vectorizer.fit_transform(texts)
+                self._labels = labels
+                self._vectorizer = vectorizer
+
+    def classify(self, question: str):
+        """(intent, similarity) of the most similar fallback example (가장 유사한 예시의 의도)"""
+        self._fit()
+        scores = (self._matrix @ self._vectorizer.transform([question.lower()]).T).toarray().ravel()
+        best = int(scores.argmax())
+        return self._labels[best], float(scores[best])
+
+    def route(self, question: str) -> str:
+        """
+        Parameters:
+        question : str - user message (사용자 질문)
+
+        Returns:
+        str - "visualization", "eda" or "chat" (경로 이름)
+        """
+        intent = self.match(question)
+        if intent is not None:
+            return intent
+        intent, score = self.classify(question)
+        return intent if score >= self.threshold else CHAT
+
+
+# Shared by every chatbot session in the process (프로세스 전체에서 공유)
+intent_router = IntentRouter()
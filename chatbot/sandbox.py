@@ -0,0 +1,258 @@
+import os
+import atexit
+import signal
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import pyarrow as pa
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_DIR = os.path.join(ROOT_DIR, "Fonts")
+
+
+class SandboxError(RuntimeError):
+    """Generated code failed, timed out or ran out of memory in the sandbox (샌드박스 실행 실패)"""
+
+
+# ---------- worker side (작업 프로세스) ----------
+_frames = OrderedDict()   # dataset key -> (frame, shared memory block), per worker
+_retired = []             # evicted blocks still referenced by zero-copy columns (아직 참조 중인 해제 대기 블록)
+_WORKER_FRAMES = 4
+
+
+def _virtual_memory() -> int:
+    # current address-space size in bytes, Linux only (현재 가상 메모리 크기)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _init_worker(memory_mb: int):
+    # pre-warm: headless backend, heavy imports and the Korean font, before any request arrives
+    # (요청 전에 Agg 백엔드/라이브러리/한글 폰트 준비)
+    from . import figures  # noqa: F401  (selects the Agg backend)
+    import matplotlib.pyplot as plt
+    import matplotlib.font_manager as fm
+    import numpy  # noqa: F401  (generated code imports it almost every time)
+
+    # same settings as setting_llm.fontSetting (setting_llm.fontSetting과 같은 설정)
+    font_files = fm.findSystemFonts(fontpaths=FONT_DIR) if os.path.isdir(FONT_DIR) else []
+    if font_files:
+        fm.fontManager.addfont(font_files[0])
+        plt.rc("font", family="Malgun Gothic")
+    plt.rcParams["axes.unicode_minus"] = False
+
+    # copy-on-write: each run gets a shallow view of the cached frame, and a column is copied only when
+    # the generated code writes to it, so runs cannot change the cache (수정되는 열만 복사, 캐시 보호)
+    pd.set_option("mode.copy_on_write", True)
+
+    # memory cap on top of what the warmed-up worker already uses (워커 기본 사용량 + 허용 메모리)
+    if memory_mb:
+        try:
+            import resource
+            limit = _virtual_memory() + memory_mb * 1024**2
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass   # Windows has no RLIMIT_AS; the wall-clock timeout still applies (윈도우는 시간 제한만 적용)
+
+
+def _attach_frame(key: str, shm_name: str, size: int) -> pd.DataFrame:
+    entry = _frames.get(key)
+    if entry is not None:
+        _frames.move_to_end(key)
+        return entry[0]
+    # spawned workers share the server's resource tracker, so the block stays owned by the server
+    # (워커는 서버와 같은 resource tracker를 사용하므로 블록 해제는 서버가 담당)
+    block = shared_memory.SharedMemory(name=shm_name)
+    table = pa.ipc.open_stream(pa.py_buffer(block.buf[:size])).read_all()
+    frame = table.to_pandas()
+    del table
+    _frames[key] = (frame, block)
+    while len(_frames) > _WORKER_FRAMES:
+        _, (old_frame, old_block) = _frames.popitem(last=False)
+        del old_frame
+        _retired.append(old_block)
+    # close blocks once the zero-copy columns pointing into them are gone (참조가 사라진 블록만 닫기)
+    for old_block in list(_retired):
+        try:
+            old_block.close()
+            _retired.remove(old_block)
+        except BufferError:
+            pass
+    return frame
+
+
+def _on_alarm(signum, frame):
+    # not TimeoutError: the server treats that as a stuck worker and restarts the pool (워커 재시작과 구분)
+    raise SandboxError("visualization code timed out")
+
+
+def _render(key: str, shm_name: str, size: int, code: str, timeout: float) -> bytes:
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from .figures import figure_manager
+
+    frame = _attach_frame(key, shm_name, size)
+    namespace = {"df": frame.copy(deep=False), "pd": pd, "np": np, "plt": plt}
+    # code written against the agent's exploration sample is drawn from the full data (차트는 전체 데이터로 그림)
+    namespace["df_sample"] = namespace["df"]
+    use_alarm = hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        # explicit figure per request, closed afterwards (요청마다 그래프를 만들고 끝나면 닫음)
+        return figure_manager.render_code(code, namespace)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _ping():
+    return os.getpid()
+
+
+# ---------- server side (서버 프로세스) ----------
+class VizSandbox:
+    """
+    Runs chatbot-generated plotting code in a pool of pre-warmed worker processes (생성된 시각화 코드 격리 실행)
+    - each dataset is written once to shared memory (Arrow IPC) and read by the workers,
+      instead of copying the frame in the server for every request
+    - every run has a wall-clock timeout and the workers have a memory cap
+    - the result is PNG bytes; a stuck worker is killed and the pool restarted,
+      so other sessions keep being served
+
+    Parameters:
+    max_workers : int - worker processes (작업 프로세스 수)
+    timeout : float - seconds allowed per run (실행 제한 시간)
+    memory_mb : int - extra memory a worker may allocate, 0 for no cap (워커당 허용 메모리)
+    """
+
+    def __init__(self, max_workers: int = 2, timeout: float = 20, memory_mb: int = 1024, max_datasets: int = 8):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.max_datasets = max_datasets
+        self._executor = None
+        self._blocks = OrderedDict()   # dataset key -> (shared memory, size)
+        self._pins = {}                # block name -> renders in flight that read it (사용 중인 렌더 수)
+        self._evicted = {}             # block name -> block dropped from the LRU while pinned (해제 대기 블록)
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork the threaded Streamlit server (스레드가 있는 서버는 fork하지 않음)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker, initargs=(self.memory_mb,))
+                for _ in range(self.max_workers):
+                    self._executor.submit(_ping)
+            return self._executor
+
+    def warm_up(self):
+        """Start the workers ahead of the first chart request (첫 요청 전에 워커 시작)"""
+        self._pool()
+
+    def _restart(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            for process in list((executor._processes or {}).values()):
+                process.kill()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _free(block):
+        block.close()
+        block.unlink()
+
+    def _publish(self, frame: pd.DataFrame, key: str):
+        # the returned block is pinned until _unpin, so eviction cannot unlink it before the worker
+        # attaches (반환된 블록은 워커가 읽을 때까지 해제하지 않음)
+        with self._lock:
+            entry = self._blocks.get(key)
+            if entry is not None:
+                self._blocks.move_to_end(key)
+                self._pins[entry[0].name] = self._pins.get(entry[0].name, 0) + 1
+                return entry[0].name, entry[1]
+            sink = pa.BufferOutputStream()
+            table = pa.Table.from_pandas(frame, preserve_index=True)
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            data = sink.getvalue()
+            block = shared_memory.SharedMemory(create=True, size=max(data.size, 1))
+            block.buf[:data.size] = memoryview(data).cast("B")
+            self._blocks[key] = (block, data.size)
+            self._pins[block.name] = 1
+            while len(self._blocks) > self.max_datasets:
+                _, (old, _) = self._blocks.popitem(last=False)
+                if self._pins.get(old.name):
+                    self._evicted[old.name] = old
+                else:
+                    self._free(old)
+            return block.name, data.size
+
+    def _unpin(self, name: str):
+        with self._lock:
+            pins = self._pins.get(name, 0) - 1
+            if pins > 0:
+                self._pins[name] = pins
+                return
+            self._pins.pop(name, None)
+            block = self._evicted.pop(name, None)
+            if block is not None:
+                self._free(block)
+
+    def render(self, frame: pd.DataFrame, code: str, key: str = None) -> bytes:
+        """
+        Parameters:
+        frame : pd.DataFrame - dataset the code sees as `df` (코드에서 df로 사용할 데이터)
+        code : str - generated matplotlib code (생성된 시각화 코드)
+        key : str - dataset content hash; computed when omitted (데이터 해시)
+
+        Returns:
+        bytes - PNG image of the figure the code drew (그래프 PNG)
+        """
+        if key is None:
+            from analyzer.figureCache import frame_hash
+            key = frame_hash(frame)
+        name, size = self._publish(frame, key)
+        try:
+            future = self._pool().submit(_render, key, name, size, code, self.timeout)
+            # a little grace over the worker's own alarm before killing it (워커 자체 타이머 이후 강제 종료)
+            return future.result(timeout=self.timeout + 5)
+        except SandboxError:
+            raise
+        except FutureTimeout:
+            self._restart()
+            raise SandboxError(f"visualization code did not finish in {self.timeout:.0f}s")
+        except BrokenProcessPool:
+            self._restart()
+            raise SandboxError("visualization worker crashed (out of memory?)")
+        except MemoryError:
+            raise SandboxError(f"visualization code exceeded the {self.memory_mb}MB memory cap")
+        except Exception as e:
+            raise SandboxError(f"{type(e).__name__}: {e}") from None
+        finally:
+            self._unpin(name)
+
+    def close(self):
+        self._restart()
+        with self._lock:
+            for block in [block for block, _ in self._blocks.values()] + list(self._evicted.values()):
+                self._free(block)
+            self._blocks.clear()
+            self._evicted.clear()
+            self._pins.clear()
+
+
+# Shared by every session; workers start on the first chart request (모든 세션 공유, 첫 요청 시 시작)
+viz_sandbox = VizSandbox()
@@ -0,0 +1,73 @@
+import queue
+import threading
+from langchain_core.callbacks import BaseCallbackHandler
+
+_DONE = object()
+
+
+class _TokenHandler(BaseCallbackHandler):
+    # forwards the text tokens of every LLM call the agent makes; tool-call turns carry no text
+    # (에이전트의 LLM 호출 토큰 전달, 도구 호출 단계는 텍스트가 없으므로 제외)
+    def __init__(self, tokens: queue.Queue):
+        self._tokens = tokens
+
+    def on_llm_new_token(self, token: str, *, chunk=None, **kwargs):
+        message = getattr(chunk, "message", None)
+        if token and not getattr(message, "tool_call_chunks", None):
+            self._tokens.put(token)
+
+
+class AgentStream:
+    """
+    Final-answer tokens of a pandas agent run, for st.write_stream (에이전트 최종 응답 토큰 스트림)
+    The agent runs in a worker thread and its tokens reach the Streamlit script through a queue,
+    so the first words are shown while the answer is still being generated. If the LLM does not
+    stream tokens, the whole answer is yielded once at the end. After the iteration, `result` holds
+    the agent's output dict.
+
+    Parameters:
+    run : callable(config) -> dict - the agent call, e.g. lambda config: agent.invoke(question, config=config) (에이전트 실행 함수)
+    on_done : callable(str) - called with the complete answer, e.g. to cache it (완료 시 호출)
+    """
+
+    def __init__(self, run, on_done=None):
+        self._run = run
+        self._on_done = on_done
+        self._tokens = queue.Queue()
+        self._error = None
+        self.result = None
+
+    def _work(self):
+        try:
+            self.result = self._run({"callbacks": [_TokenHandler(self._tokens)]})
+        except Exception as e:
+            self._error = e
+        finally:
+            self._tokens.put(_DONE)
+
+    def __iter__(self):
+        # daemon: a rerun that abandons the stream does not keep the server from exiting (재실행 시 서버 종료를 막지 않음)
+        worker = threading.Thread(target=self._work, name="agent-stream", daemon=True)
+        worker.start()
+        streamed = False
+        while True:
+            token = self._tokens.get()
+            if token is _DONE:
+                break
+            streamed = True
+            yield token
+        worker.join()
+        if self._error is not None:
+            raise self._error
+
+        output = self.result["output"]
+        if not streamed:
+            yield output
+        if self._on_done is not None:
+            self._on_done(output)
+
+
+def text_stream(text):
+    """An already complete answer as a one-chunk stream (완성된 응답을 한 번에 출력하는 스트림)"""
+    if text:
+        yield text
@@ -0,0 +1,4 @@
+from .registry import load_dataset, load_csv, load_geojson, dataset_digest, dataset_hash, DATASETS
+from .parsing import parse_number
+from .digest import build_digest, digest_text
+from .tieredCache import TieredCache
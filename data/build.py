@@ -0,0 +1,174 @@
+import os
+import sys
+import json
+import fnmatch
+import hashlib
+import argparse
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from .files import ROOT_DIR, resolve_path, relative_path, file_hash
+from .schemas import SCHEMAS, SCHEMA_VERSION
+from .parsing import parse_number
+from .digest import build_digest, DIGEST_VERSION
+
+# Columnar artifacts mirror useData/ under this folder (useData/ 구조를 그대로 따르는 parquet 저장 위치)
+SOURCE_DIR = os.path.join(ROOT_DIR, "useData")
+ARTIFACT_DIR = os.path.join(SOURCE_DIR, "parquet")
+
+_META_KEY = b"busanport.build"
+_DIGEST_KEY = b"busanport.digest"
+
+
+def artifact_path(csv_path: str) -> str:
+    rel = os.path.relpath(csv_path, SOURCE_DIR)
+    return os.path.join(ARTIFACT_DIR, os.path.splitext(rel)[0] + ".parquet")
+
+
+def _options_hash(read_kwargs: dict) -> str:
+    return hashlib.sha1(json.dumps(read_kwargs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _column_dtype(column: str, dtypes: dict):
+    if column in dtypes:
+        return dtypes[column]
+    for pattern, dtype in dtypes.items():
+        if fnmatch.fnmatchcase(column, pattern):
+            return dtype
+    return None
+
+
+def read_typed_csv(csv_path: str, read_kwargs: dict) -> pd.DataFrame:
+    """
+    Parse a CSV and apply its schema from SCHEMAS (스키마에 맞춰 CSV 파싱 및 타입 변환)
+    Columns without a schema entry keep pandas' inferred dtype.
+    """
+    schema = SCHEMAS.get(relative_path(csv_path), {})
+    frame = pd.read_csv(csv_path, **read_kwargs)
+
+    for column, scale in schema.get("numbers", {}).items():
+        if column in frame.columns:
+            frame[column] = parse_number(frame[column], scale)
+
+    for column, fmt in schema.get("datetimes", {}).items():
+        if column in frame.columns:
+            frame[column] = pd.to_datetime(frame[column], format=fmt)
+
+    dtypes = schema.get("dtypes", {})
+    for column in frame.columns:
+        dtype = _column_dtype(column, dtypes)
+        if dtype is not None:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def build_artifact(csv_path: str, read_kwargs: dict, source_hash: str = None) -> pd.DataFrame:
+    """Parse `csv_path` with its schema and write the parquet artifact next to the others (parquet 생성)"""
+    frame = read_typed_csv(csv_path, read_kwargs)
+    meta = {
+        "source": relative_path(csv_path),
+        "source_sha1": source_hash or file_hash(csv_path),
+        "options_sha1": _options_hash(read_kwargs),
+        "schema_version": SCHEMA_VERSION,
+        "digest_version": DIGEST_VERSION,
+    }
+    # the chatbot digest is computed here, once per build, and travels with the artifact
+    # (챗봇용 데이터 요약은 빌드 시 한 번 계산해 parquet 메타데이터에 저장)
+    digest = build_digest(frame)
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           _META_KEY: json.dumps(meta).encode(),
+                                           _DIGEST_KEY: json.dumps(digest, ensure_ascii=False).encode()})
+    target = artifact_path(csv_path)
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # write to a temp file first so concurrent readers never see a half-written artifact (원자적 교체)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, target)
+    except OSError:
+        # read-only deployments still get the typed frame, just without the artifact (읽기 전용 환경 대비)
+        pass
+    return frame
+
+
+def _artifact_meta(target: str, key: bytes = _META_KEY):
+    try:
+        metadata = pq.read_schema(target).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = metadata.get(key)
+    return json.loads(raw) if raw else None
+
+
+def _is_fresh(meta, read_kwargs: dict, source_hash: str) -> bool:
+    return (meta is not None
+            and meta["source_sha1"] == source_hash
+            and meta["options_sha1"] == _options_hash(read_kwargs)
+            and meta["schema_version"] == SCHEMA_VERSION
+            and meta.get("digest_version") == DIGEST_VERSION)
+
+
+def load_frame(csv_path: str, read_kwargs: dict, source_hash: str) -> pd.DataFrame:
+    """
+    Read the columnar artifact for `csv_path` when it was built from the same CSV bytes,
+    options and schema version; otherwise rebuild it from the CSV (최신 parquet이 없으면 재생성)
+    """
+    if not os.path.abspath(csv_path).startswith(SOURCE_DIR + os.sep):
+        return read_typed_csv(csv_path, read_kwargs)
+    target = artifact_path(csv_path)
+    meta = _artifact_meta(target) if os.path.exists(target) else None
+    if _is_fresh(meta, read_kwargs, source_hash):
+        return pd.read_parquet(target)
+    return build_artifact(csv_path, read_kwargs, source_hash)
+
+
+def load_digest(csv_path: str, read_kwargs: dict, source_hash: str) -> dict:
+    """
+    Digest stored with the artifact of `csv_path` (see data.digest); only the parquet footer is read.
+    A stale or missing artifact is rebuilt first, and the digest is computed from the frame
+    when no artifact can be written (parquet에 저장된 데이터 요약, 없으면 재생성)
+    """
+    target = artifact_path(csv_path)
+    if os.path.abspath(csv_path).startswith(SOURCE_DIR + os.sep):
+        if not (os.path.exists(target) and _is_fresh(_artifact_meta(target), read_kwargs, source_hash)):
+            build_artifact(csv_path, read_kwargs, source_hash)
+        digest = _artifact_meta(target, _DIGEST_KEY) if os.path.exists(target) else None
+        if digest is not None:
+            return digest
+    return build_digest(load_frame(csv_path, read_kwargs, source_hash))
+
+
+def iter_sources():
+    # registered datasets keep their page read options; any other CSV uses the defaults
+    from .registry import DATASETS
+    options = {resolve_path(path): read_kwargs for path, read_kwargs in DATASETS.values()}
+    for folder, dirs, files in os.walk(SOURCE_DIR):
+        if os.path.abspath(folder).startswith(ARTIFACT_DIR):
+            continue
+        for name in sorted(files):
+            if name.endswith(".csv"):
+                path = os.path.join(folder, name)
+                yield path, options.get(os.path.normpath(path), {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build typed parquet artifacts for every CSV under useData/")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the artifact is up to date")
+    args = parser.parse_args(argv)
+
+    for path, read_kwargs in iter_sources():
+        source_hash = file_hash(path)
+        if args.force:
+            frame = build_artifact(path, read_kwargs, source_hash)
+        else:
+            frame = load_frame(path, read_kwargs, source_hash)
+        csv_size = os.path.getsize(path)
+        print(f"{relative_path(path)}: {len(frame)} rows, "
+              f"{csv_size / 1024:.1f}KB csv -> {os.path.getsize(artifact_path(path)) / 1024:.1f}KB parquet, "
+              f"{frame.memory_usage(deep=True).sum() / 1024:.1f}KB in memory")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import pandas as pd
+
+# Bump when the digest layout changes so artifacts are rebuilt with the new digest (형식 변경 시 버전 증가)
+DIGEST_VERSION = 1
+TOP_VALUES = 5
+
+
+def _scalar(value):
+    # JSON-friendly plain Python value (JSON으로 저장 가능한 값)
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat(sep=" ", timespec="minutes")
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float):
+        return round(value, 4)
+    return value
+
+
+def build_digest(frame: pd.DataFrame) -> dict:
+    """
+    Compact summary of a frame for the chatbot prompt (챗봇 프롬프트용 데이터 요약)
+    rows, and per column: dtype, nulls, distinct values, min / max / mean / std for numbers,
+    the range for datetimes and the most frequent values for text / categories.
+    """
+    columns = []
+    for name in frame.columns:
+        series = frame[name]
+        info = {"name": str(name), "dtype": str(series.dtype),
+                "nulls": int(series.isna().sum()), "unique": int(series.nunique(dropna=True))}
+        if pd.api.types.is_bool_dtype(series):
+            info["top"] = [[_scalar(k), int(v)] for k, v in series.value_counts().head(TOP_VALUES).items()]
+        elif pd.api.types.is_numeric_dtype(series):
+            info.update(min=_scalar(series.min()), max=_scalar(series.max()),
+                        mean=_scalar(series.mean()), std=_scalar(series.std()))
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            info.update(min=_scalar(series.min()), max=_scalar(series.max()))
+        else:
+            counts = series.value_counts(dropna=True)
+            if len(counts) and counts.iloc[0] == 1:
+                # identifiers, names, phone numbers: frequencies say nothing (모두 다른 값이면 예시만)
+                info["examples"] = [_scalar(k) for k in counts.index[:2]]
+            else:
+                info["top"] = [[_scalar(k), int(v)] for k, v in counts.head(TOP_VALUES).items() if v > 0]
+        columns.append(info)
+    return {"version": DIGEST_VERSION, "rows": int(len(frame)), "columns": columns}
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.0f}" if abs(value) >= 1e5 else f"{value:.4g}"
+    return str(value)
+
+
+def digest_text(digest: dict) -> str:
+    """One line per column, e.g. "- Year (int16, 16 unique): min 2010, max 2025, mean 2017" (프롬프트용 텍스트)"""
+    lines = [f"rows: {digest['rows']}, columns: {len(digest['columns'])}"]
+    for info in digest["columns"]:
+        head = f"- {info['name']} ({info['dtype']}, {info['unique']} unique"
+        head += f", {info['nulls']} nulls)" if info["nulls"] else ")"
+        if "top" in info:
+            detail = "top " + ", ".join(f"{value} ({count})" for value, count in info["top"])
+        elif "examples" in info:
+            detail = "all distinct, e.g. " + ", ".join(str(value) for value in info["examples"])
+        else:
+            detail = ", ".join(f"{stat} {_number(info[stat])}" for stat in ("min", "max", "mean", "std") if stat in info)
+        lines.append(f"{head}: {detail}" if detail else head)
+    return "\n".join(lines)
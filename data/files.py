@@ -0,0 +1,29 @@
+import os
+import hashlib
+
+# Project root, so loaders work no matter where streamlit is launched from (실행 위치와 무관하게 경로 계산)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_path(path: str) -> str:
+    # "./useData/..." style paths are taken relative to the project root (상대 경로는 프로젝트 루트 기준)
+    if os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.normpath(os.path.join(ROOT_DIR, path))
+
+
+def relative_path(path: str) -> str:
+    return os.path.relpath(path, ROOT_DIR).replace(os.sep, "/")
+
+
+def file_stamp(path: str):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
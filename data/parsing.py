@@ -0,0 +1,45 @@
+import re
+import pandas as pd
+
+# Korean large-number units (한국어 큰 수 단위). "1억" = 100,000,000, "3만" = 30,000
+UNITS = {"억": 10**8, "만": 10**4}
+
+_NUMBER = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)"
+# "1억", "1억2000", "3만5000", "2000" ... (the trailing plain part is in `scale` units)
+_COMPOUND = re.compile(
+    "^" + "".join(f"(?:(?P<u{i}>{_NUMBER}){unit})?" for i, unit in enumerate(UNITS))
+    + f"(?P<rest>{_NUMBER})?$"
+)
+
+
+def parse_number(values, scale=1) -> pd.Series:
+    """
+    Parameters:
+    values : Series or array-like - numbers such as "4,892", "1억", "1억 2,000" or already numeric values
+             (쉼표/억 단위가 섞인 숫자 문자열)
+    scale : int - unit of the plain numbers, e.g. 1000 when the column is in 천원 (숫자 단위 배율)
+
+    Returns:
+    pd.Series - numeric values in one vectorized pass; values that cannot be parsed become NaN.
+                Plain integer columns stay int64 instead of passing through float (정수 컬럼은 int64 유지)
+
+    Unit words are absolute amounts, so with scale=1000 "2,000" -> 2,000,000 and "1억" -> 100,000,000.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series * scale if scale != 1 else series
+
+    # object dtype keeps the result on plain numpy dtypes (int64/float64) rather than nullable ones
+    text = series.astype("string").str.replace(r"[,\s]", "", regex=True).astype(object)
+    has_unit = text.str.contains("|".join(UNITS), regex=True, na=False)
+    if not has_unit.any():
+        numbers = pd.to_numeric(text, errors="coerce")
+        return numbers * scale if scale != 1 else numbers
+
+    parts = text.str.extract(_COMPOUND)
+    parsed = parts.apply(pd.to_numeric, errors="coerce")
+    result = parsed["rest"].fillna(0) * scale
+    for i, factor in enumerate(UNITS.values()):
+        result = result + parsed[f"u{i}"].fillna(0) * factor
+    # rows where nothing matched stay missing (숫자를 찾지 못한 값은 NaN)
+    return result.where(parsed.notna().any(axis=1)).rename(series.name)
@@ -0,0 +1,140 @@
+import json
+import threading
+import numpy as np
+import pandas as pd
+from .files import resolve_path, file_stamp, file_hash
+from .build import load_frame, load_digest
+
+# Named datasets used by the pages: name -> (path, read_csv options) (페이지에서 사용하는 데이터셋 목록)
+DATASETS = {
+    # (1) EDA chatbot
+    "llm_koreaAllHarbors": ("useData/forLLM_data/koreaAllHarbors.csv", {"encoding": "utf-8-sig"}),
+    "llm_busanAllPorts_GTCount": ("useData/forLLM_data/busanAllPorts_GTCount.csv", {"encoding": "utf-8-sig"}),
+    "llm_busanThreeport_position": ("useData/forLLM_data/busanThreeport_position.csv", {"encoding": "utf-8-sig"}),
+    "llm_prod_totalCountPrice_yearMonth": ("useData/forLLM_data/prod_totalCountPrice_yearMonth.csv", {"encoding": "utf-8-sig"}),
+    "llm_meatCompany": ("useData/forLLM_data/company(Meat)_LaLo.csv", {"encoding": "utf-8-sig"}),
+    "llm_foodCompany": ("useData/forLLM_data/company(Food)_LaLo.csv", {"encoding": "utf-8-sig"}),
+    "llm_vacancy_location": ("useData/forLLM_data/vacancy_location_LaLo.csv", {"encoding": "utf-8-sig"}),
+    "llm_sinhangSchedule": ("useData/forLLM_data/SinhangSchedule.csv", {"encoding": "utf-8-sig"}),
+    # (2) Ports of South Korea
+    "koreaAllHarbors_raw": ("useData/raw_koreaAllHarbors.csv", {}),
+    # (3) Top 3 Ports in Busan
+    "busanThreeport_position": ("useData/busanThreeport_position.csv", {}),
+    # (4) Correlation Analysis
+    "busanPortCorrScaled": ("useData/busanPortCorrScaled.csv", {"index_col": 0, "encoding": "utf-8-sig"}),
+    "busanPortCorrMonthlyScaled": ("useData/busanPortCorrMonthlyScaled.csv", {"index_col": 0, "encoding": "utf-8-sig"}),
+    # (5) Ship Supply Items
+    "prod_totalCount": ("useData/finishPrepro/finish_prod_totalCount.csv", {}),
+    "prod_totalPrice": ("useData/finishPrepro/finish_prod_totalPrice.csv", {}),
+    "prod_totalCountPrice_yearMonth": ("useData/finishPrepro/finish_prod_totalCountPrice_yearMonth.csv", {}),
+    "meatCompany": ("useData/finishPrepro/meat_company_LaLo.csv", {"encoding": "utf-8-sig"}),
+    "foodCompany": ("useData/finishPrepro/food_company_LaLo.csv", {"encoding": "utf-8-sig"}),
+    # (6) Logistics Warehouse
+    "vacancy_location": ("useData/finishPrepro/vacancy_locationLaLo.csv", {"encoding": "utf-8-sig"}),
+    # (7) Dwell Time Analysis
+    "sinhangSchedule_raw": ("useData/SinhangSchedule_rawData.csv", {"encoding": "utf-8-sig"}),
+    # (8) Tourist Information by Dwell Time
+    "shipsDuration_10": ("useData/shipsDuration_10.csv", {"index_col": 0}),
+    "busanSpotsCategorized": ("useData/busanSpotsCategorized.csv", {"index_col": 0, "encoding": "utf-8-sig"}),
+}
+
+BUSAN_GEOJSON = "useData/koreaBusan.geojson"
+
+# Process-wide cache shared by every session: key -> entry (모든 세션이 공유하는 프로세스 단위 캐시)
+_cache = {}
+_cache_lock = threading.Lock()
+_key_locks = {}
+
+
+def _key_lock(key):
+    with _cache_lock:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def _freeze(frame: pd.DataFrame) -> pd.DataFrame:
+    # Mark the shared numpy storage read-only so in-place writes fail instead of corrupting the cache:
+    # a numpy-backed column's to_numpy() is a view, and its .base chain leads to the array pandas writes to
+    # (공유 배열을 읽기 전용으로 설정해 캐시 오염 방지, 열 뷰의 base까지 설정)
+    for position in range(frame.shape[1]):
+        array = frame.iloc[:, position].to_numpy()
+        while isinstance(array, np.ndarray):
+            array.flags.writeable = False
+            array = array.base
+    return frame
+
+
+def _cached(path: str, key, parse):
+    """
+    Return the cached object for `key`, re-parsing only when the file really changed.
+    The mtime/size stamp is checked first; when it moved, the content hash decides
+    whether the file was rewritten with the same bytes (e.g. to_csv on every render).
+    """
+    with _key_lock(key):
+        stamp = file_stamp(path)
+        entry = _cache.get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            return entry["value"]
+
+        content_hash = file_hash(path)
+        if entry is not None and entry["hash"] == content_hash:
+            entry["stamp"] = stamp
+            return entry["value"]
+
+        value = parse(path, content_hash)
+        _cache[key] = {"stamp": stamp, "hash": content_hash, "value": value}
+        return value
+
+
+def load_csv(path: str, **read_kwargs) -> pd.DataFrame:
+    """
+    Parameters:
+    path : str - CSV path, absolute or relative to the project root (CSV 경로)
+    read_kwargs : options forwarded to pd.read_csv (pd.read_csv 옵션)
+
+    Returns:
+    pd.DataFrame - shallow copy of the cached frame; columns can be replaced freely,
+                   but the shared values are read-only (캐시 공유 데이터는 읽기 전용)
+
+    The frame comes from the typed parquet artifact of the CSV (see data.build),
+    which is rebuilt automatically when the CSV changes.
+    """
+    path = resolve_path(path)
+    key = ("csv", path, tuple(sorted(read_kwargs.items())))
+    frame = _cached(path, key, lambda p, h: _freeze(load_frame(p, read_kwargs, h)))
+    return frame.copy(deep=False)
+
+
+def load_dataset(name: str) -> pd.DataFrame:
+    """Load one of the named DATASETS through the shared cache (이름으로 데이터셋 로드)"""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    path, read_kwargs = DATASETS[name]
+    return load_csv(path, **read_kwargs)
+
+
+def dataset_digest(name: str) -> dict:
+    """Precomputed summary of a named dataset, built with its parquet artifact (데이터셋 요약, data.digest 참고)"""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    path, read_kwargs = DATASETS[name]
+    path = resolve_path(path)
+    return _cached(path, ("digest", path), lambda p, h: load_digest(p, read_kwargs, h))
+
+
+def dataset_hash(name: str) -> str:
+    """Content hash of a named dataset's CSV, re-hashed only when its mtime/size moved (데이터셋 원본 해시)"""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    path = resolve_path(DATASETS[name][0])
+    return _cached(path, ("hash", path), lambda p, h: h)
+
+
+def load_geojson(path: str = BUSAN_GEOJSON) -> dict:
+    """Parsed GeoJSON shared by all sessions; treat it as read-only (공유 객체이므로 수정 금지)"""
+    path = resolve_path(path)
+
+    def parse(p, content_hash):
+        with open(p, encoding="utf-8-sig") as f:
+            return json.load(f)
+
+    return _cached(path, ("geojson", path), parse)
@@ -0,0 +1,98 @@
+# Typed column schemas for the columnar build (컬럼형 빌드용 타입 스키마)
+# path (relative to the project root) -> options
+#   numbers   : column -> scale, parsed with data.parsing.parse_number ("4,892", "1억" 등 숫자 파싱)
+#   dtypes    : column (or fnmatch pattern) -> compact dtype (컬럼별 dtype 지정)
+#   datetimes : column -> strftime format (날짜 컬럼 형식)
+SCHEMA_VERSION = 3
+
+_HARBORS = {
+    "numbers": {"Ship count": 1, "Weight": 1},
+    "dtypes": {"Unnamed: 0": "int32", "Year": "int16", "Month": "int8",
+               "Harbor name": "category", "Ship count": "int32", "Weight": "int64"},
+}
+
+_BUSANPORT = {
+    "numbers": {"Ship Count": 1, "GT(Gross Tonnage)": 1},
+    "dtypes": {"Harbor Name": "category", "Year": "int16",
+               "Ship Count": "int32", "GT(Gross Tonnage)": "int64"},
+}
+
+_GT_COUNT = {
+    "dtypes": {"Unnamed: 0": "int32", "Harbor Name": "category", "Year": "int16",
+               "Ship Count": "int32", "GT(Gross Tonnage)": "int64"},
+}
+
+_SCHEDULE = {
+    "dtypes": {"Unnamed: 0": "int32", "Ship Company": "category"},
+    "datetimes": {"Enter Time": "%Y-%m-%d %H:%M", "Out Time": "%Y-%m-%d %H:%M"},
+}
+
+_DURATION = {
+    "dtypes": {"Unnamed: 0": "int32", "Ship Company": "category",
+               "Duration days": "int16", "Total duration(Hours)": "int32", "Stay duration(Hours)": "float32"},
+    "datetimes": {"Enter Time": "%Y-%m-%d %H:%M:%S", "Out Time": "%Y-%m-%d %H:%M:%S"},
+}
+
+_PROD = {
+    "dtypes": {"Unnamed: 0": "int32", "Years": "int16", "years": "int16", "months": "int8",
+               "count : *": "int32", "price(KR) : *": "int64"},
+}
+
+_COMPANY = {
+    "dtypes": {"Unnamed: 0": "int32", "Company category": "category"},
+}
+
+_VACANCY = {
+    "dtypes": {"Unnamed: 0": "int32", "Month Price": "int32", "Depossit Price": "int64"},
+}
+
+# Raw listing prices are in 천원 except for "억" deposits; converted to 원 like the LaLo files
+# (원본 가격은 천원 단위, "억" 표기는 그대로 원 단위로 환산)
+_VACANCY_RAW = {
+    "numbers": {"Month Price": 1000, "Depossit Price": 1000},
+    "dtypes": _VACANCY["dtypes"],
+}
+
+SCHEMAS = {
+    "useData/raw_koreaAllHarbors.csv": _HARBORS,
+    "useData/forLLM_data/koreaAllHarbors.csv": _HARBORS,
+    "useData/finishPrepro/koreaAllharbors_countWeight.csv": {
+        "dtypes": dict(_HARBORS["dtypes"]),
+        "datetimes": {"Year-Month": "%Y-%m-%d"},
+    },
+    "useData/busanport/busan_감천항_rawData.csv": _BUSANPORT,
+    "useData/busanport/busan_부산항(전체)_rawData.csv": _BUSANPORT,
+    "useData/busanport/busan_북항_rawData.csv": _BUSANPORT,
+    "useData/busanport/busan_신항_rawData.csv": _BUSANPORT,
+    "useData/finishPrepro/busanAllPorts_GTCount.csv": _GT_COUNT,
+    "useData/forLLM_data/busanAllPorts_GTCount.csv": _GT_COUNT,
+    "useData/SinhangSchedule_rawData.csv": _SCHEDULE,
+    "useData/forLLM_data/SinhangSchedule.csv": _SCHEDULE,
+    "useData/finishPrepro/shipsDuration.csv": _DURATION,
+    "useData/shipsDuration_10.csv": _DURATION,
+    "useData/finishPrepro/finish_prod_totalCount.csv": _PROD,
+    "useData/finishPrepro/finish_prod_totalPrice.csv": _PROD,
+    "useData/finishPrepro/finish_prod_totalCountPrice.csv": _PROD,
+    "useData/finishPrepro/finish_prod_totalCountPrice_yearMonth.csv": _PROD,
+    "useData/finishPrepro/prod(Year)_countPrice.csv": _PROD,
+    "useData/finishPrepro/prod(YearMonth)_countPrice.csv": _PROD,
+    "useData/forLLM_data/prod_totalCountPrice_yearMonth.csv": _PROD,
+    "useData/finishPrepro/meat_company_LaLo.csv": _COMPANY,
+    "useData/finishPrepro/food_company_LaLo.csv": _COMPANY,
+    "useData/finishPrepro/company(Meat)_LaLo.csv": _COMPANY,
+    "useData/finishPrepro/company(Food)_LaLo.csv": _COMPANY,
+    "useData/forLLM_data/company(Meat)_LaLo.csv": _COMPANY,
+    "useData/forLLM_data/company(Food)_LaLo.csv": _COMPANY,
+    "useData/finishPrepro/vacancy_location.csv": _VACANCY_RAW,
+    "useData/finishPrepro/vacancy_locationLaLo.csv": _VACANCY,
+    "useData/forLLM_data/vacancy_location_LaLo.csv": _VACANCY,
+    "useData/busanPortCorrMonthlyRaw.csv": {
+        "dtypes": {"Unnamed: 0": "int32", "Year": "int16", "Month": "int8",
+                   "CT(Cargo Throughput)": "int64"},
+        "datetimes": {"Date": "%Y-%m-%d"},
+    },
+    "useData/busanPortCorrRaw.csv": {
+        "dtypes": {"Unnamed: 0": "int32", "Year": "int16",
+                   "GT(Gross Tonnage)": "int64", "CT(Cargo Throughput)": "int64"},
+    },
+}
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class TieredCache:
+    """
+    In-memory LRU in front of a directory with one file per entry, shared by every session and process
+    (메모리 LRU + 디스크 파일 캐시, 세션/프로세스 간 공유)
+    - file names are the SHA-1 of the key; a file is one line of JSON metadata followed by the payload
+    - writes go to a temporary file and os.replace, so readers never see a partial entry
+    - reads touch the file, and the directory is trimmed to `max_bytes` / `max_files` least recently
+      used first; files another process removed in the meantime are skipped
+    - an entry whose metadata does not match `stamp`, or older than `ttl` seconds, is a miss and is removed
+    Serialization stays with the caller: put() takes the payload bytes, get() a decode(meta, payload) function.
+
+    Parameters:
+    directory : str - disk tier location (저장 경로)
+    suffix : str - file extension of the entries (파일 확장자)
+    stamp : dict - metadata every entry must carry, e.g. {"version": 2} (버전 등 일치해야 하는 메타데이터)
+    ttl : float - seconds an entry stays valid, None for no expiry (유효 기간)
+    max_items : int - entries kept in memory (메모리 보관 개수)
+    max_bytes : int - disk tier size cap, None for no cap (디스크 용량 제한)
+    max_files : int - disk tier file cap, None for no cap (디스크 파일 수 제한)
+    trim_every : int - writes between two directory trims (정리 주기, 저장 횟수)
+    """
+
+    def __init__(self, directory: str, suffix: str, stamp: dict = None, ttl: float = None, max_items: int = 256,
+                 max_bytes: int = None, max_files: int = None, trim_every: int = 1):
+        self.directory = directory
+        self.suffix = suffix
+        self.stamp = dict(stamp or {})
+        self.ttl = ttl
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.trim_every = trim_every
+        self._memory = OrderedDict()   # key -> (created, value)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + self.suffix)
+
+    def _fresh(self, created: float) -> bool:
+        return self.ttl is None or time.time() - created <= self.ttl
+
+    def get(self, key: str, decode):
+        """
+        Parameters:
+        key : str - cache key (캐시 키)
+        decode : callable(meta, payload) -> value, called on a disk hit (디스크 항목 복원 함수)
+
+        Returns:
+        the cached value, or None on a miss / stale entry (캐시 값 또는 None)
+        """
+        with self._lock:
+            if key in self._memory:
+                created, value = self._memory[key]
+                if self._fresh(created):
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                payload = f.read()
+            os.utime(path)  # mark as recently used for disk eviction (최근 사용 표시)
+        except (OSError, ValueError):
+            return None
+        if (meta.get("key") != key or any(meta.get(name) != value for name, value in self.stamp.items())
+                or not self._fresh(meta.get("created", 0))):
+            self._discard(path)
+            return None
+        value = decode(meta, payload)
+        self._remember(key, meta["created"], value)
+        return value
+
+    def put(self, key: str, value, payload: bytes, **meta):
+        """
+        Parameters:
+        key : str - cache key (캐시 키)
+        value : object kept in the memory tier and returned (메모리에 보관할 값)
+        payload : bytes - serialized value for the disk tier (디스크에 저장할 내용)
+        meta : extra metadata handed back to decode() (추가 메타데이터)
+        """
+        created = time.time()
+        self._remember(key, created, value)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self.path(key)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                header = {**meta, **self.stamp, "key": key, "created": created}
+                f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+                f.write(payload)
+            os.replace(tmp, path)
+            with self._lock:
+                self._writes += 1
+                trim = self._writes % self.trim_every == 0
+            if trim:
+                self._evict_disk()
+        except OSError:
+            # read-only deployments keep the memory tier only (읽기 전용 환경 대비)
+            pass
+        return value
+
+    def _remember(self, key: str, created: float, value):
+        with self._lock:
+            self._memory[key] = (created, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _discard(path: str):
+        # another process may have removed the file already (다른 프로세스가 먼저 삭제한 경우)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _files(self) -> list:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.endswith(self.suffix)]
+
+    def _evict_disk(self):
+        entries = []
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        expired = None if self.ttl is None else time.time() - self.ttl
+        for used, size, path in sorted(entries):
+            over = ((self.max_bytes is not None and total > self.max_bytes)
+                    or (self.max_files is not None and count > self.max_files))
+            # oldest first, so the rest is within the caps and not expired either (오래된 순이므로 이후는 유지)
+            if not over and (expired is None or used >= expired):
+                break
+            self._discard(path)
+            total -= size
+            count -= 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        for path in self._files():
+            self._discard(path)
+
+    def __len__(self):
+        return len(self._memory)
@@ -1,6 +1,8 @@
 import streamlit as st  # Import the Streamlit library (Streamlit 라이브러리 임포트)
 import pandas as pd  # Import the pandas library for data handling (데이터 처리를 위한 pandas 라이브러리 임포트)
 from setting_llm import importMyBot
+from chatbot.imageStore import chat_image
+from data import load_dataset
 
 # Set Streamlit page layout to wide (Streamlit 페이지 레이아웃을 와이드로 설정)
 st.set_page_config(layout="wide")
@@ -40,7 +42,7 @@ if selectData == ":rainbow[Time series data on foreign vessel arrivals at ports
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/koreaAllHarbors.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_koreaAllHarbors")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -52,23 +54,27 @@ if selectData == ":rainbow[Time series data on foreign vessel arrivals at ports
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -86,9 +92,16 @@ if selectData == ":rainbow[Time series data on foreign vessel arrivals at ports
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_koreaAllHarbors", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -116,7 +129,7 @@ elif selectData == ":rainbow[Time series data on the number of vessel arrivals a
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/busanAllPorts_GTCount.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_busanAllPorts_GTCount")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -128,23 +141,27 @@ elif selectData == ":rainbow[Time series data on the number of vessel arrivals a
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -162,9 +179,16 @@ elif selectData == ":rainbow[Time series data on the number of vessel arrivals a
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_busanAllPorts_GTCount", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -192,7 +216,7 @@ elif selectData == ":rainbow[Location and address data of the three major ports
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/busanThreeport_position.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_busanThreeport_position")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -204,23 +228,27 @@ elif selectData == ":rainbow[Location and address data of the three major ports
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -238,9 +266,16 @@ elif selectData == ":rainbow[Location and address data of the three major ports
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_busanThreeport_position", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -268,7 +303,7 @@ elif selectData == ":rainbow[Monthly and yearly data on the number of ship suppl
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/prod_totalCountPrice_yearMonth.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_prod_totalCountPrice_yearMonth")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -280,23 +315,27 @@ elif selectData == ":rainbow[Monthly and yearly data on the number of ship suppl
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -314,9 +353,16 @@ elif selectData == ":rainbow[Monthly and yearly data on the number of ship suppl
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_prod_totalCountPrice_yearMonth", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -344,7 +390,7 @@ elif selectData == ":rainbow[Meat company data related to shipping supplies]":
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/company(Meat)_LaLo.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_meatCompany")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -356,23 +402,27 @@ elif selectData == ":rainbow[Meat company data related to shipping supplies]":
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -390,9 +440,16 @@ elif selectData == ":rainbow[Meat company data related to shipping supplies]":
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_meatCompany", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -420,7 +477,7 @@ elif selectData == ":rainbow[Food company data related to shipping supplies]":
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/company(Food)_LaLo.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_foodCompany")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -432,23 +489,27 @@ elif selectData == ":rainbow[Food company data related to shipping supplies]":
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -466,9 +527,16 @@ elif selectData == ":rainbow[Food company data related to shipping supplies]":
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_foodCompany", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -496,7 +564,7 @@ elif selectData == ":rainbow[Vacant data around Busan's three major ports]":
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/vacancy_location_LaLo.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_vacancy_location")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -508,23 +576,27 @@ elif selectData == ":rainbow[Vacant data around Busan's three major ports]":
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -542,9 +614,16 @@ elif selectData == ":rainbow[Vacant data around Busan's three major ports]":
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_vacancy_location", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -572,7 +651,7 @@ else:
 
     with dataArea:
         with st.container(height=450):
-            readData = pd.read_csv("./useData/forLLM_data/SinhangSchedule.csv", encoding="utf-8-sig")
+            readData = load_dataset("llm_sinhangSchedule")
             st.dataframe(readData, use_container_width=True, hide_index=True)
 
     with chatBotArea:
@@ -584,23 +663,27 @@ else:
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
+            # Scrollable area for the conversation, also where a new answer is streamed
+            # (대화 내용을 표시하는 스크롤 영역, 새 응답도 이곳에 스트리밍)
+            chatArea = st.container(height=350)
+
             # If there are no previous messages, show a welcome image
             # (대화 내역이 없는 경우, 첫 화면에 환영 이미지를 표시)
             if len(st.session_state.messages) == 0:
-                with st.container(height=350):
+                with chatArea:
                     st.image("./useImage/gptReady.png")  # Welcome image (환영 이미지)
 
             else:
                 # If there are messages, render them inside a container
                 # (메시지가 있다면, 이전 대화 내역을 채팅 형식으로 렌더링)
-                with st.container(height=350):
+                with chatArea:
                     for message in st.session_state.messages:
                         if message.get("type") == "image":
                             # If the message is of type 'image', render it in chat bubble
                             # (메시지 타입이 이미지이면, 채팅 말풍선 안에 이미지 표시)
                             with st.chat_message(message["role"]):
                                 st.image(
-                                    message["content"],
+                                    chat_image(message["content"]),  # Stored image ID -> compressed image (저장된 이미지 ID → 압축 이미지)
                                     caption="Generated Visualization",  # Caption under the image (이미지 하단 캡션)
                                     use_container_width=True  # Fit image to container width (컨테이너 너비에 맞춤)
                                 )
@@ -618,9 +701,16 @@ else:
                 # (사용자의 질문을 메시지 기록에 추가)
                 st.session_state.messages.append({"role": "user", "content": userStart})
 
-                # Run the custom chatbot logic and get the system's response
-                # (사용자 입력을 바탕으로 봇 함수 실행 후 응답 수신)
-                systemAnswer = importMyBot(readData, userStart)
+                # Show the question, then stream the answer into the chat area as it is generated
+                # (질문을 표시한 뒤 응답을 생성되는 대로 채팅 영역에 출력)
+                with chatArea:
+                    with st.chat_message("user"):
+                        st.markdown(userStart)
+                    with st.chat_message("ai"):
+                        # Run the custom chatbot logic; text answers arrive token by token
+                        # (봇 함수 실행, 텍스트 응답은 토큰 단위로 표시)
+                        answerStream = importMyBot(readData, userStart, dataset="llm_sinhangSchedule", stream=True)
+                        systemAnswer = st.write_stream(answerStream) if answerStream is not None else None
 
                 # If there's a valid response, add it to the chat
                 # (유효한 응답이 있을 경우, 채팅 기록에 추가)
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from data import load_dataset
 
 st.set_page_config(layout="wide")
 
@@ -17,18 +18,14 @@ with tab_1:
 
 
     #시각화 데이터
-    koreaPorts = pd.read_csv("./useData/raw_koreaAllHarbors.csv")
+    koreaPorts = load_dataset("koreaAllHarbors_raw")
     koreaPorts = koreaPorts.iloc[:, 1:]
     koreaPorts = koreaPorts[koreaPorts["Harbor name"]!="항만명"]
     # 건수와 중량 0인것 절사
-    koreaPorts = koreaPorts[koreaPorts["Ship count"] != "0"]
-    koreaPorts = koreaPorts[koreaPorts["Ship count"] != "0"]
-
-    def notComma(x):
-        return x.replace(",","")
+    koreaPorts = koreaPorts[koreaPorts["Ship count"] != 0]
+    koreaPorts = koreaPorts[koreaPorts["Ship count"] != 0]
 
     koreaPorts_counts = koreaPorts[["Year", "Harbor name", "Ship count"]]
-    koreaPorts_counts["Ship count"] = koreaPorts_counts["Ship count"].apply(notComma)
     koreaPorts_counts["Ship count"] = koreaPorts_counts["Ship count"].astype("int32")
     koreaPorts_counts["Year"] = koreaPorts_counts["Year"].astype("str")
     koreaPorts_counts = koreaPorts_counts[koreaPorts_counts["Year"] != "2025"]
@@ -77,7 +74,6 @@ with tab_1:
 
     # 필요한 열 선택 후 쉼표 제거 및 int 변환
     koreaPorts_weights = koreaPorts[["Year", "Harbor name", "Weight"]]
-    koreaPorts_weights["Weight"] = koreaPorts_weights["Weight"].apply(notComma)
     koreaPorts_weights["Weight"] = koreaPorts_weights["Weight"].astype("int32")
     koreaPorts_weights["Year"] = koreaPorts_weights["Year"].astype("str")
     koreaPorts_weights = koreaPorts_weights[koreaPorts_weights["Year"] != "2025"]
@@ -131,8 +127,7 @@ with tab_1:
     # 부산 시각화 년도 월별
     koreaPorts_busan_countWeight = koreaPorts[koreaPorts["Harbor name"]=="부산"]
 
-    # 입항건수 : 필요한 열 선택 후 쉼표 제거 및 int 변환
-    koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].apply(notComma)
+    # 입항건수 : 필요한 열 선택 후 int 변환
     koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].astype("int32")
     koreaPorts_busan_countWeight["Year"] = koreaPorts_busan_countWeight["Year"].astype("str")
     koreaPorts_busan_countWeight = koreaPorts_busan_countWeight[koreaPorts_busan_countWeight["Year"] != "2025"]
@@ -141,15 +136,13 @@ with tab_1:
     # Filter data for the port of 'Busan' only
     koreaPorts_busan_countWeight = koreaPorts[koreaPorts["Harbor name"] == "부산"].copy()
 
-    # 1. Remove commas from 'Ship count' column and convert to integer
-    #    'Ship count' 열의 쉼표 제거 후 정수형으로 변환합니다.
-    koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].apply(notComma)
+    # 1. Convert 'Ship count' column to integer (commas are already parsed by the data build)
+    #    'Ship count' 열을 정수형으로 변환합니다. (쉼표는 데이터 빌드 단계에서 처리됨)
     koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].astype("int32")
 
-    # 2. Remove commas from 'Weight' column and convert to integer
-    #    'Weight' 열의 쉼표 제거 후 정수형으로 변환합니다.
-    #    예: "30,727,140" → 30727140 (수치 계산 가능하게 변환)
-    koreaPorts_busan_countWeight["Weight"] = koreaPorts_busan_countWeight["Weight"].str.replace(",", "").astype(int)
+    # 2. Convert 'Weight' column to integer
+    #    'Weight' 열을 정수형으로 변환합니다.
+    koreaPorts_busan_countWeight["Weight"] = koreaPorts_busan_countWeight["Weight"].astype(int)
 
     # 3. Convert 'Year' to string and filter out the year 2025
     koreaPorts_busan_countWeight["Year"] = koreaPorts_busan_countWeight["Year"].astype("str")
@@ -267,18 +260,14 @@ with tab_2:
     """, unsafe_allow_html=True)
 
     #시각화 데이터
-    koreaPorts = pd.read_csv("./useData/raw_koreaAllHarbors.csv")
+    koreaPorts = load_dataset("koreaAllHarbors_raw")
     koreaPorts = koreaPorts.iloc[:, 1:]
     koreaPorts = koreaPorts[koreaPorts["Harbor name"]!="항만명"]
     # 건수와 중량 0인것 절사
-    koreaPorts = koreaPorts[koreaPorts["Ship count"] != "0"]
-    koreaPorts = koreaPorts[koreaPorts["Ship count"] != "0"]
-
-    def notComma(x):
-        return x.replace(",","")
+    koreaPorts = koreaPorts[koreaPorts["Ship count"] != 0]
+    koreaPorts = koreaPorts[koreaPorts["Ship count"] != 0]
 
     koreaPorts_counts = koreaPorts[["Year", "Harbor name", "Ship count"]]
-    koreaPorts_counts["Ship count"] = koreaPorts_counts["Ship count"].apply(notComma)
     koreaPorts_counts["Ship count"] = koreaPorts_counts["Ship count"].astype("int32")
     koreaPorts_counts["Year"] = koreaPorts_counts["Year"].astype("str")
     koreaPorts_counts = koreaPorts_counts[koreaPorts_counts["Year"] != "2025"]
@@ -327,7 +316,6 @@ with tab_2:
 
     # 필요한 열 선택 후 쉼표 제거 및 int 변환
     koreaPorts_weights = koreaPorts[["Year", "Harbor name", "Weight"]]
-    koreaPorts_weights["Weight"] = koreaPorts_weights["Weight"].apply(notComma)
     koreaPorts_weights["Weight"] = koreaPorts_weights["Weight"].astype("int32")
     koreaPorts_weights["Year"] = koreaPorts_weights["Year"].astype("str")
     koreaPorts_weights = koreaPorts_weights[koreaPorts_weights["Year"] != "2025"]
@@ -381,8 +369,7 @@ with tab_2:
     # 부산 시각화 년도 월별
     koreaPorts_busan_countWeight = koreaPorts[koreaPorts["Harbor name"]=="부산"]
 
-    # 입항건수 : 필요한 열 선택 후 쉼표 제거 및 int 변환
-    koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].apply(notComma)
+    # 입항건수 : 필요한 열 선택 후 int 변환
     koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].astype("int32")
     koreaPorts_busan_countWeight["Year"] = koreaPorts_busan_countWeight["Year"].astype("str")
     koreaPorts_busan_countWeight = koreaPorts_busan_countWeight[koreaPorts_busan_countWeight["Year"] != "2025"]
@@ -391,15 +378,13 @@ with tab_2:
     # Filter data for the port of 'Busan' only
     koreaPorts_busan_countWeight = koreaPorts[koreaPorts["Harbor name"] == "부산"].copy()
 
-    # 1. Remove commas from 'Ship count' column and convert to integer
-    #    'Ship count' 열의 쉼표 제거 후 정수형으로 변환합니다.
-    koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].apply(notComma)
+    # 1. Convert 'Ship count' column to integer (commas are already parsed by the data build)
+    #    'Ship count' 열을 정수형으로 변환합니다. (쉼표는 데이터 빌드 단계에서 처리됨)
     koreaPorts_busan_countWeight["Ship count"] = koreaPorts_busan_countWeight["Ship count"].astype("int32")
 
-    # 2. Remove commas from 'Weight' column and convert to integer
-    #    'Weight' 열의 쉼표 제거 후 정수형으로 변환합니다.
-    #    예: "30,727,140" → 30727140 (수치 계산 가능하게 변환)
-    koreaPorts_busan_countWeight["Weight"] = koreaPorts_busan_countWeight["Weight"].str.replace(",", "").astype(int)
+    # 2. Convert 'Weight' column to integer
+    #    'Weight' 열을 정수형으로 변환합니다.
+    koreaPorts_busan_countWeight["Weight"] = koreaPorts_busan_countWeight["Weight"].astype(int)
 
     # 3. Convert 'Year' to string and filter out the year 2025
     koreaPorts_busan_countWeight["Year"] = koreaPorts_busan_countWeight["Year"].astype("str")
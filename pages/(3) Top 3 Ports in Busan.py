@@ -8,7 +8,7 @@ from folium.features import CustomIcon
 from streamlit_folium import st_folium
 import scipy.stats as stats
 from sklearn.preprocessing import MinMaxScaler
-import json
+from data import load_dataset, load_csv, load_geojson, parse_number
 
 st.set_page_config(layout="wide")
 
@@ -44,8 +44,7 @@ with tab_1:
 
     # Load GeoJSON (Busan boundary)
     busanGeo = "./useData/koreaBusan.geojson"
-    with open(busanGeo, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo)
 
     # Style for Busan region
     def myGeo_style(x):
@@ -64,7 +63,7 @@ with tab_1:
     ).add_to(targetArea)
 
     # Load port data
-    portPosition = pd.read_csv("./useData/busanThreeport_position.csv")
+    portPosition = load_dataset("busanThreeport_position")
 
     # Iterate through port data
     for i, v in portPosition.iterrows():
@@ -113,23 +112,17 @@ with tab_1:
 
     for v in range(len(myfolders)):
         if "부산항(전체)" not in myfolders[v]:
-            open_data = pd.read_csv(f"./useData/busanport/{myfolders[v]}")
+            open_data = load_csv(f"./useData/busanport/{myfolders[v]}")
             readFile_list.append(open_data)
         else:
-            totalBusanWeight = pd.read_csv(f"./useData/busanport/{myfolders[v]}")
+            totalBusanWeight = load_csv(f"./useData/busanport/{myfolders[v]}")
 
     individual_port = pd.concat(readFile_list, axis=0, ignore_index=False)
 
-    # 타입변경
-    # individual_port[["Ship Count", "GT(Gross Tonnage)"]].astype("int64") > ","로 인해 변환 불가
-
-    # , 제거 함수 정의
-    def notComma(x):
-        return x.replace(",", "")
-
+    # 타입변경 (","는 데이터 빌드 단계에서 처리됨)
     individual_port["Year"] = individual_port["Year"].astype("object")
-    individual_port["Ship Count"] = individual_port["Ship Count"].apply(notComma).astype("int64")
-    individual_port["GT(Gross Tonnage)"] = individual_port["GT(Gross Tonnage)"].apply(notComma).astype("int64")
+    individual_port["Ship Count"] = individual_port["Ship Count"].astype("int64")
+    individual_port["GT(Gross Tonnage)"] = individual_port["GT(Gross Tonnage)"].astype("int64")
 
     individual_port.to_csv("./useData/finishPrepro/busanAllPorts_GTCount.csv", encoding="utf-8-sig")
 
@@ -306,13 +299,9 @@ with tab_1:
 
 
 
-    # "," 제거 후 숫자형으로 변환
-    totalBusan_visual["Ship Count"] = totalBusan_visual["Ship Count"].astype(str).str.replace(",", "")
-    totalBusan_visual["GT(Gross Tonnage)"] = totalBusan_visual["GT(Gross Tonnage)"].astype(str).str.replace(",", "")
-
-    # 숫자형으로 안전하게 변환 (NaN 처리 포함)
-    totalBusan_visual["Ship Count"] = pd.to_numeric(totalBusan_visual["Ship Count"], errors="coerce")
-    totalBusan_visual["GT(Gross Tonnage)"] = pd.to_numeric(totalBusan_visual["GT(Gross Tonnage)"], errors="coerce")
+    # 숫자형으로 안전하게 변환 ("," 제거 및 NaN 처리 포함)
+    totalBusan_visual["Ship Count"] = parse_number(totalBusan_visual["Ship Count"])
+    totalBusan_visual["GT(Gross Tonnage)"] = parse_number(totalBusan_visual["GT(Gross Tonnage)"])
 
     # NaN 값 제거
     totalBusan_visual = totalBusan_visual.dropna(subset=["Ship Count", "GT(Gross Tonnage)"])
@@ -450,8 +439,7 @@ with tab_2:
 
     # Load GeoJSON (Busan boundary)
     busanGeo = "./useData/koreaBusan.geojson"
-    with open(busanGeo, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo)
 
     # Style for Busan region
     def myGeo_style(x):
@@ -470,7 +458,7 @@ with tab_2:
     ).add_to(targetArea)
 
     # Load port data
-    portPosition = pd.read_csv("./useData/busanThreeport_position.csv")
+    portPosition = load_dataset("busanThreeport_position")
 
     # Iterate through port data
     for i, v in portPosition.iterrows():
@@ -519,23 +507,17 @@ with tab_2:
 
     for v in range(len(myfolders)):
         if "부산항(전체)" not in myfolders[v]:
-            open_data = pd.read_csv(f"./useData/busanport/{myfolders[v]}")
+            open_data = load_csv(f"./useData/busanport/{myfolders[v]}")
             readFile_list.append(open_data)
         else:
-            totalBusanWeight = pd.read_csv(f"./useData/busanport/{myfolders[v]}")
+            totalBusanWeight = load_csv(f"./useData/busanport/{myfolders[v]}")
 
     individual_port = pd.concat(readFile_list, axis=0, ignore_index=False)
 
-    # 타입변경
-    # individual_port[["Ship Count", "GT(Gross Tonnage)"]].astype("int64") > ","로 인해 변환 불가
-
-    # , 제거 함수 정의
-    def notComma(x):
-        return x.replace(",", "")
-
+    # 타입변경 (","는 데이터 빌드 단계에서 처리됨)
     individual_port["Year"] = individual_port["Year"].astype("object")
-    individual_port["Ship Count"] = individual_port["Ship Count"].apply(notComma).astype("int64")
-    individual_port["GT(Gross Tonnage)"] = individual_port["GT(Gross Tonnage)"].apply(notComma).astype("int64")
+    individual_port["Ship Count"] = individual_port["Ship Count"].astype("int64")
+    individual_port["GT(Gross Tonnage)"] = individual_port["GT(Gross Tonnage)"].astype("int64")
 
     individual_port.to_csv("./useData/finishPrepro/busanAllPorts_GTCount.csv", encoding="utf-8-sig")
 
@@ -709,13 +691,9 @@ with tab_2:
 
 
 
-    # "," 제거 후 숫자형으로 변환
-    totalBusan_visual["Ship Count"] = totalBusan_visual["Ship Count"].astype(str).str.replace(",", "")
-    totalBusan_visual["GT(Gross Tonnage)"] = totalBusan_visual["GT(Gross Tonnage)"].astype(str).str.replace(",", "")
-
-    # 숫자형으로 안전하게 변환 (NaN 처리 포함)
-    totalBusan_visual["Ship Count"] = pd.to_numeric(totalBusan_visual["Ship Count"], errors="coerce")
-    totalBusan_visual["GT(Gross Tonnage)"] = pd.to_numeric(totalBusan_visual["GT(Gross Tonnage)"], errors="coerce")
+    # 숫자형으로 안전하게 변환 ("," 제거 및 NaN 처리 포함)
+    totalBusan_visual["Ship Count"] = parse_number(totalBusan_visual["Ship Count"])
+    totalBusan_visual["GT(Gross Tonnage)"] = parse_number(totalBusan_visual["GT(Gross Tonnage)"])
 
     # NaN 값 제거
     totalBusan_visual = totalBusan_visual.dropna(subset=["Ship Count", "GT(Gross Tonnage)"])
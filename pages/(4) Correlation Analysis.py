@@ -2,14 +2,16 @@ import streamlit as st
 import pandas as pd
 import nbformat
 from analyzer.corrAnalyzer import *
+from analyzer.figureJSON import plotly_chart
+from data import load_dataset
 # 페이지 설정
 st.set_page_config(layout="wide")
 
 st.title("Correlation Analysis", anchor=False)
 
 # 데이터 로딩
-df_yearly = pd.read_csv("useData/busanPortCorrScaled.csv", index_col=0, encoding='utf-8-sig')
-df_monthly = pd.read_csv("useData/busanPortCorrMonthlyScaled.csv", index_col=0, encoding='utf-8-sig')
+df_yearly = load_dataset("busanPortCorrScaled")
+df_monthly = load_dataset("busanPortCorrMonthlyScaled")
 
 # 분석 객체
 analyzerGTCT = CorrelationAnalyzer(df_yearly, 'GT(Gross Tonnage)', 'CT(Cargo Throughput)', time_col='Year', x_color='red',y_color='blue',scatter_color='darkorange')
@@ -41,7 +43,7 @@ with tab1:
         - <span style='color:orange; font-weight:bold; font-size:20px;'>p-value</span>: Probability that the observed correlation occurred by chance (not statistically significant if > 0.05)
         """, unsafe_allow_html=True)
 
-    st.plotly_chart(line1)
+    plotly_chart(line1)
 
     st.markdown("""
     The graph above visualizes the annual GT (Gross Tonnage) and CT (Cargo Throughput) of cargo ships arriving at Busan Port. Both GT and CT show a <span style='font-weight:bold;font-size:20px; color:orange;'>general upward trend</span>, though <span style='font-weight:bold;font-size:20px;'>outliers</span> are also identified.<br>
@@ -50,7 +52,7 @@ with tab1:
     """, unsafe_allow_html=True)
 
     scatter1_en, corr1_en, p1_en = analyzerGTCT.analyze_and_plot(language='en')
-    st.plotly_chart(scatter1_en)
+    plotly_chart(scatter1_en)
 
     st.markdown(f"""
     The graph above shows a correlation analysis between GT and CT of cargo ships entering Busan Port. <span style='font-weight:bold; font-size:20px;color:orange'>Correlation Coefficient: {round(corr1_en,4)} / 
@@ -63,7 +65,7 @@ with tab1:
     It has been confirmed that the gross tonnage (GT) of cargo ships—i.e., their size—correlates with increased cargo throughput (CT). Industry insights and GPT research also suggest that <span style='font-weight:bold; font-size:20px;'>larger ships tend to have more crew members</span>. Based on this, we hypothesized that <span style='font-weight:bold; font-size:20px;color:orange'>as cargo volume increases, unloading/loading times also increase, leading to longer vessel residence times</span>. Accordingly, we conducted the following <span style='font-weight:bold; font-size:20px;'>correlation analysis between cargo throughput and residence time</span>.
     """, unsafe_allow_html=True)
 
-    st.plotly_chart(line2)
+    plotly_chart(line2)
 
     st.markdown("""
     Both CT and residence time show a <span style='font-weight:bold; font-size:20px;color:orange'>general upward trend</span>, with some <span style='font-weight:bold; font-size:20px;'>outliers</span>.<br>
@@ -74,7 +76,7 @@ with tab1:
     """, unsafe_allow_html=True)
 
     scatter2_en, corr2_en, p2_en = analyzerCTST.analyze_and_plot(language='en')
-    st.plotly_chart(scatter2_en)
+    plotly_chart(scatter2_en)
 
     st.markdown(f"""
     The graph above visualizes the correlation between cargo ship residence time and CT at Busan Port. <span style='font-weight:bold; font-size:20px;color:orange'>Correlation Coefficient: {round(corr2_en,4)} / 
@@ -111,7 +113,7 @@ with tab2:
         """, unsafe_allow_html=True)
 
     # 연도별 GT-CT 라인그래프 설명
-    st.plotly_chart(line1, key='line1')
+    plotly_chart(line1, key='line1')
 
     st.markdown("""
     위 그래프는 년간 부산항에 입항되는 카고선 기준 GT(Gross Tonnage)와 CT(Cargo Throughput)에 대한 시계열 시각화 자료입니다. GT(Gross Tonnage)와 CT(Cargo Throughput) 모두 <span style='font-weight:bold;font-size:20px; color:orange;'>전반적으로 증가하는 추세</span>를 보이지만, 중간에 <span style='font-weight:bold;font-size:20px;'>이상치(outlier)</span>가 확인됩니다.<br>
@@ -121,7 +123,7 @@ with tab2:
 
     # GT-CT 상관관계 분석
     scatter1_kr, corr1_kr, p1_kr = analyzerGTCT.analyze_and_plot(language='kr')
-    st.plotly_chart(scatter1_kr, key='scatter1')
+    plotly_chart(scatter1_kr, key='scatter1')
 
     st.markdown(f"""
     위 그래프는 부산항에 입항되는 카고선의 GT와 CT에 대한 상관관계 분석을 시각화한 결과입니다. <span style='font-weight:bold; font-size:20px;color:orange'>상관계수 : {round(corr1_kr,4)} / 
@@ -136,7 +138,7 @@ with tab2:
     양하 및 양륙 작업에 소요되는 시간이 길어져 선박의 항만 체류시간 또한 증가할 것</span>이라는 가설을 설정하였습니다. 이러한 가설에 따라, <span style='font-weight:bold; font-size:20px;'>물동량과 선사별 체류시간 간의 상관관계를 아래와 같이 분석</span>했습니다.
     """,unsafe_allow_html=True)
 
-    st.plotly_chart(line2, key='line2')
+    plotly_chart(line2, key='line2')
 
     st.markdown("""
     CT(Cargo Throughput)와 체류시간 모두 <span style='font-weight:bold; font-size:20px;color:orange'>전반적으로 증가하는 추세</span>를 보이며, 특정 시점에서는 <span style='font-weight:bold; font-size:20px;'>이상치(outlier)</span>가 관찰됩니다.<br>
@@ -150,7 +152,7 @@ with tab2:
     # --------------------------------------------------------------------------------------
     # CT - 체류 시간 상관관계
     scatter2_kr, corr2_kr, p2_kr = analyzerCTST.analyze_and_plot(language='kr')
-    st.plotly_chart(scatter2_kr, key='scatter2')
+    plotly_chart(scatter2_kr, key='scatter2')
 
     st.markdown(f"""
     위 그래프는 부산항에 입항한 카고선의 체류시간과 CT에 대한 상관관계를 시각화 분석한 결과입니다. <span style='font-weight:bold; font-size:20px;color:orange'>상관계수 : {round(corr2_kr,4)} / 
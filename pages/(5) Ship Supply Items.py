@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 import folium
 from folium.features import CustomIcon
 from streamlit_folium import st_folium
-import json
+from data import load_dataset, load_geojson
 
 st.set_page_config(layout="wide")
 
@@ -22,7 +22,7 @@ with tab_1:
 
 
 
-    yearsCount = pd.read_csv("./useData/finishPrepro/finish_prod_totalCount.csv")
+    yearsCount = load_dataset("prod_totalCount")
     yearsCount = yearsCount.iloc[:,1:]
     # 컬럼명 변경 : count : 제외
     yc_columns = yearsCount.columns
@@ -164,7 +164,7 @@ with tab_1:
     """, unsafe_allow_html=True)
 
 
-    yearsPrice = pd.read_csv("./useData/finishPrepro/finish_prod_totalPrice.csv")
+    yearsPrice = load_dataset("prod_totalPrice")
     yearsPrice = yearsPrice.iloc[:,1:]
 
     #영문 번역걸럼으로 대체
@@ -302,7 +302,7 @@ with tab_1:
     ''', unsafe_allow_html=True)
 
     # Food, Meat, Alcohol, ship parts 추세
-    trend_data = pd.read_csv("./useData/finishPrepro/finish_prod_totalCountPrice_yearMonth.csv")
+    trend_data = load_dataset("prod_totalCountPrice_yearMonth")
     trend_data = trend_data.iloc[:,1:]
 
     #식품
@@ -519,8 +519,8 @@ with tab_1:
 
 
     #기업데이터 불러오기
-    meatCompany_info = pd.read_csv("./useData/finishPrepro/meat_company_LaLo.csv", encoding="utf-8-sig")
-    foodCompany_info = pd.read_csv("./useData/finishPrepro/food_company_LaLo.csv", encoding="utf-8-sig")
+    meatCompany_info = load_dataset("meatCompany")
+    foodCompany_info = load_dataset("foodCompany")
 
     meatCompany_info = meatCompany_info.iloc[:,1:]
     foodCompany_info = foodCompany_info.iloc[:,1:]
@@ -545,8 +545,7 @@ with tab_1:
 
     busanGeo = "./useData/koreaBusan.geojson"
 
-    with open(busanGeo, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo)
 
     # Geo 스타일 함수
     def myGeo_style(x):
@@ -659,7 +658,7 @@ with tab_2:
     """, unsafe_allow_html=True)
 
 
-    yearsCount = pd.read_csv("./useData/finishPrepro/finish_prod_totalCount.csv")
+    yearsCount = load_dataset("prod_totalCount")
     yearsCount = yearsCount.iloc[:,1:]
     # 컬럼명 변경 : count : 제외
     yc_columns = yearsCount.columns
@@ -798,7 +797,7 @@ with tab_2:
     다음은 <span style='color:white; font-weight:bold; font-size:20px;'>선용품 품목별 총 판매금액</span>에 대한 시각화 분석을 진행했습니다.
     """, unsafe_allow_html=True)
 
-    yearsPrice = pd.read_csv("./useData/finishPrepro/finish_prod_totalPrice.csv")
+    yearsPrice = load_dataset("prod_totalPrice")
     yearsPrice = yearsPrice.iloc[:,1:]
 
     #영문 번역걸럼으로 대체
@@ -936,7 +935,7 @@ with tab_2:
     ''', unsafe_allow_html=True)
 
     # Food, Meat, Alcohol, ship parts 추세
-    trend_data = pd.read_csv("./useData/finishPrepro/finish_prod_totalCountPrice_yearMonth.csv")
+    trend_data = load_dataset("prod_totalCountPrice_yearMonth")
     trend_data = trend_data.iloc[:,1:]
 
     #식품
@@ -1151,8 +1150,8 @@ with tab_2:
     """, unsafe_allow_html=True)
 
     #기업데이터 불러오기
-    meatCompany_info = pd.read_csv("./useData/finishPrepro/meat_company_LaLo.csv", encoding="utf-8-sig")
-    foodCompany_info = pd.read_csv("./useData/finishPrepro/food_company_LaLo.csv", encoding="utf-8-sig")
+    meatCompany_info = load_dataset("meatCompany")
+    foodCompany_info = load_dataset("foodCompany")
 
     meatCompany_info = meatCompany_info.iloc[:,1:]
     foodCompany_info = foodCompany_info.iloc[:,1:]
@@ -1177,8 +1176,7 @@ with tab_2:
 
     busanGeo = "./useData/koreaBusan.geojson"
 
-    with open(busanGeo, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo)
 
     # Geo 스타일 함수
     def myGeo_style(x):
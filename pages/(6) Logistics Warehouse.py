@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 import folium
 from folium.features import CustomIcon
 from streamlit_folium import st_folium
-import json
+from data import load_dataset, load_geojson
 
 st.set_page_config(layout="wide")
 
@@ -24,7 +24,7 @@ with tab_1:
     <br><span style='color:red; font-weight:bold; font-size:15px;'>(* Due to confidentiality policies of real estate agencies, detailed vacancy addresses and building names were not publicly available. Therefore, we gathered, processed, and visualized data by searching areas near the three major port addresses.)</span>
     """, unsafe_allow_html=True)
 
-    vacancyData = pd.read_csv("./useData/finishPrepro/vacancy_locationLaLo.csv", encoding="utf-8-sig")
+    vacancyData = load_dataset("vacancy_location")
     vacancyData["FloorType"] = ["지하" if "B" in v else "지상" for v in vacancyData["Floor"]]
 
    # 예시 전처리 함수
@@ -73,8 +73,7 @@ with tab_1:
 
     # 부산 geojson 적용
     busanGeo = "./useData/koreaBusan.geojson"
-    with open(busanGeo, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo)
 
     def myGeo_style(x):
         return {
@@ -164,7 +163,7 @@ with tab_2:
     <br><span style='color:red; font-weight:bold; font-size:15px;'>(데이터 출처에서 부동산 중개소의 영업관련 기밀로 공실관련 빌딩명, 공실 세부주소를 공개하지 않아, 3대 항구별 주소 입력 후 그 인근에 검색되는 데이터를 수집/가공/시각화 했습니다.)</span>
     """, unsafe_allow_html=True)
 
-    vacancyData_2 = pd.read_csv("./useData/finishPrepro/vacancy_locationLaLo.csv", encoding="utf-8-sig")
+    vacancyData_2 = load_dataset("vacancy_location")
     vacancyData_2["FloorType"] = ["지하" if "B" in v else "지상" for v in vacancyData_2["Floor"]]
 
    # 예시 전처리 함수
@@ -213,8 +212,7 @@ with tab_2:
 
     # 부산 geojson 적용
     busanGeo_2 = "./useData/koreaBusan.geojson"
-    with open(busanGeo_2, encoding="utf-8-sig") as f:
-        myGeo = json.load(f)
+    myGeo = load_geojson(busanGeo_2)
 
     def myGeo_style(x):
         return {
@@ -2,9 +2,27 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from data import load_dataset, dataset_hash
+from analyzer.dwellTime import add_duration_columns, STAY_COL, STAY_OUTLIER_HOURS
+from analyzer.dwellStore import shared_store
+from analyzer.boxSummary import sketch_box_figure
 
 st.set_page_config(layout="wide")
 
+def schedule_table():
+    schedule = load_dataset("sinhangSchedule_raw")
+    schedule = schedule.iloc[:,1:]
+    #-체류기간(일,시간) 및 총 시간 : Duration of stay (days, hours, total hours)
+    return add_duration_columns(schedule)
+
+
+def dwell_store():
+    # The schedule is only read when its CSV changed since the last sync (e.g. by warmup.py);
+    # otherwise every chart below comes from the persisted company/month aggregates
+    # (원본 CSV가 바뀐 경우에만 스케줄을 읽고, 그 외에는 저장된 선사/연월 집계만 사용)
+    return shared_store("sinhangSchedule_raw", schedule_table, version=dataset_hash("sinhangSchedule_raw"))
+
+
 st.title("Vessel Dwell Time Analysis by Shipping Company", anchor=False)
 
 tab_1, tab_2, tab_3 = st.tabs(["Analysis Process(EN)", "Analysis Process(KR)", "Data Preprocessing"])
@@ -25,69 +43,21 @@ with tab_1:
     Accordingly, we collected and visualized data on the shipping companies and their stay durations by year/month/day for vessels entering New Port.
     ''', unsafe_allow_html=True)
 
-    schedule = pd.read_csv("./useData/SinhangSchedule_rawData.csv", encoding="utf-8-sig")
-    schedule = schedule.iloc[:,1:]
-    #형변환 : Date_time
-    #-함수 정의
-    def changeDateType(x):
-        changeDate = pd.to_datetime(x)
-        return changeDate
-
-    #-형변환
-    schedule["Enter Time"] = changeDateType(schedule["Enter Time"])
-    schedule["Out Time"] = changeDateType(schedule["Out Time"])
-    schedule["Day difference"] = schedule["Enter Time"] - schedule["Out Time"]
-
-    #-체류기간(일,시간) : Duration of stay (days, hours)
-    Dd_list = list(schedule["Day difference"])
-    Duration_days_list = list()
-    Duration_hourss_list = list()
-
-    for v in Dd_list:
-        v = str(v)
-        v_edit = v.replace(" ","").replace("days","").replace("-","").split("+")
-        Duration_days_list.append(v_edit[0])
-        Duration_hourss_list.append(v_edit[1])
-
-    schedule["Duration days"] = Duration_days_list
-    schedule["Duration hours"] = Duration_hourss_list
-
-    #-체류기간 총 시간
-    calculate_hour_list = list()
-    for v in schedule["Duration days"]:
-        v = int(v)
-        change_hour = v*24
-        calculate_hour_list.append(change_hour)
-
-    hourToInt = [v.split(":")[0] for v in schedule["Duration hours"]]
-
-    sumHour_list = [int(i) + int(v) for i,v in zip(calculate_hour_list, hourToInt)]
-
-    schedule["Total duration(Hours)"] = sumHour_list
-
-    schedule_duration = schedule[["Ship Company", "Total duration(Hours)"]].copy()
-
-    # 평균 계산
-    schedule_duration = schedule.groupby("Ship Company")["Total duration(Hours)"].mean()
-
-    # 리스트로 분리 저장
-    avg_shipName_list = list(schedule_duration.index)
-    avgTime_list = list(schedule_duration.values)
+    #-선사별 평균 체류시간 (평균 내림차순) : 선사/연월 집계 저장소에서 조회
+    store = dwell_store()
+    schedule_duration = store.company_stats()["mean"]
 
     # 데이터프레임 생성
     avgDuration_ships = pd.DataFrame({
-        "Ship name": avg_shipName_list,
-        "Avg time": avgTime_list
+        "Ship name": list(schedule_duration.index),
+        "Avg time": schedule_duration.values
     })
 
-    avgDuration_ships = avgDuration_ships.sort_values(["Avg time"],ascending=False).reset_index().iloc[:,1:]
-
-    #평균시간이 긴 10개 선사
     avgDuration_ships_top10 = avgDuration_ships.iloc[:9,:]
 
-    duration_fig = px.box(
-        schedule,
-        y="Total duration(Hours)",
+    duration_fig = sketch_box_figure(
+        {" ": store.sketch()},
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -106,7 +76,7 @@ with tab_1:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -119,8 +89,8 @@ with tab_1:
 
     st.markdown('''
     Typically, the <span style='color:white; font-weight:bold; font-size:20px;'>average stay duration by ship type</span> is shown in the table below.
-    However, based on our actual data analysis, there were cases where <span style='color:orange; font-weight:bold; font-size:20px;'>the average stay duration by shipping company reached up to 59 hours</span>.
-    We considered such values as outliers, excluded them, and re-visualized the data.
+    However, based on our actual data analysis, <span style='color:orange; font-weight:bold; font-size:20px;'>individual stays reached up to 151 hours</span>, far above the upper whisker of the box plot (3rd quartile + 1.5 × IQR ≈ 36 hours).
+    We considered the stays over 36 hours (about 5.6% of all calls) as outliers, excluded them, and re-visualized the data.
     ''', unsafe_allow_html=True)
 
     new_time_df = pd.DataFrame({
@@ -130,12 +100,10 @@ with tab_1:
 
     st.dataframe(new_time_df, hide_index=True, use_container_width=True)
 
-    schedule_removeAnomaly = schedule[schedule["Total duration(Hours)"] <=59]
-    schedule_removeAnomaly[["Ship Company","Enter Time", "Out Time", "Duration days", "Duration hours", "Total duration(Hours)"]].to_csv("./useData/finishPrepro/shipsDuration.csv")
-
-    duration_fig_1 = px.box(
-    schedule_removeAnomaly,
-    y="Total duration(Hours)",
+    #-이상치 제거 (shipsDuration.csv 저장은 warmup.py에서 수행)
+    duration_fig_1 = sketch_box_figure(
+    {" ": store.sketch().within(high=STAY_OUTLIER_HOURS)},
+    y=STAY_COL,
     title="Residence Time by Shipping Company",
     )
 
@@ -154,7 +122,7 @@ with tab_1:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -167,7 +135,7 @@ with tab_1:
     st.plotly_chart(duration_fig_1, use_container_width=True, key="kr_duration_anomaly_en")
 
     st.markdown('''
-    From the graph above, we confirmed that <span style='color:orange; font-weight:bold; font-size:20px;'>the maximum stay duration for large cargo ships was 59 hours, the average and median were 37 hours, and the minimum was 24 hours</span>.
+    From the graph above, we confirmed that <span style='color:orange; font-weight:bold; font-size:20px;'>the maximum stay duration for large cargo ships was 36 hours, the average was about 13 hours, the median was 12 hours, and the minimum was 30 minutes</span>.
     By analyzing the <span style='color:white; font-weight:bold; font-size:20px;'>quartiles of the box plot, we were able to understand the distribution of stay durations</span>, and based on this, we plan to <span style='color:white; font-weight:bold; font-size:20px;'>design and recommend tourist courses in Busan</span>.
     Below is the analysis of the average stay duration by shipping company.
     ''', unsafe_allow_html=True)
@@ -175,18 +143,10 @@ with tab_1:
 
     top10_ship = [v for v in avgDuration_ships_top10["Ship name"]]
 
-    index_list = list()
-
-    for i, v in enumerate(schedule["Ship Company"]):
-        if v in top10_ship:
-            index_list.append(i)
-
-    schedule_10 = schedule.iloc[index_list].reset_index().iloc[:,1:]
-
-    duration_fig_10 = px.box(
-        schedule_10,
+    duration_fig_10 = sketch_box_figure(
+        store.company_sketches(top10_ship),
         x="Ship Company",
-        y="Total duration(Hours)",
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -205,7 +165,7 @@ with tab_1:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -218,11 +178,12 @@ with tab_1:
 
     st.plotly_chart(duration_fig_10, use_container_width=True, key="ship10_duration_en")
 
-    aew_df = pd.DataFrame(schedule_10[schedule_10["Ship Company"]=="AEW"])
+    schedule = load_dataset("sinhangSchedule_raw").iloc[:,1:]
+    aew_df = add_duration_columns(schedule[schedule["Ship Company"]=="AEW"]).reset_index(drop=True)
     st.dataframe(aew_df, use_container_width=True, hide_index=True)
 
     st.markdown('''
-    According to the analysis, <span style='color:orange; font-weight:bold; font-size:20px;'>AEW entered the port only once</span>, with a stay duration of 58 hours, which placed it high in the average stay time rankings.
+    According to the analysis, <span style='color:orange; font-weight:bold; font-size:20px;'>AEW entered the port only once</span>, with a stay duration of 38 hours, which placed it first in the average stay time rankings.
     Therefore, <span style='color:white; font-weight:bold; font-size:20px;'>AEW was excluded</span>, and the Top 10 shipping companies were reselected and visualized using a box plot.
     ''', unsafe_allow_html=True)
 
@@ -234,19 +195,10 @@ with tab_1:
 
     new_top10_ship = [v for v in new_avgDuration_ships["Ship name"]]
 
-    index_list = list()
-
-    for i, v in enumerate(schedule["Ship Company"]):
-        if v in new_top10_ship:
-            index_list.append(i)
-
-    new_schedule_10 = schedule.iloc[index_list].reset_index().iloc[:,1:]
-
-
-    duration_fig_10_edit = px.box(
-        new_schedule_10,
+    duration_fig_10_edit = sketch_box_figure(
+        store.company_sketches(new_top10_ship),
         x="Ship Company",
-        y="Total duration(Hours)",
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -265,7 +217,7 @@ with tab_1:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -297,69 +249,21 @@ with tab_2:
     이에 따라, 신항에 입항한 선박의 연도/월/일별 선사 및 체류시간 데이터를 수집·분석하여 시각화하였습니다.
     ''',unsafe_allow_html=True)
 
-    schedule = pd.read_csv("./useData/SinhangSchedule_rawData.csv", encoding="utf-8-sig")
-    schedule = schedule.iloc[:,1:]
-    #형변환 : Date_time
-    #-함수 정의
-    def changeDateType(x):
-        changeDate = pd.to_datetime(x)
-        return changeDate
-
-    #-형변환
-    schedule["Enter Time"] = changeDateType(schedule["Enter Time"])
-    schedule["Out Time"] = changeDateType(schedule["Out Time"])
-    schedule["Day difference"] = schedule["Enter Time"] - schedule["Out Time"]
-
-    #-체류기간(일,시간) : Duration of stay (days, hours)
-    Dd_list = list(schedule["Day difference"])
-    Duration_days_list = list()
-    Duration_hourss_list = list()
-
-    for v in Dd_list:
-        v = str(v)
-        v_edit = v.replace(" ","").replace("days","").replace("-","").split("+")
-        Duration_days_list.append(v_edit[0])
-        Duration_hourss_list.append(v_edit[1])
-
-    schedule["Duration days"] = Duration_days_list
-    schedule["Duration hours"] = Duration_hourss_list
-
-    #-체류기간 총 시간
-    calculate_hour_list = list()
-    for v in schedule["Duration days"]:
-        v = int(v)
-        change_hour = v*24
-        calculate_hour_list.append(change_hour)
-
-    hourToInt = [v.split(":")[0] for v in schedule["Duration hours"]]
-
-    sumHour_list = [int(i) + int(v) for i,v in zip(calculate_hour_list, hourToInt)]
-
-    schedule["Total duration(Hours)"] = sumHour_list
-
-    schedule_duration = schedule[["Ship Company", "Total duration(Hours)"]].copy()
-
-    # 평균 계산
-    schedule_duration = schedule.groupby("Ship Company")["Total duration(Hours)"].mean()
-
-    # 리스트로 분리 저장
-    avg_shipName_list = list(schedule_duration.index)
-    avgTime_list = list(schedule_duration.values)
+    #-선사별 평균 체류시간 (평균 내림차순) : 선사/연월 집계 저장소에서 조회
+    store = dwell_store()
+    schedule_duration = store.company_stats()["mean"]
 
     # 데이터프레임 생성
     avgDuration_ships = pd.DataFrame({
-        "Ship name": avg_shipName_list,
-        "Avg time": avgTime_list
+        "Ship name": list(schedule_duration.index),
+        "Avg time": schedule_duration.values
     })
 
-    avgDuration_ships = avgDuration_ships.sort_values(["Avg time"],ascending=False).reset_index().iloc[:,1:]
-
-    #평균시간이 긴 10개 선사
     avgDuration_ships_top10 = avgDuration_ships.iloc[:9,:]
 
-    duration_fig = px.box(
-        schedule,
-        y="Total duration(Hours)",
+    duration_fig = sketch_box_figure(
+        {" ": store.sketch()},
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -378,7 +282,7 @@ with tab_2:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -390,7 +294,7 @@ with tab_2:
     st.plotly_chart(duration_fig, key="kr_duration")
 
     st.markdown('''
-    대개 <span style='color:white; font-weight:bold; font-size:20px;'>선박 유형별 평균 체류 시간</span>은 아래 표와 같습니다. 그러나 실제 데이터 분석 결과, <span style='color:orange; font-weight:bold; font-size:20px;'>선사별 평균 체류 시간이 최대 59시간에 달하는 경우</span>도 있어, 이를 초과하는 데이터는 이상치로 간주하여 제거한 후 시각화를 다시 진행하였습니다.
+    대개 <span style='color:white; font-weight:bold; font-size:20px;'>선박 유형별 평균 체류 시간</span>은 아래 표와 같습니다. 그러나 실제 데이터 분석 결과, <span style='color:orange; font-weight:bold; font-size:20px;'>개별 체류 시간이 최대 151시간에 달하는 경우</span>도 있어, 박스플롯의 상단 경계(3분위수 + 1.5 × IQR ≈ 36시간)를 초과하는 데이터(전체 입항의 약 5.6%)는 이상치로 간주하여 제거한 후 시각화를 다시 진행하였습니다.
     ''', unsafe_allow_html=True)
 
     new_time_df = pd.DataFrame({
@@ -399,12 +303,10 @@ with tab_2:
     })
     st.dataframe(new_time_df, hide_index=True, use_container_width=True)
 
-    schedule_removeAnomaly = schedule[schedule["Total duration(Hours)"] <=59]
-    schedule_removeAnomaly[["Ship Company","Enter Time", "Out Time", "Duration days", "Duration hours", "Total duration(Hours)"]].to_csv("./useData/finishPrepro/shipsDuration.csv")
-
-    duration_fig_1 = px.box(
-    schedule_removeAnomaly,
-    y="Total duration(Hours)",
+    #-이상치 제거 (shipsDuration.csv 저장은 warmup.py에서 수행)
+    duration_fig_1 = sketch_box_figure(
+    {" ": store.sketch().within(high=STAY_OUTLIER_HOURS)},
+    y=STAY_COL,
     title="Residence Time by Shipping Company",
     )
 
@@ -423,7 +325,7 @@ with tab_2:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -436,24 +338,16 @@ with tab_2:
     st.plotly_chart(duration_fig_1, use_container_width=True, key="kr_duration_anomaly")
 
     st.markdown('''
-    위 그래프를 통해 대형 카고선의 <span style='color:orange; font-weight:bold; font-size:20px;'>체류 시간은 최대 59시간, 평균 및 중앙값은 37시간, 최소는 24시간</span>임을 확인할 수 있었습니다.
+    위 그래프를 통해 대형 카고선의 <span style='color:orange; font-weight:bold; font-size:20px;'>체류 시간은 최대 36시간, 평균은 약 13시간, 중앙값은 12시간, 최소는 30분</span>임을 확인할 수 있었습니다.
     <span style='color:white; font-weight:bold; font-size:20px;'>박스플롯의 4분위수를 통해 체류 시간의 분포를 파악</span>하였고, 이를 바탕으로 <span style='color:white; font-weight:bold; font-size:20px;'>부산에서의 관광 코스를 설계하고 추천</span>할 예정입니다. 아래는 선사별 평균 체류시간을 분석 결과입니다.
     ''', unsafe_allow_html=True)
 
     top10_ship = [v for v in avgDuration_ships_top10["Ship name"]]
 
-    index_list = list()
-
-    for i, v in enumerate(schedule["Ship Company"]):
-        if v in top10_ship:
-            index_list.append(i)
-
-    schedule_10 = schedule.iloc[index_list].reset_index().iloc[:,1:]
-
-    duration_fig_10 = px.box(
-        schedule_10,
+    duration_fig_10 = sketch_box_figure(
+        store.company_sketches(top10_ship),
         x="Ship Company",
-        y="Total duration(Hours)",
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -472,7 +366,7 @@ with tab_2:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -485,11 +379,12 @@ with tab_2:
 
     st.plotly_chart(duration_fig_10, use_container_width=True, key="ship10_duration")
 
-    aew_df = pd.DataFrame(schedule_10[schedule_10["Ship Company"]=="AEW"])
+    schedule = load_dataset("sinhangSchedule_raw").iloc[:,1:]
+    aew_df = add_duration_columns(schedule[schedule["Ship Company"]=="AEW"]).reset_index(drop=True)
     st.dataframe(aew_df, use_container_width=True, hide_index=True)
 
     st.markdown('''
-    분석 결과, <span style='color:orange; font-weight:bold; font-size:20px;'>AEW는 단 1회 입항</span>했으며 체류 시간이 58시간으로 나타나 평균 체류 시간 집계 시 상위 순위에 포함되었습니다.
+    분석 결과, <span style='color:orange; font-weight:bold; font-size:20px;'>AEW는 단 1회 입항</span>했으며 체류 시간이 38시간으로 나타나 평균 체류 시간 집계 시 1위를 차지했습니다.
     이에 따라 <span style='color:white; font-weight:bold; font-size:20px;'>AEW를 제외한 후, 다시 Top 10 선사를 선정</span>하고 박스플롯 시각화를 진행하였습니다.
     ''', unsafe_allow_html=True)
 
@@ -501,19 +396,10 @@ with tab_2:
 
     new_top10_ship = [v for v in new_avgDuration_ships["Ship name"]]
 
-    index_list = list()
-
-    for i, v in enumerate(schedule["Ship Company"]):
-        if v in new_top10_ship:
-            index_list.append(i)
-
-    new_schedule_10 = schedule.iloc[index_list].reset_index().iloc[:,1:]
-
-
-    duration_fig_10_edit = px.box(
-        new_schedule_10,
+    duration_fig_10_edit = sketch_box_figure(
+        store.company_sketches(new_top10_ship),
         x="Ship Company",
-        y="Total duration(Hours)",
+        y=STAY_COL,
         title="Residence Time by Shipping Company",
     )
 
@@ -532,7 +418,7 @@ with tab_2:
             tickfont=dict(color="white")
         ),
         yaxis=dict(
-            title=dict(text="Total Duration (Hours)", font=dict(color="white")),
+            title=dict(text="Stay Duration (Hours)", font=dict(color="white")),
             tickfont=dict(color="white"),
             gridcolor="gray"
         )
@@ -5,6 +5,9 @@ import os
 from tmapAPI.tmapAPI import *
 import nbformat
 from analyzer.dwellTimeAnalyzer import *
+from analyzer.figureJSON import plotly_chart
+from data import load_dataset
+from analyzer.dwellTime import STAY_COL
 import math
 
 st.set_page_config(layout='wide')
@@ -16,11 +19,11 @@ load_dotenv()
 apikey = os.getenv('TMAP_API_KEY')
 tmap = tmapAPI(apikey)
 
-# 부산항 장기체류 top 10 선사 체류시간 데이터 로드
-shipsDuration_10 = pd.read_csv('./useData/shipsDuration_10.csv',index_col=0)
+# 부산항 장기체류 top 10 선사 체류시간 데이터 로드 (warmup.py에서 생성, 7페이지와 같은 이상치 기준)
+shipsDuration_10 = load_dataset("shipsDuration_10")
 
 # 부산 여행 스팟 데이터 로드
-busanSpots = pd.read_csv('./useData/busanSpotsCategorized.csv',index_col=0,encoding='utf-8-sig')
+busanSpots = load_dataset("busanSpotsCategorized")
 
 def get_stay_group_course(df, group: str):
     # 공백 제거 혹시 모르니
@@ -120,11 +123,15 @@ def draw_route_from_tourCourse(df, tmap, mode="car"):
             icon=folium.Icon(color=color)
         ).add_to(m)
 
-    # Draw route segments between consecutive spots and accumulate distance/time
-    for i in range(len(df) - 1):
-        start = df.iloc[i]
-        end = df.iloc[i + 1]
+    # 연속된 스팟 쌍(구간) 목록
+    spots = [{'name': row['name'], 'lat': row['lat'], 'lng': row['lng']} for _, row in df.iterrows()]
+    segments = list(zip(spots[:-1], spots[1:]))
+
+    # T맵 API를 통해 모든 구간의 경로 데이터를 동시에 가져옴 (구간 순서 유지, 선택한 이동수단만 요청)
+    segment_routes = tmap.get_routes_raw(segments, modes=(mode,))
 
+    # Draw route segments between consecutive spots and accumulate distance/time
+    for i, routes in enumerate(segment_routes):
         if i == 0:
             color = 'green'
         elif i == len(df) - 2:
@@ -132,19 +139,11 @@ def draw_route_from_tourCourse(df, tmap, mode="car"):
         else:
             color = 'blue'
 
-        start_info = {
-            'name': start['name'],
-            'lat': start['lat'],
-            'lng': start['lng']
-        }
-        end_info = {
-            'name': end['name'],
-            'lat': end['lat'],
-            'lng': end['lng']
-        }
-
-        # T맵 API를 통해 경로 데이터를 가져옴
-        routes = tmap.get_route_raw(start_info, end_info)
+        # 경로를 받지 못한 구간(API 오류/장애)은 경고 후 건너뜀
+        if not isinstance(routes[mode], list):
+            st.warning(f"Route {routes['startName']} → {routes['endName']} unavailable: {routes[mode]['error']}")
+            continue
+
         route_data = tmap.get_route(routes)
         segment = route_data[mode]
 
@@ -186,16 +185,16 @@ with tab1:
         with dataArea_en:
             with st.container():
                 # Dwell time quantile analysis for long-staying shipping companies
-                st.dataframe(shipsDuration_10['Total duration(Hours)'].describe(), row_height=52, height=450)
+                st.dataframe(shipsDuration_10[STAY_COL].describe(), row_height=52, height=450)
         with plotArea_en:
             with st.container():
-                dwellTA = dwellTimeAnalyzer(shipsDuration_10, 'Total duration(Hours)', 'Ship Company', marker_color='red')
+                dwellTA = dwellTimeAnalyzer(shipsDuration_10, STAY_COL, 'Ship Company', marker_color='red')
                 boxPlot = dwellTA.draw_boxplot('Residence Time by Shipping Company')
-                st.plotly_chart(boxPlot, use_container_width=True)
+                plotly_chart(boxPlot, use_container_width=True)
 
     st.markdown("""
-    From the quantile analysis of stay durations, the top 10 shipping companies stay between <span style='font-weight:bold;font-size:20px;'>a minimum of 24 hours and a maximum of 58 hours</span>. The <span style='font-weight:bold; font-size:20px;'>gap between quantiles is relatively small</span>, which suggests that a grouping approach based solely on duration may be insufficient. Instead, we propose to categorize them based on <span style='color:orange; font-weight:bold;font-size:20px;'>the purpose and behavior patterns</span> of the shipping companies during their stay.<br>
-    In particular, the gap between the <span style='font-weight:bold;font-size:20px;'>1st quartile (42 hours) and 3rd quartile (45 hours)</span> is quite narrow. Thus, the <span style='color:orange; font-weight:bold;font-size:20px;'>mid-stay group</span> targets companies with shorter stays but some spare time, while <span style='color:orange; font-weight:bold;font-size:20px;'>short and long stay groups</span> are more clearly differentiated based on time characteristics and usage patterns.
+    From the quantile analysis of stay durations, the top 10 shipping companies stay between <span style='font-weight:bold;font-size:20px;'>a minimum of 2 hours and a maximum of 36 hours</span>. The <span style='font-weight:bold; font-size:20px;'>quantiles are evenly spaced about six hours apart</span>, so the stay duration itself gives a usable grouping, which we combine with <span style='color:orange; font-weight:bold;font-size:20px;'>the purpose and behavior patterns</span> of the shipping companies during their stay.<br>
+    In particular, the <span style='font-weight:bold;font-size:20px;'>1st quartile (13 hours), median (19 hours) and 3rd quartile (25 hours)</span> split the stays into clear bands. Thus, the <span style='color:orange; font-weight:bold;font-size:20px;'>mid-stay group</span> targets companies with shorter stays but some spare time, while <span style='color:orange; font-weight:bold;font-size:20px;'>short and long stay groups</span> are differentiated by whether the stay leaves time for an overnight outing.
     """, unsafe_allow_html=True)
 
     with st.container():
@@ -203,21 +202,21 @@ with tab1:
         with short_col_en:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>Short Stay Group</span><br>
-            Time Range: <span style='font-weight:bold; font-size:20px;'>24 to 42 hours</span> (0% ~ 25%)<br>
+            Time Range: <span style='font-weight:bold; font-size:20px;'>2 to 13 hours</span> (0% ~ 25%)<br>
             Characteristics: Mainly focused on port-related tasks, with limited time for outside activities.<br>
             Recommendation: <span style='color:orange; font-weight:bold; font-size:20px;'>Short itineraries</span> focusing on <span style='color:orange; font-weight:bold; font-size:20px;'>nearby attractions</span> and <span style='color:orange; font-weight:bold; font-size:20px;'>meals</span><br><br>
             """, unsafe_allow_html=True)
         with mid_col_en:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>Mid Stay Group</span><br>
-            Time Range: <span style='font-weight:bold; font-size:20px;'>43 to 44 hours</span> (25% ~ 50%)<br>
+            Time Range: <span style='font-weight:bold; font-size:20px;'>14 to 18 hours</span> (25% ~ 50%)<br>
             Characteristics: Relatively short stays with time for light outings or local sightseeing.<br>
             Recommendation: Travel courses including <span style='color:orange; font-weight:bold; font-size:20px;'>meals</span>, <span style='color:orange; font-weight:bold; font-size:20px;'>simple tourist spots</span>, and <span style='color:orange; font-weight:bold; font-size:20px;'>resting places</span> (e.g., cafes, observatories)<br><br>
             """, unsafe_allow_html=True)
         with long_col_en:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>Long Stay Group</span> (50% and above)<br>
-            Time Range: <span style='font-weight:bold; font-size:20px;'>45 hours or more</span><br>
+            Time Range: <span style='font-weight:bold; font-size:20px;'>19 hours or more</span><br>
             Characteristics: Suitable for overnight stays with time for full outdoor activities and relaxation.<br>
             Recommendation: <span style='color:orange; font-weight:bold; font-size:20px;'>1-night, 2-day itineraries</span> including <span style='color:orange; font-weight:bold; font-size:20px;'>tourist attractions</span>, <span style='color:orange; font-weight:bold; font-size:20px;'>local meals</span>, and <span style='color:orange; font-weight:bold; font-size:20px;'>accommodations</span>
             """, unsafe_allow_html=True)
@@ -231,18 +230,18 @@ with tab1:
         transport_mode = st.selectbox("Select your mode of transport", options=["Choose an option", "Car", "Walking"])
 
     # ------------- Row 2: Determine Group & Display Comment -------------
-    if stay_time < 24:
+    if stay_time < 2:
         group = None
-        st.warning("Travel recommendations are available only for stays of 24 hours or more.")
+        st.warning("Travel recommendations are available only for stays of 2 hours or more.")
         
     else:
-        if 24 <= stay_time <= 42:
+        if 2 <= stay_time <= 13:
             group = "short"
             comment = f"Your stay duration is {stay_time} hours. You belong to the Short Stay Group."
-        elif 43 <= stay_time <= 44:
+        elif 14 <= stay_time <= 18:
             group = "mid"
             comment = f"Your stay duration is {stay_time} hours. You belong to the Mid Stay Group."
-        elif stay_time >= 45:
+        elif stay_time >= 19:
             group = "long"
             comment = f"Your stay duration is {stay_time} hours. You belong to the Long Stay Group."
 
@@ -291,17 +290,17 @@ with tab2:
         with dataArea_kr:
             with st.container():
                 # 장기체류 선사들의 체류시간 분위수 분석
-                st.dataframe(shipsDuration_10['Total duration(Hours)'].describe(), row_height=52, height=450)
+                st.dataframe(shipsDuration_10[STAY_COL].describe(), row_height=52, height=450)
         with plotArea_kr:
             with st.container():
-                dwellTA = dwellTimeAnalyzer(shipsDuration_10, 'Total duration(Hours)', 'Ship Company', marker_color='red')
+                dwellTA = dwellTimeAnalyzer(shipsDuration_10, STAY_COL, 'Ship Company', marker_color='red')
                 boxPlot = dwellTA.draw_boxplot('Residence Time by Shipping Company')
-                st.plotly_chart(boxPlot, use_container_width=True, key='boxplot')
+                plotly_chart(boxPlot, use_container_width=True, key='boxplot')
 
 
     st.markdown("""
-    체류 시간 분위수 분석 결과, 상위 10개 선사의 체류 시간은 <span style='font-weight:bold;font-size:20px;'>최소 24시간에서 최대 58시간</span> 사이로 분포하고 있으며, <span style='font-weight:bold; font-size:20px;'>분위수 간의 격차가 크지 않은 것으로 나타났습니다.</span> 따라서 단순한 시간 기준으로 그룹을 나누기보다는, <span style='color:orange; font-weight:bold;font-size:20px;'>선사의 체류 목적과 행동 패턴</span>을 고려한 실용적인 기준에 따라 그룹을 구분하는 것이 더 효과적인 접근으로 판단됩니다.<br>
-    특히, <span style='font-weight:bold;font-size:20px;'>1분위(42시간)와 3분위(45시간)</span> 사이의 간격이 매우 좁기 때문에, <span style='color:orange; font-weight:bold;font-size:20px;'>중간 체류 그룹</span>은 상대적으로 체류 시간은 짧지만 일정 여유가 있는 선사들을 위한 타겟팅 기준으로 설정하였고, <span style='color:orange; font-weight:bold;font-size:20px;'>단기 및 장기 체류 그룹</span>은 보다 명확한 시간 특성과 이용 행태를 기반으로 구분하였습니다.
+    체류 시간 분위수 분석 결과, 상위 10개 선사의 체류 시간은 <span style='font-weight:bold;font-size:20px;'>최소 2시간에서 최대 36시간</span> 사이로 분포하고 있으며, <span style='font-weight:bold; font-size:20px;'>분위수가 약 6시간 간격으로 고르게 나뉘는 것으로 나타났습니다.</span> 따라서 체류 시간 자체를 그룹 기준으로 삼고, 여기에 <span style='color:orange; font-weight:bold;font-size:20px;'>선사의 체류 목적과 행동 패턴</span>을 함께 고려하여 그룹을 구분하였습니다.<br>
+    특히, <span style='font-weight:bold;font-size:20px;'>1분위(13시간), 중앙값(19시간), 3분위(25시간)</span>가 체류 시간을 뚜렷한 구간으로 나누기 때문에, <span style='color:orange; font-weight:bold;font-size:20px;'>중간 체류 그룹</span>은 상대적으로 체류 시간은 짧지만 일정 여유가 있는 선사들을 위한 타겟팅 기준으로 설정하였고, <span style='color:orange; font-weight:bold;font-size:20px;'>단기 및 장기 체류 그룹</span>은 1박 일정이 가능한지에 따라 구분하였습니다.
     """, unsafe_allow_html=True)
 
     with st.container():
@@ -309,21 +308,21 @@ with tab2:
         with short_col_kr:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>단기 체류 그룹 (Short Stay)</span><br>
-            시간 기준: <span style='font-weight:bold; font-size:20px;'>24시간 이상 ~ 42시간 이하</span> (0% ~ 25%)<br>
+            시간 기준: <span style='font-weight:bold; font-size:20px;'>2시간 이상 ~ 13시간 이하</span> (0% ~ 25%)<br>
             특징: 항만 업무 중심의 체류가 주를 이루며, 외부 활동 여유가 적은 그룹입니다.<br>
             추천 방향: <span style='color:orange; font-weight:bold; font-size:20px;'>항만 인근</span>의 <span style='color:orange; font-weight:bold; font-size:20px;'>근거리 관광지</span> 방문 및 <span style='color:orange; font-weight:bold; font-size:20px;'>식사 위주</span>의 짧은 일정 추천<br><br>
             """, unsafe_allow_html=True)
         with mid_col_kr:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>중기 체류 그룹 (Mid Stay)</span><br>
-            시간 기준: <span style='font-weight:bold; font-size:20px;'>43시간 ~ 44시간</span> (25% ~ 50%)<br>
+            시간 기준: <span style='font-weight:bold; font-size:20px;'>14시간 ~ 18시간</span> (25% ~ 50%)<br>
             특징: 비교적 짧지만 소규모 외출이나 관광이 가능한 여유가 있는 체류입니다.<br>
             추천 방향: <span style='color:orange; font-weight:bold; font-size:20px;'>식사</span>와 <span style='color:orange; font-weight:bold; font-size:20px;'>간단한 관광지</span>, <span style='color:orange; font-weight:bold; font-size:20px;'>휴식 공간</span>(카페, 전망대 등) 중심의 코스 제안<br><br>
             """, unsafe_allow_html=True)
         with long_col_kr:
             st.markdown("""
             <span style='font-weight:bold; font-size:20px;'>장기 체류 그룹 (Long Stay)</span> (50% ~ )<br>
-            시간 기준: <span style='font-weight:bold; font-size:20px;'>45시간 이상</span><br>
+            시간 기준: <span style='font-weight:bold; font-size:20px;'>19시간 이상</span><br>
             특징: 1박 이상의 일정이 가능하며, 본격적인 외부 활동 및 휴식을 고려할 수 있는 체류입니다.<br>
             추천 방향: <span style='color:orange; font-weight:bold; font-size:20px;'>관광지 탐방</span>, <span style='color:orange; font-weight:bold; font-size:20px;'>지역 식사</span>, <span style='color:orange; font-weight:bold; font-size:20px;'>숙박</span>이 포함된 <span style='font-weight:bold;'>1박 2일형 일정</span> 제안
             """, unsafe_allow_html=True)
@@ -337,18 +336,18 @@ with tab2:
         transport_mode = st.selectbox("이동 수단을 선택하세요", options=["선택하세요", "차량", "보행자"])
 
     # ------------- Row 2: 그룹 결정 및 코멘트 출력 -------------
-    if stay_time < 24:
+    if stay_time < 2:
         group = None
-        st.warning("체류 시간이 24시간 이상일 때만 추천 코스를 제공해 드립니다.")
+        st.warning("체류 시간이 2시간 이상일 때만 추천 코스를 제공해 드립니다.")
         
     else:
-        if 24 <= stay_time <= 42:
+        if 2 <= stay_time <= 13:
             group = "short"
             comment = f"당신의 체류 시간은 {stay_time}시간입니다. 단기 체류 그룹에 속합니다."
-        elif 43 <= stay_time <= 44:
+        elif 14 <= stay_time <= 18:
             group = "mid"
             comment = f"당신의 체류 시간은 {stay_time}시간입니다. 중기 체류 그룹에 속합니다."
-        elif stay_time >= 45:
+        elif stay_time >= 19:
             group = "long"
             comment = f"당신의 체류 시간은 {stay_time}시간입니다. 장기 체류 그룹에 속합니다."
 
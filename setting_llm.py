@@ -21,32 +21,58 @@ from langchain_openai import ChatOpenAI  # OpenAI LLM interface via LangChain (L
 from langchain_experimental.agents.agent_toolkits import create_pandas_dataframe_agent  # Agent for analyzing Pandas DataFrame (Pandas 데이터프레임 분석용 LangChain 에이전트)
 from langchain_core.prompts import ChatPromptTemplate  # Create role-based prompt templates (역할 기반 프롬프트 템플릿 생성 도구)
 from langchain_core.output_parsers import StrOutputParser  # Output parser that returns plain strings (문자열만 반환하는 파서)
+from chatbot.pool import LLMResourcePool  # Shared LLM resource pool (LLM 자원 풀)
+from chatbot.answerCache import answer_cache  # Answers shared across sessions (세션 간 공유 응답 캐시)
+from analyzer.figureCache import frame_hash  # Dataset content hash (데이터 내용 해시)
+from chatbot.router import intent_router, VISUALIZATION, EDA  # Question intent router (질문 의도 분류기)
+from chatbot.queryPlanner import fast_answer  # pandas answers for aggregate questions (집계 질문용 pandas 응답)
+from data import dataset_digest, build_digest, digest_text  # Precomputed dataset summaries (미리 계산된 데이터 요약)
+from chatbot.sandbox import viz_sandbox  # Isolated runner for generated chart code (생성된 차트 코드 격리 실행기)
+from chatbot.figures import figure_manager  # Closes figures left open by the agent (에이전트가 남긴 그래프 정리)
+from chatbot.imageStore import session_image_store  # Compressed per-session chart images (세션별 압축 이미지 저장소)
+from chatbot.streaming import AgentStream, text_stream  # Token streams for st.write_stream (st.write_stream용 토큰 스트림)
+from chatbot.fakeLLM import ScriptedChatModel  # Offline scripted model for tests and benchmarks (테스트/벤치마크용 오프라인 모델)
+from chatbot.framePolicy import FrameBudget, AgentPrompt, explore_view, fit_lines, preview, sample_note, bound_agent, chart_agent, estimate_tokens  # Size limits for the agent (에이전트 데이터 크기 제한)
 
-# Main chatbot function combining character chat + dataframe analysis + visualization
-# (캐릭터 챗봇 + 데이터프레임 분석 + 시각화를 처리하는 메인 함수)
-def importMyBot(x, userQuestion):
-    """
-    Parameters:
-    x : pd.DataFrame - The DataFrame used for EDA and analysis (EDA 및 분석에 사용될 데이터프레임)
-    userQuestion : str - User input message (사용자의 입력 메시지)
+# One-time process setup: Korean font for generated plots and .env variables (프로세스당 1회 초기화)
+_setup_done = False
 
-    Returns:
-    str or None - Text response if applicable, None if visualization only (시각화일 경우 None, 아니면 문자열 응답 반환)
-    """
+def _setup_once():
+    global _setup_done
+    if not _setup_done:
+        fontSetting()
+        load_dotenv()  # Load API key from .env file (환경변수에서 OpenAI API 키 로드)
+        _setup_done = True
 
-    fontSetting()
-
-    # Load API key from .env file (환경변수에서 OpenAI API 키 로드)
-    load_dotenv()
+def _openai_llm():
     OPENAI_API_KEY = os.getenv("openAI_myKey")
 
     # Initialize ChatOpenAI instance with GPT-4o-mini (GPT-4o-mini 모델 초기화)
-    llm = ChatOpenAI(
+    return ChatOpenAI(
         model="gpt-4o-mini",  # Light and fast model (가볍고 빠른 모델)
         temperature=1,        # Deterministic responses (응답의 일관성 유지)
+        streaming=True,       # Emit tokens as they are generated, also inside the agent (에이전트 내부에서도 토큰 단위 출력)
         api_key=OPENAI_API_KEY  # Load API key from environment (.env에서 불러온 키 사용)
     )
 
+def _fake_llm():
+    # Scripted local model, no network; latency in seconds from the environment (네트워크 없이 동작하는 스크립트 모델)
+    return ScriptedChatModel(
+        latency=float(os.getenv("CHATBOT_FAKE_LATENCY", "0")),         # Delay before the first token (첫 토큰 지연)
+        token_delay=float(os.getenv("CHATBOT_FAKE_TOKEN_DELAY", "0"))  # Delay between tokens (토큰 간 지연)
+    )
+
+# LLM backends by name; CHATBOT_LLM selects one, "openai" by default (이름별 LLM 백엔드, CHATBOT_LLM 환경변수로 선택)
+LLM_BACKENDS = {"openai": _openai_llm, "fake": _fake_llm}
+
+def _create_llm():
+    _setup_once()
+    backend = os.getenv("CHATBOT_LLM", "openai")
+    if backend not in LLM_BACKENDS:
+        raise ValueError(f"unknown CHATBOT_LLM backend {backend!r}, expected one of {sorted(LLM_BACKENDS)}")
+    return LLM_BACKENDS[backend]()
+
+def _create_chain(llm):
     # Define system behavior using prompt template (Javis 캐릭터 설정 및 역할 기반 규칙 구성)
     prompt = ChatPromptTemplate.from_messages([
         {
@@ -69,77 +95,171 @@ def importMyBot(x, userQuestion):
 
     # Set up chain: Prompt → LLM → OutputParser (프롬프트 → 모델 → 출력 파서로 연결된 체인 구성)
     output_parser = StrOutputParser()
-    myChain = prompt | llm | output_parser
+    return prompt | llm | output_parser
+
+# Agent prompt suffix: the dataset digest replaces the df.head()/describe() exploration the agent
+# would otherwise spend its first tool calls on (데이터 요약을 넣어 탐색용 도구 호출을 줄임)
+DIGEST_SUFFIX = """
+A precomputed summary of `df` (columns, dtypes, distinct values, ranges, most frequent values):
+{digest}
+Answer from this summary when it is enough, and run code only for what it does not cover.
+Do not call df.head(), df.info() or df.describe() just to explore the data.
+{sample_note}
+This is the result of `print(df.head())`:
+{df_head}"""
+
+# Row/token budgets: the prompt and tool results stay the same size however large the dataset grows
+# (행/토큰 예산: 데이터가 커져도 프롬프트와 도구 결과 크기는 일정)
+agent_budget = FrameBudget(max_rows=1000, max_columns=20, head_rows=3, prompt_tokens=1200, output_tokens=800)
 
+def _agent_prompt(df, dataset=None, budget=None):
+    budget = budget or agent_budget
+    # Digest built with the data artifacts for registered datasets, computed here otherwise
+    # (등록된 데이터셋은 빌드 시 만든 요약 사용, 아니면 여기서 계산)
+    digest = dataset_digest(dataset) if dataset else build_digest(df)
+
+    # Pruned/sampled view for exploration; the full df is still there for the final computation
+    # (탐색용 축소 데이터, 최종 계산은 전체 df로 수행)
+    view = explore_view(df, budget)
+    note = sample_note(view, df)
+    # the preview gets at most a third of the prompt budget, the digest the rest (미리보기 1/3, 나머지는 요약)
+    head = fit_lines(preview(view, df, budget), budget.prompt_tokens // 3)
+    spare = budget.prompt_tokens - estimate_tokens(DIGEST_SUFFIX + note + head)
+    suffix = DIGEST_SUFFIX.format(digest=fit_lines(digest_text(digest), spare), sample_note=note, df_head=head)
+    return AgentPrompt(suffix, view, budget)
+
+def _create_agent(llm, df, prompt):
+    # Built per call so the python tool's variables never outlive one question; the tool gets shallow
+    # copies, so new or reassigned columns stay in this call (the shared arrays are read-only)
+    # (호출마다 새 도구를 만들고 얕은 복사본을 전달해 df 변경이 다른 세션에 남지 않도록 함)
     # Create agent that can analyze a DataFrame using natural language (자연어 기반 데이터프레임 분석 에이전트 생성)
-    agent_data_executer = create_pandas_dataframe_agent(
-        llm=llm,                         # Use the same LLM as above (동일한 LLM 사용)
-        df=x,                            # DataFrame to be analyzed (분석할 데이터프레임)
+    agent = create_pandas_dataframe_agent(
+        llm=llm,                         # Use the pooled LLM client (풀에 있는 LLM 사용)
+        df=df.copy(deep=False),          # DataFrame to be analyzed (분석할 데이터프레임)
         agent_type="tool-calling",       # Use tool-calling style agent (도구 호출 방식 에이전트 사용)
         verbose=True,                    # Print internal steps for debugging (디버깅용 내부 출력 허용)
         return_intermediate_steps=True,  # Return intermediate code if needed (시각화용 코드 추출을 위해 필요)
-        allow_dangerous_code=True        # Allow exec/eval for dynamic Python code (exec 실행 허용)
+        allow_dangerous_code=True,       # Allow exec/eval for dynamic Python code (exec 실행 허용)
+        suffix=prompt.suffix,            # Dataset digest + first rows (데이터 요약 + 앞부분 행)
+        include_df_in_prompt=False       # The preview above is built from the pruned view (미리보기는 축소 데이터로 구성)
     )
+    # Tool results clipped to the output budget, df_sample next to df (도구 출력 제한, df 옆에 df_sample 제공)
+    return bound_agent(agent, prompt.view.copy(deep=False), prompt.budget)
 
-    # Define keywords to detect visualization intent (시각화 요청 판단용 키워드 리스트)
-    visualization_keywords = [
-        # English keywords (50)
-        "plot", "graph", "chart", "visualize", "visualization", "display", "show", "draw", "render",
-        "hist", "histogram", "bar", "bar chart", "line", "line chart", "scatter", "scatter plot",
-        "pie", "pie chart", "map", "heatmap", "boxplot", "box plot", "area", "area chart", 
-        "bubble chart", "density", "distribution", "trend", "time series", "stacked chart",
-        "stacked bar", "grouped bar", "plotly", "matplotlib", "seaborn", "bokeh", "dash", "altair",
-        "ggplot", "candlestick", "gantt", "choropleth", "treemap", "sunburst", "violin plot",
-        "pairplot", "facet", "grid plot", "interactive chart",
-    
-        # Korean keywords (50)
-        "시각화", "시각화해줘", "그래프", "그래프 그려줘", "히스토그램", "히스토그램 그려줘", "막대그래프",
-        "막대그래프 그려줘", "산점도", "산점도 그려줘", "파이차트", "파이차트 그려줘", "꺾은선그래프",
-        "꺾은선그래프 그려줘", "선형그래프", "선형그래프 그려줘", "분포도", "분포도 그려줘", "상자그림",
-        "상자그림 그려줘", "지도", "지도 그려줘", "열지도", "밀도그래프", "밀도차트", "트렌드", "시계열",
-        "누적그래프", "누적차트", "군집도", "집단그래프", "산점그래프", "선그래프", "점그래프", "시계열그래프",
-        "인사이트 시각화", "수치 시각화", "분석 시각화", "데이터 시각화", "컬러맵", "컬러히트맵", "계층그래프",
-        "트리맵", "선버스트", "비올린플롯", "조합그래프", "여러 그래프", "복합 그래프", "분산 그래프"
-    ]
+# LLM client, chain and per-dataset agent prompts shared by every message and session in this process;
+# a prompt whose dataset has not been asked about for 10 minutes is dropped
+# (LLM 클라이언트/체인/데이터셋별 프롬프트를 재사용, 10분간 사용되지 않은 프롬프트는 제거)
+llm_pool = LLMResourcePool(_create_llm, _create_chain, _agent_prompt, _create_agent, idle_ttl=600, max_prompts=8)
 
+def use_llm_backend(backend):
+    """
+    Switch the chatbot to another LLM; the pooled chain and agents are rebuilt on the next message
+    (챗봇 LLM 교체, 체인과 에이전트는 다음 메시지에서 다시 생성)
 
-    # Case 1: If the user's question is about visualization (시각화 요청인 경우)
-    if any(kw in userQuestion.lower() for kw in visualization_keywords):
-        response = agent_data_executer.invoke(userQuestion)  # Run LangChain agent (LangChain 에이전트 실행)
-        try:
-            visual_code = response["intermediate_steps"][0][0].tool_input["query"]  # Extract generated code (생성된 시각화 코드 추출)
-            df = x.copy()  # Ensure 'df' is defined for exec (시각화 코드 내 df 참조 위해 복사)
+    Parameters:
+    backend : str or callable - LLM_BACKENDS name, or a callable() -> chat model, e.g. lambda: ScriptedChatModel(script=...)
+    """
+    if isinstance(backend, str):
+        if backend not in LLM_BACKENDS:
+            raise ValueError(f"unknown LLM backend {backend!r}, expected one of {sorted(LLM_BACKENDS)}")
+        backend = LLM_BACKENDS[backend]
 
-            exec(visual_code)  # Execute the visualization code (시각화 코드 실행)
+    def create_llm():
+        _setup_once()
+        return backend()
+    llm_pool.use_llm(create_llm)
 
-            # Save matplotlib figure to in-memory buffer (matplotlib 그래프를 메모리에 저장)
-            import io
-            import matplotlib.pyplot as plt
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png")
-            buf.seek(0)
+# Main chatbot function combining character chat + dataframe analysis + visualization
+# (캐릭터 챗봇 + 데이터프레임 분석 + 시각화를 처리하는 메인 함수)
+def importMyBot(x, userQuestion, dataset=None, stream=False):
+    """
+    Parameters:
+    x : pd.DataFrame - The DataFrame used for EDA and analysis (EDA 및 분석에 사용될 데이터프레임)
+    userQuestion : str - User input message (사용자의 입력 메시지)
+    dataset : str - data.DATASETS name of x, used to look up its precomputed digest (데이터셋 이름, 요약 조회용)
+    stream : bool - return text answers as token iterators for st.write_stream (텍스트 응답을 토큰 스트림으로 반환)
 
-            # Save the image in Streamlit session state to render it later (세션 상태에 이미지 기록)
+    Returns:
+    str or None - Text response if applicable, None if visualization only (시각화일 경우 None, 아니면 문자열 응답 반환)
+    with stream=True: iterator of text chunks instead of str (stream=True이면 문자열 대신 텍스트 조각 반복자)
+    """
+
+    _setup_once()
+    data_key = frame_hash(x)
+
+    # Same dataset + same (normalized) question: answer from the cache without any LLM call
+    # (같은 데이터에 같은 질문이면 LLM 호출 없이 캐시된 응답 반환)
+    answer_key = answer_cache.key(data_key, userQuestion)
+    cached = answer_cache.get(answer_key)
+    if cached is not None:
+        if cached["type"] == "image":
+            st.session_state.messages.append({"role": "ai", "type": "image", "content": session_image_store().put(cached["content"])})
+            return None
+        return text_stream(cached["content"]) if stream else cached["content"]
+
+    # Pick the path with one compiled keyword regex, then a TF-IDF fallback (정규식 키워드 매칭 + TF-IDF 보조 분류로 경로 선택)
+    intent = intent_router.route(userQuestion)
+
+    # Simple aggregates (mean, sum, max, top N, per year ...) are answered with pandas directly;
+    # anything the planner cannot resolve goes to the agent below
+    # (단순 집계 질문은 pandas로 바로 응답, 해석할 수 없으면 아래 에이전트 사용)
+    if intent != VISUALIZATION:
+        quick = fast_answer(x, userQuestion, key=data_key)
+        if quick is not None:
+            answer_cache.put(answer_key, quick)
+            return text_stream(quick) if stream else quick
+
+    # Reuse pooled resources instead of rebuilding them every message; only the agent itself is new
+    # (매 메시지마다 새로 만들지 않고 풀에서 재사용, 에이전트만 새로 생성)
+    myChain = llm_pool.chain()
+    agent_data_executer = llm_pool.agent(x, key=data_key, dataset=dataset)
+
+    # Case 1: If the user's question is about visualization (시각화 요청인 경우)
+    if intent == VISUALIZATION:
+        # The agent's python tool sends the visualization code to a sandbox worker process with a timeout
+        # and memory cap, so the generated code never runs in this process; the dataset is shared with
+        # the workers instead of copied per request
+        # (시각화 코드는 제한 시간/메모리 제한이 있는 별도 프로세스에서만 실행, 데이터는 공유 메모리로 전달)
+        chart_tool = chart_agent(agent_data_executer, viz_sandbox, key=data_key)
+        try:
+            agent_data_executer.invoke(userQuestion)  # Run LangChain agent (LangChain 에이전트 실행)
+            if not chart_tool.charts:
+                raise ValueError("the agent did not draw a chart")
+            png = chart_tool.charts[-1]  # Last chart the agent drew (에이전트가 마지막으로 그린 그래프)
+            answer_cache.put(answer_key, png, kind="image")  # Reuse for repeat questions (반복 질문 대비 저장)
+
+            # Keep the image in the session's bounded image store and only its ID in the messages
+            # (이미지는 세션별 용량 제한 저장소에 압축 저장하고 메시지에는 ID만 기록)
             st.session_state.messages.append({
                 "role": "ai",           # Message role: AI (응답자 역할은 AI)
                 "type": "image",        # Custom message type: image (메시지 유형: 이미지)
-                "content": buf          # The image buffer (이미지 버퍼 저장)
+                "content": session_image_store().put(png)  # Image ID (이미지 ID)
             })
 
             return None  # No text response returned (텍스트 응답 없이 종료)
 
         except Exception as e:
-            return f"Error while executing visualization: {e}"  # Error handling (에러 발생 시 메시지 반환)
+            error = f"Error while executing visualization: {e}"  # Error handling (에러 발생 시 메시지 반환)
+            return text_stream(error) if stream else error
 
     # Case 2: If the question is general EDA-related (일반적인 데이터 분석 관련 질문인 경우)
-    elif any(kw in userQuestion.lower() for kw in [
-        "data", "column", "row", "mean", "sum", "describe",
-        "데이터", "컬럼", "행", "열", "요약", "평균", "EDA"
-    ]):
-        result = agent_data_executer.invoke(userQuestion)  # Run DataFrame agent (데이터프레임 분석 실행)
+    elif intent == EDA:
+        if stream:
+            # Run the agent in a worker thread and hand its final-answer tokens to the page as they arrive
+            # (에이전트를 별도 스레드에서 실행하고 최종 응답 토큰을 생성되는 대로 전달)
+            def runAgent(config):
+                with figure_manager.collect():
+                    return agent_data_executer.invoke(userQuestion, config=config)
+            return AgentStream(runAgent, on_done=lambda output: answer_cache.put(answer_key, output))
+
+        with figure_manager.collect():
+            result = agent_data_executer.invoke(userQuestion)  # Run DataFrame agent (데이터프레임 분석 실행)
+        answer_cache.put(answer_key, result["output"])  # Reuse for repeat questions (반복 질문 대비 저장)
         return result["output"]  # Return textual result (텍스트 응답 반환)
 
     # Case 3: If not data-related, run as regular character chatbot (데이터와 무관한 질문은 캐릭터 챗봇으로 응답)
     else:
+        if stream:
+            return myChain.stream({"input": userQuestion})  # Text chunks from the output parser (출력 파서의 텍스트 조각)
         result = myChain.invoke({"input": userQuestion})  # Run character-based chain (프롬프트 기반 응답 생성)
         return result  # Return text response (문자열 응답 반환)
@@ -1 +1,4 @@
-from .tmapAPI import tmapAPI
\ No newline at end of file
+from .tmapAPI import tmapAPI, MODES
+from .routeCache import RouteCache, route_cache
+from .httpClient import HttpClient, CircuitBreaker, CircuitOpenError, http_client
+from .rateLimiter import RateLimiter, RateLimitError, rate_limiter
\ No newline at end of file
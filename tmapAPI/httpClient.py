@@ -0,0 +1,164 @@
+import time
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .rateLimiter import RateLimiter, rate_limiter
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(requests.RequestException):
+    """T map calls are short-circuited after repeated failures (연속 실패로 호출 차단 중)"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing API for a while instead of piling up slow requests (장애 시 호출 차단기)
+    - closed: calls go through; `failure_threshold` failures in a row open the circuit
+    - open: calls fail at once with CircuitOpenError for `reset_timeout` seconds
+    - half-open: one trial call is let through; success closes the circuit, failure opens it again
+
+    Parameters:
+    failure_threshold : int - consecutive failures that open the circuit (차단까지의 연속 실패 수)
+    reset_timeout : float - seconds before a trial call is allowed (재시도까지 대기 시간)
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened = None        # monotonic time the circuit opened, None when closed
+        self._trial = None         # thread running the half-open trial call, None when there is none
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self._opened >= self.reset_timeout else "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened is None:
+                return True
+            if time.monotonic() - self._opened >= self.reset_timeout and self._trial is None:
+                self._trial = threading.get_ident()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened = None
+            self._trial = None
+
+    def release(self):
+        """Give back this thread's half-open trial when it was never sent (보내지 않은 시험 호출 반납)"""
+        with self._lock:
+            if self._trial == threading.get_ident():
+                self._trial = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial is not None or self._failures >= self.failure_threshold:
+                self._opened = time.monotonic()
+            self._trial = None
+
+
+class HttpClient:
+    """
+    Shared keep-alive HTTP client for the T map API (T map API용 공유 HTTP 클라이언트)
+    - one requests.Session with a connection pool, so repeated calls reuse TLS connections
+    - every call has a (connect, read) timeout
+    - 429 and 5xx responses and connection errors are retried with jittered exponential backoff
+      (Retry-After is honoured up to `max_backoff`)
+    - a CircuitBreaker fails calls fast while the API is down
+    - every attempt the breaker admits then takes a token from the RateLimiter, so calls queue at the
+      allowed rate and no quota is spent on calls the breaker rejects
+
+    Parameters:
+    timeout : tuple - (connect, read) seconds per attempt (연결/응답 제한 시간)
+    retries : int - extra attempts after the first one (재시도 횟수)
+    backoff : float - base delay in seconds, doubled every attempt (기본 대기 시간)
+    max_backoff : float - cap on one delay (최대 대기 시간)
+    pool_size : int - keep-alive connections per host (호스트당 연결 수)
+    breaker : CircuitBreaker - shared failure state (장애 차단기)
+    limiter : RateLimiter - rate and quota shared by the processes, None for no limit (호출 속도/한도 제한기)
+    """
+
+    def __init__(self, timeout=(3.05, 10), retries: int = 3, backoff: float = 0.5, max_backoff: float = 8,
+                 pool_size: int = 10, breaker: CircuitBreaker = None, limiter: RateLimiter = rate_limiter):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.limiter = limiter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _delay(self, attempt: int, response=None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        # full jitter: spreads retries of concurrent requests apart (동시 요청의 재시도 시점 분산)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, method: str, url: str, kind: str = "call", **kwargs) -> requests.Response:
+        """
+        requests.Session.request with rate limit, timeout, retries and the circuit breaker
+        (호출 제한/제한 시간/재시도/차단기 적용 요청)
+        `kind` labels the call in the quota meter. The last response is returned as is, also a failed one;
+        raises CircuitOpenError while the circuit is open, RateLimitError when no call slot is available,
+        or the last requests exception when every attempt failed to connect.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(self.retries + 1):
+            # admission first, so rejected calls spend no quota (차단기 통과 후에만 호출 한도 사용)
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"T map API unavailable, retrying after {self.breaker.reset_timeout:g}s")
+            if self.limiter is not None:
+                try:
+                    self.limiter.acquire(kind)
+                except BaseException:
+                    self.breaker.release()   # the admitted call is not sent (호출하지 않으므로 반납)
+                    raise
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                time.sleep(self._delay(attempt))
+                continue
+            except Exception:
+                self.breaker.record_failure()   # also ends a half-open trial (반개방 시험 호출 종료)
+                raise
+
+            # 5xx counts against the breaker, 429 is our quota and not an outage (429는 장애로 보지 않음)
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                return response
+            time.sleep(self._delay(attempt, response))
+            response.close()
+
+    def get(self, url: str, kind: str = "call", **kwargs) -> requests.Response:
+        return self.request("GET", url, kind=kind, **kwargs)
+
+    def post(self, url: str, kind: str = "call", **kwargs) -> requests.Response:
+        return self.request("POST", url, kind=kind, **kwargs)
+
+
+# Shared by every tmapAPI instance: one connection pool and one breaker per process (프로세스당 1개)
+http_client = HttpClient()
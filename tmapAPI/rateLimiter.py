@@ -0,0 +1,190 @@
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+import requests
+
+QUOTA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "tmap_quota.sqlite3")
+KST = timezone(timedelta(hours=9))   # T map daily quotas reset at midnight Korea time (한국 시간 자정 기준)
+BUSY_TIMEOUT = 1.0   # seconds to wait for another process's write lock before queuing again (잠금 대기 시간)
+
+
+class RateLimitError(requests.RequestException):
+    """A call could not get a T map slot: daily quota used up, or queued longer than allowed (호출 한도 초과)"""
+
+
+def _today() -> str:
+    return datetime.now(KST).strftime("%Y-%m-%d")
+
+
+def _busy(error: sqlite3.OperationalError) -> bool:
+    # "database is locked": another process kept the file past the busy timeout (다른 프로세스가 잠금 중)
+    return "locked" in str(error)
+
+
+class RateLimiter:
+    """
+    Token bucket for outbound T map calls, shared by every thread and Streamlit process (T map 호출 토큰 버킷)
+    Calls beyond `rate` per second wait in line for a token instead of failing, so throughput stays at
+    the allowed maximum without 429 storms. The bucket and the per-day call counts live in a small
+    sqlite file updated in one transaction per call; without a writable file they stay in this process.
+    A file locked by another process makes the call queue like a missing token.
+
+    Parameters:
+    rate : float - tokens added per second (초당 허용 호출 수)
+    burst : int - bucket size, calls allowed at once after an idle period (순간 허용 호출 수)
+    daily_quota : int - calls per day, None for TMAP_DAILY_QUOTA or no limit (일일 호출 한도)
+    max_wait : float - seconds a call may queue before RateLimitError (최대 대기 시간)
+    path : str - sqlite file shared across processes, None for this process only (공유 sqlite 파일)
+    """
+
+    def __init__(self, rate: float = 5, burst: int = 5, daily_quota: int = None, max_wait: float = 60,
+                 path: str = QUOTA_PATH):
+        self.rate = rate
+        self.burst = burst
+        self._daily_quota = daily_quota
+        self.max_wait = max_wait
+        self.path = path
+        self._lock = threading.Lock()   # guards the counters, the in-memory bucket and the shared connection
+        self._db = None
+        self._memory = {"tokens": float(burst), "updated": time.time(), "usage": {}}
+        self._waiting = 0
+        self._waited = 0.0
+
+    @property
+    def daily_quota(self):
+        # read when used, so a TMAP_DAILY_QUOTA from .env loaded after import still applies (.env 값도 반영)
+        if self._daily_quota is not None:
+            return self._daily_quota
+        value = os.getenv("TMAP_DAILY_QUOTA")
+        return int(value) if value else None
+
+    def _connection(self):
+        # one connection per limiter, used only while holding self._lock (잠금 하에서만 쓰는 공유 연결)
+        if self._db is None and self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                             check_same_thread=False)
+                connection.execute("CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY, tokens REAL, updated REAL)")
+                connection.execute("CREATE TABLE IF NOT EXISTS usage (day TEXT, kind TEXT, calls INTEGER, "
+                                   "PRIMARY KEY (day, kind))")
+                self._db = connection
+            except (OSError, sqlite3.Error):
+                # read-only deployments limit each process on its own (읽기 전용 환경은 프로세스 단위로 제한)
+                self.path = None
+        return self._db
+
+    def _fall_back(self):
+        # the shared file stopped working: keep limiting this process in memory (메모리 버킷으로 전환)
+        if self._db is not None:
+            self._db.close()
+        self._db, self.path = None, None
+
+    def _take(self, kind: str, now: float) -> float:
+        # one token if available and the day's quota allows it: returns 0, else the seconds to wait
+        # (토큰이 있으면 0, 없으면 다음 토큰까지 대기 시간)
+        day, quota = _today(), self.daily_quota
+        with self._lock:
+            connection = self._connection()
+            if connection is None:
+                state = self._memory
+                used = sum(calls for (d, _), calls in state["usage"].items() if d == day)
+                tokens = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+                state["tokens"], state["updated"] = tokens, now
+                if quota is not None and used >= quota:
+                    raise RateLimitError(f"T map daily quota of {quota} calls used up")
+                if tokens < 1:
+                    return (1 - tokens) / self.rate
+                state["tokens"] -= 1
+                state["usage"][(day, kind)] = state["usage"].get((day, kind), 0) + 1
+                return 0.0
+
+            try:
+                connection.execute("BEGIN IMMEDIATE")   # one writer at a time across processes (프로세스 간 단일 기록)
+            except sqlite3.OperationalError as e:
+                # another process holds the file: queue for the next token slot; any other error switches
+                # to the in-memory bucket (다른 프로세스 사용 중이면 대기, 그 외 오류는 메모리 버킷 사용)
+                if not _busy(e):
+                    self._fall_back()
+                return 1 / self.rate
+            try:
+                row = connection.execute("SELECT tokens, updated FROM bucket WHERE id = 1").fetchone()
+                tokens, updated = row if row else (float(self.burst), now)
+                tokens = min(self.burst, tokens + max(now - updated, 0) * self.rate)
+                used = connection.execute("SELECT COALESCE(SUM(calls), 0) FROM usage WHERE day = ?", (day,)).fetchone()[0]
+                if quota is not None and used >= quota:
+                    raise RateLimitError(f"T map daily quota of {quota} calls used up")
+                wait = 0.0
+                if tokens < 1:
+                    wait = (1 - tokens) / self.rate
+                else:
+                    tokens -= 1
+                    connection.execute("INSERT INTO usage VALUES (?, ?, 1) ON CONFLICT (day, kind) "
+                                       "DO UPDATE SET calls = calls + 1", (day, kind))
+                connection.execute("INSERT OR REPLACE INTO bucket VALUES (1, ?, ?)", (tokens, now))
+                connection.execute("COMMIT")
+                return wait
+            except sqlite3.OperationalError as e:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                if not _busy(e):
+                    self._fall_back()
+                return 1 / self.rate
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+
+    def acquire(self, kind: str = "call"):
+        """
+        Wait for a token, then count one call of `kind` (e.g. "route", "poi") (토큰을 기다린 뒤 호출 1회 기록)
+        Raises RateLimitError when the daily quota is used up or the wait would pass `max_wait`.
+        """
+        started = time.time()
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                now = time.time()
+                wait = self._take(kind, now)
+                if wait <= 0:
+                    return
+                if now + wait - started > self.max_wait:
+                    raise RateLimitError(f"T map call queued for more than {self.max_wait:g}s")
+                time.sleep(wait)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self._waited += time.time() - started
+
+    def usage(self) -> dict:
+        """
+        Current quota meter (현재 사용량)
+
+        Returns:
+        dict - {"day", "calls", "by_kind", "daily_quota", "remaining", "tokens", "rate", "burst",
+                "waiting" (calls queued in this process), "waited" (seconds spent queuing in this process)}
+        """
+        day, now = _today(), time.time()
+        with self._lock:
+            connection = self._connection()
+            if connection is None:
+                by_kind = {kind: calls for (d, kind), calls in self._memory["usage"].items() if d == day}
+                tokens = min(self.burst, self._memory["tokens"] + (now - self._memory["updated"]) * self.rate)
+            else:
+                by_kind = dict(connection.execute("SELECT kind, calls FROM usage WHERE day = ?", (day,)).fetchall())
+                row = connection.execute("SELECT tokens, updated FROM bucket WHERE id = 1").fetchone()
+                tokens = min(self.burst, row[0] + max(now - row[1], 0) * self.rate) if row else float(self.burst)
+            waiting, waited = self._waiting, self._waited
+        calls, quota = sum(by_kind.values()), self.daily_quota
+        return {"day": day, "calls": calls, "by_kind": by_kind, "daily_quota": quota,
+                "remaining": None if quota is None else max(quota - calls, 0),
+                "tokens": round(tokens, 2), "rate": self.rate, "burst": self.burst,
+                "waiting": waiting, "waited": round(waited, 3)}
+
+
+# Shared by every tmapAPI instance; the sqlite file shares it with other Streamlit processes too
+# (모든 tmapAPI 인스턴스가 공유, sqlite 파일로 다른 프로세스와도 공유)
+rate_limiter = RateLimiter()
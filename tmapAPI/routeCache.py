@@ -0,0 +1,49 @@
+import os
+import json
+from data.tieredCache import TieredCache
+
+ROUTE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "routes")
+
+
+class RouteCache:
+    """
+    T map route responses keyed by rounded start/end coordinates and mode (좌표 + 이동수단 기반 경로 캐시)
+    Stored in a TieredCache under .cache/routes/ (memory LRU + one file per route), shared by every
+    session and process. Entries expire after `ttl` seconds; the disk tier keeps the `max_files`
+    most recently used routes and is trimmed every 50 writes.
+
+    Parameters:
+    directory : str - disk tier location (저장 경로)
+    ttl : float - seconds a route stays valid (유효 기간)
+    precision : int - decimals kept from lat/lng, 5 is about 1 m (좌표 반올림 자릿수)
+    max_items : int - routes kept in memory (메모리 보관 개수)
+    max_files : int - routes kept on disk (디스크 보관 개수)
+    """
+
+    def __init__(self, directory: str = ROUTE_DIR, ttl: float = 7 * 24 * 3600, precision: int = 5,
+                 max_items: int = 512, max_files: int = 5000):
+        self.precision = precision
+        # listing the directory every write is wasteful, trim every 50 writes (50회 저장마다 정리)
+        self._store = TieredCache(directory, ".json", ttl=ttl, max_items=max_items, max_files=max_files,
+                                  trim_every=50)
+
+    def key(self, start: dict, end: dict, mode: str) -> str:
+        def point(place):
+            return f"{round(float(place['lat']), self.precision)},{round(float(place['lng']), self.precision)}"
+        return f"{mode}:{point(start)}->{point(end)}"
+
+    def get(self, start: dict, end: dict, mode: str):
+        """Cached route features, or None on a miss / expired entry (캐시 조회)"""
+        return self._store.get(self.key(start, end, mode), lambda meta, payload: json.loads(payload))
+
+    def put(self, start: dict, end: dict, mode: str, features: list):
+        """Store the `features` list of a successful route response (성공한 경로 응답 저장)"""
+        payload = json.dumps(features, ensure_ascii=False).encode("utf-8")
+        self._store.put(self.key(start, end, mode), features, payload)
+
+    def clear(self):
+        self._store.clear()
+
+
+# Shared by every tmapAPI instance in the process (프로세스 전체에서 공유)
+route_cache = RouteCache()
@@ -1,18 +1,44 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 import folium
+from .routeCache import RouteCache, route_cache
+from .httpClient import http_client
+
+MODES = ('car', 'peds')
+_background = None
+
+
+def _background_pool():
+    # small shared pool for prefetches, so they never hold up a page (미리 가져오기용 공용 스레드 풀)
+    global _background
+    if _background is None:
+        _background = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tmap-prefetch')
+    return _background
+
 
 class tmapAPI:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache=route_cache, client=None):
         self.api_key = api_key
         self.headers = {
             'appKey': self.api_key
         }
+        # RouteCache for route responses, None to always call the API (경로 캐시, None이면 항상 API 호출)
+        self.cache = cache
+        # keep-alive session with timeouts, retries and a circuit breaker (타임아웃/재시도/차단기가 있는 공유 세션)
+        self.client = client or http_client
+
+    def usage(self):
+        # today's T map calls by kind, quota left and queued calls (오늘의 T map 호출량/남은 한도/대기 호출)
+        return self.client.limiter.usage() if self.client.limiter is not None else None
 
     def get_coord(self, keyword: str):
         url = f"https://apis.openapi.sk.com/tmap/pois?version=1&searchKeyword=\
             {quote(keyword,encoding='utf-8')}&count=1"
-        response = requests.get(url, headers=self.headers)
+        try:
+            response = self.client.get(url, kind='poi', headers=self.headers)
+        except requests.RequestException as e:
+            return {'error': f"Request failed / {e}"}
         if response.status_code == 200:
             res = response.json()
             if res['searchPoiInfo']:
@@ -29,86 +55,129 @@ class tmapAPI:
             return {'error': f"Request failed{response.status_code} /\
                      {response.text}"}
         
-    def get_route_raw(self, start: dict, end: dict):
-        url_car = "https://apis.openapi.sk.com/tmap/routes?version=1&callback=function"
-        url_peds = "https://apis.openapi.sk.com/tmap/routes/pedestrian?version=1&callback=function"
-
-        payload_car = {
-            'startX': start['lng'],
-            'startY': start['lat'],
-            'endX': end['lng'],
-            'endY': end['lat']
-        }
+    def _request_route(self, mode: str, start: dict, end: dict):
+        if mode == 'car':
+            url = "https://apis.openapi.sk.com/tmap/routes?version=1&callback=function"
+            payload = {
+                'startX': start['lng'],
+                'startY': start['lat'],
+                'endX': end['lng'],
+                'endY': end['lat']
+            }
+        else:
+            url = "https://apis.openapi.sk.com/tmap/routes/pedestrian?version=1&callback=function"
+            payload = {
+                'startX': start['lng'],
+                'startY': start['lat'],
+                'endX': end['lng'],
+                'endY': end['lat'],
+                'startName': quote(start['name'], encoding='utf-8'),
+                'endName': quote(end['name'], encoding='utf-8')
+            }
 
-        payload_peds = {
-            'startX': start['lng'],
-            'startY': start['lat'],
-            'endX': end['lng'],
-            'endY': end['lat'],
-            'startName': quote(start['name'], encoding='utf-8'),
-            'endName': quote(end['name'], encoding='utf-8')
-        }
+        try:
+            response = self.client.post(url, kind=f'route_{mode}', headers=self.headers, json=payload)
+        except requests.RequestException as e:
+            return {'error': f"Request failed / {e}"}
+        if response.status_code == 200:
+            res = response.json()
+            if res['features']:
+                return res['features']
+            else:
+                return {'error': 'No results found'}
+        else:
+            return {'error': f"Request failed{response.status_code} /\
+                     {response.text}"}
 
-        headers = {
-            'appKey': self.api_key
-        }
+    def _route(self, mode: str, start: dict, end: dict):
+        # same endpoints (rounded) and mode: no API call (같은 좌표/이동수단이면 API 호출 생략)
+        if self.cache is not None:
+            features = self.cache.get(start, end, mode)
+            if features is not None:
+                return features
+        features = self._request_route(mode, start, end)
+        # errors are not cached so the next click retries (오류 응답은 저장하지 않음)
+        if self.cache is not None and isinstance(features, list):
+            self.cache.put(start, end, mode, features)
+        return features
 
-        response_car = requests.post(url_car, headers=headers, json=payload_car)
-        response_peds = requests.post(url_peds, headers=headers, json=payload_peds)
+    def _prefetch(self, tasks: list):
+        # other modes fetched in the background straight into the cache (다른 이동수단은 백그라운드에서 캐시에 저장)
+        if self.cache is None:
+            return
+        for mode, start, end in tasks:
+            if self.cache.get(start, end, mode) is None:
+                _background_pool().submit(self._route, mode, start, end)
 
-        routes = {
-            'car': None,
-            'peds': None,
-            'startName': start['name'],
-            'endName': end['name']
-        }
+    def get_route_raw(self, start: dict, end: dict, modes=MODES, prefetch: bool = False):
+        """
+        Parameters:
+        start, end : dict - places with 'name', 'lat', 'lng' (출발지, 도착지)
+        modes : tuple - modes to request, 'car' and/or 'peds' (요청할 이동수단)
+        prefetch : bool - also fetch the other modes in the background into the cache (나머지 이동수단 미리 캐시)
 
-        if response_car.status_code == 200:
-            res = response_car.json()
-            if res['features']:
-                routes['car'] = res['features']
-            else:
-                routes['car'] = {'error': 'No results found'}
-        else:
-            routes['car'] = {'error': f"Request failed{response_car.status_code} /\
-                     {response_car.text}"}
-            
-        if response_peds.status_code == 200:
-            res = response_peds.json()
-            if res['features']:
-                routes['peds'] = res['features']
-            else:
-                routes['peds'] = {'error': 'No results found'}
-        else:
-            routes['peds'] = {'error': f"Request failed{response_peds.status_code} /\
-                     {response_peds.text}"}
+        Returns:
+        dict - {mode: features or {'error': ...} for each requested mode, 'startName', 'endName'}
+        """
+        return self.get_routes_raw([(start, end)], modes=modes, prefetch=prefetch, max_workers=2)[0]
+
+    def get_routes_raw(self, segments: list, modes=MODES, prefetch: bool = False, max_workers: int = 6):
+        """
+        get_route_raw for every (start, end) segment of a course, with the requests of all
+        segments sent concurrently (코스 전체 구간의 경로를 동시에 요청)
+
+        Parameters:
+        segments : list - [(start, end), ...] place dicts with 'name', 'lat', 'lng' (구간 목록)
+        modes : tuple - modes to request, 'car' and/or 'peds' (요청할 이동수단)
+        prefetch : bool - also fetch the other modes in the background into the cache (나머지 이동수단 미리 캐시)
+        max_workers : int - requests in flight at once (동시 요청 수 제한)
+
+        Returns:
+        list - get_route_raw results in the order of `segments` (구간 순서대로 정렬된 결과)
+        """
+        modes = (modes,) if isinstance(modes, str) else tuple(modes)
+        unknown = [mode for mode in modes if mode not in MODES]
+        if unknown:
+            raise ValueError(f"unknown mode(s) {unknown}, expected {MODES}")
+
+        tasks = [(mode, start, end) for start, end in segments for mode in modes]
+        if not tasks:
+            return [{'startName': start['name'], 'endName': end['name']} for start, end in segments]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))),
+                                thread_name_prefix='tmap-route') as pool:
+            # map keeps the task order whatever order the responses arrive in (응답 순서와 무관하게 순서 유지)
+            results = iter(pool.map(lambda task: self._route(*task), tasks))
+        routes = []
+        for start, end in segments:
+            route = {mode: next(results) for mode in modes}
+            route['startName'] = start['name']
+            route['endName'] = end['name']
+            routes.append(route)
+
+        if prefetch:
+            self._prefetch([(mode, start, end) for start, end in segments for mode in MODES if mode not in modes])
         return routes
-    
-    def get_route(self, routes: dict):
-        route = {'car': {}, 'peds': {},
-                 'startName': routes['startName'],
-                 'endName': routes['endName']}
-        route['car']['distance'] = round(routes['car'][0]\
-            ['properties']['totalDistance'] / 1000,1)
-        route['car']['time'] = round(routes['car'][0]\
-            ['properties']['totalTime'] / 60)
-        route['car']['startPoint'] = routes['car'][0]['geometry']['coordinates']
-        route['car']['endPoint'] = routes['car'][-1]['geometry']['coordinates']
-        route['car']['path'] = []
-        for point in routes['car']:
-            if point['geometry']['type'] == 'LineString':
-                route['car']['path'] += point['geometry']['coordinates']
 
-        route['peds']['distance'] = round(routes['peds'][0]\
+    @staticmethod
+    def _parse_route(features: list):
+        route = {}
+        route['distance'] = round(features[0]\
             ['properties']['totalDistance'] / 1000,1)
-        route['peds']['time'] = round(routes['peds'][0]\
+        route['time'] = round(features[0]\
             ['properties']['totalTime'] / 60)
-        route['peds']['startPoint'] = routes['peds'][0]['geometry']['coordinates']
-        route['peds']['endPoint'] = routes['peds'][-1]['geometry']['coordinates']
-        route['peds']['path'] = []
-        for point in routes['peds']:
+        route['startPoint'] = features[0]['geometry']['coordinates']
+        route['endPoint'] = features[-1]['geometry']['coordinates']
+        route['path'] = []
+        for point in features:
             if point['geometry']['type'] == 'LineString':
-                route['peds']['path'] += point['geometry']['coordinates']
+                route['path'] += point['geometry']['coordinates']
+        return route
+
+    def get_route(self, routes: dict):
+        # only the modes present in `routes` are parsed (요청한 이동수단만 파싱)
+        route = {mode: self._parse_route(routes[mode]) for mode in MODES if mode in routes}
+        route['startName'] = routes['startName']
+        route['endName'] = routes['endName']
         return route
     
     def draw_route(self, routes: dict, mode: str):
@@ -0,0 +1,154 @@
+# Cache warm-up before deployment (배포 전 캐시 미리 채우기)
+#   python warmup.py              -> every CSV artifact, the dwell-time store, the shipsDuration CSVs and every page
+#   python warmup.py --workers 4 --pages "(4)" "(8)"
+# Each task runs in its own worker process; only the disk tiers survive the run
+# (useData/parquet, .cache/dwell_stats.json, graph/), which is what a fresh server process reads first.
+import os
+import sys
+import glob
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGE_TIMEOUT = 300
+
+
+def _in_root():
+    os.chdir(ROOT_DIR)
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+
+
+def build_artifact(csv_path, read_kwargs, force=False):
+    # typed parquet artifact for one CSV, rebuilt only when stale unless forced (CSV 1개 parquet 변환)
+    _in_root()
+    from data.build import build_artifact as build, load_frame, artifact_path
+    from data.files import file_hash
+    frame = (build if force else load_frame)(csv_path, read_kwargs, file_hash(csv_path))
+    return f"{len(frame)} rows -> {os.path.relpath(artifact_path(csv_path), ROOT_DIR)}"
+
+
+def _schedule_table():
+    from data import load_dataset
+    from analyzer.dwellTime import add_duration_columns
+    return add_duration_columns(load_dataset("sinhangSchedule_raw").iloc[:, 1:])
+
+
+def sync_dwell_store():
+    # per-company / year-month dwell aggregates used by page 7, synced when the schedule CSV changed
+    # (체류시간 집계 저장소, 스케줄 CSV가 바뀐 경우에만 동기화)
+    _in_root()
+    from data import dataset_hash
+    from analyzer.dwellStore import shared_store
+    store = shared_store("sinhangSchedule_raw", _schedule_table, version=dataset_hash("sinhangSchedule_raw"))
+    return f"{len(store.buckets)} buckets"
+
+
+def export_ships_duration():
+    # schedule without the stay outliers, i.e. the population of page 7's "Remove outliers" chart
+    # (이상치 제거 체류기간 CSV, 7페이지와 같은 기준)
+    _in_root()
+    from analyzer.dwellTime import STAY_COL, STAY_OUTLIER_HOURS
+    schedule = _schedule_table()
+    schedule = schedule[schedule[STAY_COL] <= STAY_OUTLIER_HOURS]
+    path = os.path.join("useData", "finishPrepro", "shipsDuration.csv")
+    schedule[["Ship Company", "Enter Time", "Out Time", "Duration days", "Duration hours",
+              "Total duration(Hours)", STAY_COL]].to_csv(path)
+    return f"{len(schedule)} rows -> {path}"
+
+
+def export_ships_duration_10():
+    # stays of the 10 longest-staying companies (AEW called once) used by page 8, same cut as page 7
+    # (장기체류 상위 10개 선사 체류시간 CSV, 7페이지와 같은 이상치 기준)
+    _in_root()
+    from analyzer.dwellTime import COMPANY_COL, STAY_COL, STAY_OUTLIER_HOURS, top_companies
+    schedule = _schedule_table()
+    top10 = top_companies(schedule, 10, exclude=("AEW",))
+    schedule = schedule[schedule[COMPANY_COL].isin(top10) & (schedule[STAY_COL] <= STAY_OUTLIER_HOURS)]
+    path = os.path.join("useData", "shipsDuration_10.csv")
+    schedule[[COMPANY_COL, "Enter Time", "Out Time", STAY_COL]].reset_index(drop=True).to_csv(path)
+    return f"{len(schedule)} rows -> {path}"
+
+
+def render_page(page):
+    # run the page script headless so every figure / aggregate it builds lands in the disk caches
+    # (페이지를 화면 없이 실행해 그래프/집계 캐시 생성)
+    _in_root()
+    from streamlit.testing.v1 import AppTest
+    app = AppTest.from_file(page, default_timeout=PAGE_TIMEOUT)
+    app.run()
+    if app.exception:
+        raise RuntimeError("; ".join(e.message for e in app.exception))
+    return f"{len(app.get('plotly_chart'))} plotly charts"
+
+
+def _artifact_tasks(force):
+    _in_root()
+    from data.build import iter_sources
+    return [(build_artifact, (path, kwargs, force), os.path.relpath(path, ROOT_DIR))
+            for path, kwargs in iter_sources()]
+
+
+def _page_tasks(selected):
+    pages = sorted(glob.glob(os.path.join("pages", "*.py")))
+    if selected:
+        pages = [p for p in pages if any(s in os.path.basename(p) for s in selected)]
+    return [(render_page, (page,), page) for page in pages]
+
+
+def _timed(fn, args):
+    # runs in the worker, so the time excludes waiting in the queue (대기 시간 제외한 실행 시간)
+    started = time.perf_counter()
+    return fn(*args), time.perf_counter() - started
+
+
+def _run(executor, tasks):
+    failed = 0
+    futures = {executor.submit(_timed, fn, args): name for fn, args, name in tasks}
+    for future in as_completed(futures):
+        name = futures[future]
+        try:
+            result, elapsed = future.result()
+            print(f"[ok]   {name}: {result} ({elapsed:.1f}s)", flush=True)
+        except Exception:
+            failed += 1
+            print(f"[fail] {name}\n{traceback.format_exc()}", flush=True)
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prebuild data artifacts, aggregates and page figures")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: CPU count)")
+    parser.add_argument("--pages", nargs="*", default=None, help="only pages whose file name contains one of these")
+    parser.add_argument("--skip-pages", action="store_true", help="build data artifacts and aggregates only")
+    parser.add_argument("--force", action="store_true", help="rebuild data artifacts even if up to date")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    _in_root()
+    # 1) parquet artifacts first: every later task reads them (이후 작업이 모두 사용하므로 먼저 생성)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        failed = _run(executor, _artifact_tasks(args.force))
+
+    # 2) the dwell store on its own: page 7 syncs and saves the same .cache/dwell_stats.json when it is stale,
+    #    so it has to be current before any page runs (7페이지도 같은 파일을 저장하므로 페이지 실행 전에 동기화)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        failed += _run(executor, [(sync_dwell_store, (), "dwell stats store")])
+
+    # 3) CSV exports and pages in parallel (CSV 내보내기와 페이지 렌더링 병렬 실행)
+    # a page run replaces the worker's __main__ module, so every task gets a fresh process
+    # (페이지 실행이 __main__을 바꾸므로 작업마다 새 프로세스 사용)
+    tasks = [(export_ships_duration, (), "shipsDuration.csv"), (export_ships_duration_10, (), "shipsDuration_10.csv")]
+    if not args.skip_pages:
+        tasks += _page_tasks(args.pages)
+    with ProcessPoolExecutor(max_workers=args.workers, max_tasks_per_child=1) as executor:
+        failed += _run(executor, tasks)
+
+    print(f"warm-up finished in {time.perf_counter() - started:.1f}s, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())